@@ -0,0 +1,707 @@
+#!/usr/bin/env python3
+"""
+Benchmark Script for Bangladesh Youth Employment Simulation Framework
+
+This script times the performance-critical stages of the simulation engine
+against their reference implementations.
+
+Usage: python benchmark_simulation.py
+"""
+
+import sys
+import time
+from datetime import datetime
+
+try:
+    from simulation_framework import SimulationEngine, run_simulation_batch, run_branches, run_replications
+    import numpy as np
+except ImportError as e:
+    print(f"Error importing required modules: {e}")
+    print("Please install required dependencies with: pip install -r requirements.txt")
+    sys.exit(1)
+
+def benchmark_job_matching():
+    """Compare vectorized match scoring against the per-pair Python loop"""
+    print("Benchmarking job match scoring...")
+
+    config = {
+        'simulation_months': 1,
+        'num_youth_agents': 2000,
+        'num_employer_agents': 200,
+        'monthly_training_capacity': 100,
+        'scenario': 'benchmark'
+    }
+
+    sim = SimulationEngine(config)
+    youth_list = [y for y in sim.youth_agents if y.employment_status in ['unemployed_seeking', 'underemployed']]
+    job_list = sim.generate_monthly_jobs()
+
+    # Reference: one calculate_match_score call per youth-job pair
+    start = time.time()
+    reference = [[sim.calculate_match_score(youth, job) for job in job_list] for youth in youth_list]
+    loop_time = time.time() - start
+
+    # Vectorized: whole blocks of youth scored against all jobs at once
+    start = time.time()
+    vectorized = sim.calculate_match_scores(youth_list, job_list)
+    vector_time = time.time() - start
+
+    max_error = np.abs(vectorized - np.array(reference)).max()
+
+    print(f"  - Pairs scored: {len(youth_list) * len(job_list):,} ({len(youth_list):,} youth x {len(job_list):,} jobs)")
+    print(f"  - Python loop: {loop_time:.2f} seconds")
+    print(f"  - Vectorized: {vector_time:.3f} seconds")
+    print(f"  - Speedup: {loop_time / max(vector_time, 1e-9):.0f}x")
+    print(f"  - Max score difference: {max_error:.2e}")
+
+    return True
+
+def benchmark_matching_modes():
+    """Compare exact greedy matching against indexed and top-k pruned matching"""
+    print("Benchmarking matching modes...")
+
+    config = {
+        'simulation_months': 1,
+        'num_youth_agents': 20000,
+        'num_employer_agents': 2000,
+        'monthly_training_capacity': 100,
+        'matching_top_k': 10,
+        'scenario': 'benchmark'
+    }
+
+    sim = SimulationEngine(config)
+    youth_list = [y for y in sim.youth_agents if y.employment_status in ['unemployed_seeking', 'underemployed']]
+    job_list = sim.generate_monthly_jobs()
+    accept_all = lambda y, j, score: True
+
+    for mode in ['exact', 'indexed', 'top_k']:
+        start = time.time()
+        matches = sim._assign_jobs(youth_list, job_list, accept_all, mode)
+        print(f"  - {mode}: {len(matches):,} matches in {time.time() - start:.2f} seconds")
+
+    sim.config['matching_mode'] = 'top_k'
+    gap = sim.compare_matching_modes(youth_list, job_list)
+    print(f"  - Pairs: {len(youth_list):,} youth x {len(job_list):,} jobs")
+    print(f"  - Top-k score gap vs exact: {gap['score_gap_pct']:.2f}% ({gap['shared_pairs_pct']:.1f}% identical pairs)")
+
+    return True
+
+def benchmark_population_generation():
+    """Time batched youth population generation"""
+    print("Benchmarking population generation...")
+
+    for num_agents in [100_000, 1_000_000]:
+        start = time.time()
+        sim = SimulationEngine({'num_youth_agents': num_agents, 'num_employer_agents': 10})
+        setup_time = time.time() - start
+        print(f"  - {num_agents:,} agents: {setup_time:.2f} seconds "
+              f"({sim.population.memory_usage() / 1e6:.0f} MB columnar storage)")
+
+    return True
+
+def benchmark_job_generation():
+    """Time batched monthly job generation"""
+    print("Benchmarking monthly job generation...")
+
+    sim = SimulationEngine({'num_youth_agents': 10, 'num_employer_agents': 100_000})
+
+    start = time.time()
+    jobs = sim.generate_monthly_jobs()
+    print(f"  - {len(jobs):,} jobs from {len(sim.employers):,} employers in {time.time() - start:.3f} seconds")
+
+    return True
+
+def benchmark_batch_runner():
+    """Compare the process-pool batch runner against running configs one by one"""
+    print("Benchmarking parallel batch runner...")
+
+    configs = {
+        f'run_{i}': {
+            'simulation_months': 12,
+            'num_youth_agents': 2000,
+            'num_employer_agents': 200,
+            'monthly_training_capacity': 100,
+            'scenario': 'benchmark'
+        }
+        for i in range(8)
+    }
+
+    start = time.time()
+    runs = list(run_simulation_batch(configs, max_workers=0))
+    sequential_time = time.time() - start
+    slowest_run = max(run.elapsed for run in runs)
+
+    start = time.time()
+    runs = list(run_simulation_batch(configs))
+    parallel_time = time.time() - start
+
+    print(f"  - {len(configs)} runs sequential: {sequential_time:.2f} seconds")
+    print(f"  - {len(configs)} runs parallel: {parallel_time:.2f} seconds (slowest single run {slowest_run:.2f} seconds)")
+    print(f"  - Successful runs: {sum(run.ok for run in runs)}/{len(runs)}")
+
+    return True
+
+def benchmark_replications():
+    """Time Monte Carlo replications of one config and report interval widths"""
+    print("Benchmarking Monte Carlo replications...")
+
+    config = {
+        'simulation_months': 6,
+        'num_youth_agents': 1000,
+        'num_employer_agents': 100,
+        'monthly_training_capacity': 50,
+        'scenario': 'benchmark'
+    }
+
+    for n_replications in [10, 40]:
+        start = time.time()
+        summary = run_replications(config, n_replications=n_replications)
+        rate = summary['metrics']['final_employment_rate']
+        print(f"  - {n_replications} replications: {time.time() - start:.2f} seconds, "
+              f"final employment rate {rate['mean']:.2f}% +/- {(rate['ci_high'] - rate['ci_low']) / 2:.2f}")
+
+    return True
+
+def benchmark_monthly_metrics():
+    """Compare incremental monthly metrics against recounting the population"""
+    print("Benchmarking monthly metrics...")
+
+    sim = SimulationEngine({'num_youth_agents': 1_000_000, 'num_employer_agents': 10})
+    repeats = 20
+
+    for label, incremental in [('Full recount', False), ('Incremental', True)]:
+        sim.config['incremental_metrics'] = incremental
+        start = time.time()
+        for _ in range(repeats):
+            sim.calculate_monthly_metrics()
+        print(f"  - {label}: {(time.time() - start) / repeats * 1000:.3f} ms per month "
+              f"({len(sim.population):,} agents)")
+
+    return True
+
+def benchmark_training_stage():
+    """Compare the vectorized training stage against the per-agent methods"""
+    print("Benchmarking training stage...")
+
+    config = {
+        'num_youth_agents': 200_000,
+        'num_employer_agents': 10,
+        'monthly_training_capacity': 20_000,
+        'seed': 42
+    }
+
+    sim = SimulationEngine(config)
+    start = time.time()
+    for month in range(6):
+        sim.current_month = month
+        sim.process_training_programs()
+    vector_time = time.time() - start
+
+    sim = SimulationEngine(config)
+    start = time.time()
+    for month in range(6):
+        sim.current_month = month
+        population = sim.population
+        eligible = population.select(np.flatnonzero(
+            ~population.program_participation &
+            population.status_mask('unemployed_seeking', 'underemployed') &
+            (population.motivation_level > 0.5)
+        ))
+        for youth in sim.select_training_participants(eligible, config['monthly_training_capacity']):
+            youth.program_participation = True
+            youth.months_in_program = 1
+        for youth in population.select(np.flatnonzero(population.program_participation)):
+            youth.months_in_program += 1
+            sim.update_training_progress(youth)
+    loop_time = time.time() - start
+
+    print(f"  - 6 months, {len(sim.population):,} agents, capacity {config['monthly_training_capacity']:,}")
+    print(f"  - Per-agent: {loop_time:.2f} seconds")
+    print(f"  - Vectorized: {vector_time:.2f} seconds ({loop_time / max(vector_time, 1e-9):.0f}x)")
+
+    return True
+
+def benchmark_agent_state_update():
+    """Compare the fused agent state update (compiled and NumPy) against the per-agent loop"""
+    print("Benchmarking agent state update...")
+
+    import simulation_framework
+
+    config = {'num_youth_agents': 200_000, 'num_employer_agents': 10, 'seed': 42}
+    sim = SimulationEngine(config)
+    population = sim.population
+    population.job_ai_collaboration[:] = np.random.default_rng(0).random(len(population)) < 0.3
+
+    timings = {}
+    for name, compiled in [('Compiled', True), ('NumPy', False)]:
+        if compiled and not simulation_framework.HAVE_NUMBA:
+            continue
+        have_numba = simulation_framework.HAVE_NUMBA
+        simulation_framework.HAVE_NUMBA = compiled
+        try:
+            sim.update_agent_states()  # warm-up (JIT compilation)
+            start = time.time()
+            for _ in range(6):
+                sim.update_agent_states()
+            timings[name] = (time.time() - start) / 6
+        finally:
+            simulation_framework.HAVE_NUMBA = have_numba
+
+    start = time.time()
+    for youth in population:
+        youth.financial_resources += youth.monthly_income - youth.debt_burden * 0.1
+        for skill in youth.traditional_skills:
+            youth.traditional_skills[skill] *= 0.999
+        if youth.employment_status in ['employed_formal', 'employed_informal']:
+            if youth.job_ai_collaboration:
+                old_skills = sim._skill_row(youth)
+                for skill in youth.ai_enhanced_skills:
+                    youth.ai_enhanced_skills[skill] = min(youth.ai_enhanced_skills[skill] + 0.01, 1.0)
+                sim.totals.skills_changed(old_skills, sim._skill_row(youth))
+            youth.motivation_level = min(youth.motivation_level + 0.02, 1.0)
+        elif youth.employment_status == 'unemployed_seeking':
+            youth.motivation_level = max(youth.motivation_level - 0.01, 0.1)
+    loop_time = time.time() - start
+
+    print(f"  - One month, {len(population):,} agents")
+    print(f"  - Per-agent: {loop_time:.2f} seconds")
+    for name, seconds in timings.items():
+        print(f"  - {name}: {seconds * 1000:.1f} ms ({loop_time / max(seconds, 1e-9):.0f}x)")
+
+    return True
+
+def benchmark_event_log():
+    """Time a simulation and report event log size with and without history limits"""
+    print("Benchmarking event log histories...")
+
+    for limit in [None, 3]:
+        config = {
+            'simulation_months': 12,
+            'num_youth_agents': 20_000,
+            'num_employer_agents': 200,
+            'monthly_training_capacity': 2000,
+            'matching_mode': 'top_k',
+            'history_limit': limit,
+            'seed': 42
+        }
+        sim = SimulationEngine(config)
+        start = time.time()
+        sim.run_simulation()
+        events = sum(len(log) for log in sim.population.events.values())
+        history_bytes = sum(log.memory_usage() for log in sim.population.events.values())
+        print(f"  - Limit {limit}: {time.time() - start:.2f} seconds, {events:,} events stored "
+              f"in {history_bytes / 1e6:.1f} MB")
+
+    return True
+
+def benchmark_compiled_kernels():
+    """Compare the numba kernels against the NumPy and per-pair Python code"""
+    print("Benchmarking compiled kernels...")
+
+    from kernels import HAVE_NUMBA
+    from matching import HiringCheck, match_score_block, match_score_block_numpy, collect_candidates, _greedy_pass
+    if not HAVE_NUMBA:
+        print("  - numba is not installed, skipping")
+        return True
+
+    config = {
+        'simulation_months': 1,
+        'num_youth_agents': 20000,
+        'num_employer_agents': 2000,
+        'monthly_training_capacity': 100,
+        'seed': 42
+    }
+
+    sim = SimulationEngine(config)
+    youth_list = sim.population.select(np.flatnonzero(sim.population.status_mask('unemployed_seeking', 'underemployed')))
+    job_list = sim.generate_monthly_jobs()
+    youth_arrays = sim._youth_match_arrays(youth_list)
+    job_arrays = sim._job_match_arrays(job_list)
+    rows = slice(0, min(len(youth_list), 2000))
+
+    # First call compiles (or loads the on-disk cache), later calls reuse the machine code
+    start = time.time()
+    match_score_block(youth_arrays, job_arrays, slice(0, 1))
+    print(f"  - First kernel call (JIT or cache load): {time.time() - start:.2f} seconds")
+
+    start = time.time()
+    numpy_scores = match_score_block_numpy(youth_arrays, job_arrays, rows)
+    numpy_time = time.time() - start
+    start = time.time()
+    kernel_scores = match_score_block(youth_arrays, job_arrays, rows)
+    kernel_time = time.time() - start
+    print(f"  - Match scores, {kernel_scores.size:,} pairs: NumPy {numpy_time:.2f}s, numba {kernel_time:.2f}s "
+          f"({numpy_time / max(kernel_time, 1e-9):.1f}x, identical: {np.array_equal(numpy_scores, kernel_scores)})")
+
+    # Greedy pass: compiled scan with pre-drawn hiring draws vs one Python call per visited pair
+    youth_index, job_index, scores = collect_candidates(youth_arrays, job_arrays)
+    order = np.argsort(-scores, kind='stable')
+    job_shortage = sim._job_skill_shortage(job_list)
+    timings = {}
+    for label, accept in [('Python', lambda check: lambda y, j, score: check(y, j, score)),
+                          ('numba', lambda check: check)]:
+        check = HiringCheck(job_shortage=job_shortage, rng=np.random.default_rng(0))
+        youth_taken = np.zeros(len(youth_list), dtype=bool)
+        job_taken = np.zeros(len(job_list), dtype=bool)
+        start = time.time()
+        _greedy_pass(youth_index, job_index, scores, order, youth_taken, job_taken, accept(check))
+        timings[label] = time.time() - start
+    print(f"  - Greedy pass over {len(scores):,} candidates: Python {timings['Python']:.2f}s, "
+          f"numba {timings['numba']:.2f}s ({timings['Python'] / max(timings['numba'], 1e-9):.1f}x)")
+
+    # Salaries for every youth against one job each
+    matches = [(youth_list[i], job_list[i % len(job_list)]) for i in range(len(youth_list))]
+    start = time.time()
+    [sim.calculate_job_salary(youth, job) for youth, job in matches]
+    loop_time = time.time() - start
+    start = time.time()
+    sim.calculate_job_salaries(matches)
+    kernel_time = time.time() - start
+    print(f"  - Salaries for {len(matches):,} matches: per-pair {loop_time:.2f}s, batched {kernel_time:.3f}s")
+
+    return True
+
+def benchmark_import_time(budget: float = 0.4):
+    """Time a cold import of the engine in a fresh interpreter against a latency budget"""
+    print("Benchmarking engine import time...")
+
+    import os
+    import subprocess
+
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import simulation_framework\n"
+        "print(time.perf_counter() - start)\n"
+        "print(' '.join(m for m in ('pandas', 'seaborn', 'matplotlib', 'pyarrow', 'numba') if m in sys.modules))\n"
+    )
+    here = os.path.dirname(os.path.abspath(__file__))
+    timings = []
+    for _ in range(5):
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True,
+                                env={**os.environ, 'PYTHONPATH': here}).stdout.split('\n')
+        timings.append(float(output[0]))
+
+    print(f"  - Cold import: best {min(timings):.2f}s, median {sorted(timings)[2]:.2f}s (budget {budget:.1f}s)")
+    print(f"  - Heavy modules loaded at import: {output[1] or 'none'}")
+
+    return min(timings) <= budget and not output[1]
+
+def benchmark_results_storage(n_runs: int = 200):
+    """Compare indented JSON dumps with columnar results on disk size and metric read time"""
+    print("Benchmarking results storage...")
+
+    import io
+    import json
+    import os
+    import tempfile
+    import contextlib
+    from results_store import DEFAULT_FORMAT, load_metric, save_results
+
+    sim = SimulationEngine({'simulation_months': 36, 'num_youth_agents': 5000, 'num_employer_agents': 500,
+                            'seed': 42})
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = sim.run_simulation()
+
+    def directory_size(path):
+        return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(path) for name in files)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        json_root = os.path.join(workdir, 'json')
+        os.makedirs(json_root)
+        start = time.time()
+        for i in range(n_runs):
+            with open(os.path.join(json_root, f'run_{i:04d}.json'), 'w') as f:
+                json.dump(results, f, indent=2, default=str)
+        json_write = time.time() - start
+
+        start = time.time()
+        for i in range(n_runs):
+            save_results(results, os.path.join(workdir, 'columnar', f'run_{i:04d}'))
+        columnar_write = time.time() - start
+
+        start = time.time()
+        for name in sorted(os.listdir(json_root)):
+            with open(os.path.join(json_root, name)) as f:
+                [m['employment_rate'] for m in json.load(f)['monthly_metrics']]
+        json_read = time.time() - start
+
+        start = time.time()
+        load_metric(os.path.join(workdir, 'columnar'), 'employment_rate')
+        columnar_read = time.time() - start
+
+        print(f"  - JSON: {directory_size(json_root) / n_runs / 1e3:.1f} KB per run, "
+              f"write {json_write:.2f}s, one metric from {n_runs} runs {json_read:.2f}s")
+        print(f"  - {DEFAULT_FORMAT}: {directory_size(os.path.join(workdir, 'columnar')) / n_runs / 1e3:.1f} KB per run, "
+              f"write {columnar_write:.2f}s, one metric from {n_runs} runs {columnar_read:.2f}s")
+
+    # Per-agent end states are only stored in the columnar layout
+    with tempfile.TemporaryDirectory() as workdir:
+        start = time.time()
+        path = sim.save_results(results, os.path.join(workdir, 'run'))
+        print(f"  - With {len(sim.population):,} agent end states: {directory_size(path) / 1e3:.1f} KB, "
+              f"saved in {time.time() - start:.2f}s")
+
+    return True
+
+def benchmark_checkpoint(num_youth: int = 100_000):
+    """Time saving a checkpoint and resuming from it, eagerly and memory-mapped"""
+    print("Benchmarking checkpoint round trip...")
+
+    import io
+    import os
+    import tempfile
+    import contextlib
+
+    config = {
+        'simulation_months': 4,
+        'num_youth_agents': num_youth,
+        'num_employer_agents': 100,
+        'monthly_training_capacity': 2000,
+        'matching_mode': 'top_k',
+        'seed': 42
+    }
+    sim = SimulationEngine(config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for month in range(3):
+            sim.run_month(month)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, 'checkpoint')
+        start = time.time()
+        sim.save_checkpoint(path)
+        save_time = time.time() - start
+        size = sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+        print(f"  - Save: {save_time:.2f} seconds, {size / 1e6:.1f} MB for {num_youth:,} youth")
+
+        for mmap in (False, True):
+            start = time.time()
+            resumed = SimulationEngine.from_checkpoint(path, mmap=mmap)
+            load_time = time.time() - start
+            start = time.time()
+            with contextlib.redirect_stdout(io.StringIO()):
+                resumed.run_month(3)
+            print(f"  - Resume ({'memory-mapped' if mmap else 'eager'}): load {load_time:.3f} seconds, "
+                  f"first month {time.time() - start:.2f} seconds")
+            del resumed
+
+    return True
+
+def benchmark_scenario_branching():
+    """Compare branching interventions off a shared warm-up against full runs per intervention"""
+    print("Benchmarking scenario branching...")
+
+    base_config = {
+        'simulation_months': 24,
+        'num_youth_agents': 5000,
+        'num_employer_agents': 500,
+        'monthly_training_capacity': 250,
+        'seed': 42,
+        'scenario': 'benchmark'
+    }
+    interventions = {
+        'increased_capacity': {'monthly_training_capacity': 500},
+        'top_k_matching': {'matching_mode': 'top_k'},
+        'indexed_matching': {'matching_mode': 'indexed'},
+        'baseline': {}
+    }
+
+    start = time.time()
+    full_runs = list(run_simulation_batch({name: {**base_config, **overrides}
+                                           for name, overrides in interventions.items()}, max_workers=0))
+    full_time = time.time() - start
+
+    print(f"  - {len(interventions)} full runs of {base_config['simulation_months']} months: {full_time:.2f} seconds")
+    for branch_month in [0, 12, 18]:
+        start = time.time()
+        branches = list(run_branches(base_config, interventions, branch_month=branch_month, max_workers=0))
+        print(f"  - Branched at month {branch_month}: {time.time() - start:.2f} seconds "
+              f"({sum(run.ok for run in branches)}/{len(branches)} branches ok)")
+
+    return all(run.ok for run in full_runs)
+
+def benchmark_hiring_draws(n_checks: int = 500_000):
+    """Compare block-drawn hiring checks against drawing two scalars per pair"""
+    print("Benchmarking hiring draws...")
+
+    from matching import HiringCheck
+    from kernels import COMPETITION_LOW, COMPETITION_HIGH, hiring_probability
+
+    rng = np.random.default_rng(0)
+    shortage = rng.random(1000)
+    jobs = rng.integers(0, 1000, n_checks).tolist()
+    scores = rng.random(n_checks).tolist()
+
+    scalar_rng = np.random.default_rng(1)
+    start = time.time()
+    for j, score in zip(jobs, scores):
+        competition_factor = scalar_rng.uniform(COMPETITION_LOW, COMPETITION_HIGH)
+        scalar_rng.random() < hiring_probability(score, shortage[j], competition_factor)
+    scalar_time = time.time() - start
+
+    print(f"  - {n_checks:,} checks, scalar draws: {scalar_time:.2f} seconds")
+    for block_size in [64, 4096]:
+        check = HiringCheck(job_shortage=shortage, rng=np.random.default_rng(1), block_size=block_size)
+        start = time.time()
+        for j, score in zip(jobs, scores):
+            check(0, j, score)
+        check.settle()
+        block_time = time.time() - start
+        print(f"  - Block of {block_size:,}: {block_time:.2f} seconds ({scalar_time / max(block_time, 1e-9):.1f}x)")
+
+    return True
+
+def benchmark_sharded_matching():
+    """Time region-sharded matching for several worker counts against single-pass greedy"""
+    print("Benchmarking sharded matching...")
+
+    import os
+    from matching import HiringCheck
+
+    config = {
+        'simulation_months': 1,
+        'num_youth_agents': 20000,
+        'num_employer_agents': 2000,
+        'monthly_training_capacity': 100,
+        'seed': 42
+    }
+
+    sim = SimulationEngine(config)
+    youth_list = sim.population.select(np.flatnonzero(sim.population.status_mask('unemployed_seeking', 'underemployed')))
+    job_list = sim.generate_monthly_jobs()
+    shortage = sim._job_skill_shortage(job_list)
+
+    def timed(mode):
+        check = HiringCheck(job_shortage=shortage, rng=np.random.default_rng(1))
+        start = time.time()
+        matches = sim._assign_jobs(youth_list, job_list, check, mode)
+        return matches, time.time() - start
+
+    exact, exact_time = timed('exact')
+    print(f"  - Pairs: {len(youth_list):,} youth x {len(job_list):,} jobs, {os.cpu_count()} cores")
+    print(f"  - Single-pass greedy: {len(exact):,} matches in {exact_time:.2f} seconds")
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        sim.config['matching_workers'] = workers
+        matches, sharded_time = timed('sharded')
+        print(f"  - Sharded, {workers} workers: {len(matches):,} matches in {sharded_time:.2f} seconds "
+              f"({exact_time / max(sharded_time, 1e-9):.1f}x)")
+
+    sim.config['matching_mode'] = 'sharded'
+    gap = sim.compare_matching_modes(youth_list, job_list)
+    print(f"  - Sharded score gap vs single-pass greedy: {gap['score_gap_pct']:.2f}% "
+          f"({gap['shared_pairs_pct']:.1f}% identical pairs)")
+
+    return True
+
+def benchmark_optimal_matching():
+    """Compare welfare and runtime of optimal-assignment matching against greedy"""
+    print("Benchmarking optimal matching...")
+
+    config = {
+        'simulation_months': 1,
+        'num_youth_agents': 20000,
+        'num_employer_agents': 2000,
+        'monthly_training_capacity': 100,
+        'matching_top_k': 20,
+        'seed': 42
+    }
+
+    sim = SimulationEngine(config)
+    youth_list = sim.population.select(np.flatnonzero(sim.population.status_mask('unemployed_seeking', 'underemployed')))
+    job_list = sim.generate_monthly_jobs()
+    accept_all = lambda y, j, score: True
+
+    print(f"  - Pairs: {len(youth_list):,} youth x {len(job_list):,} jobs")
+    for mode in ['exact', 'top_k', 'optimal']:
+        start = time.time()
+        matches = sim._assign_jobs(youth_list, job_list, accept_all, mode)
+        elapsed = time.time() - start
+        total = sum(sim.calculate_match_score(youth_list[y], job_list[j]) for y, j in matches)
+        print(f"  - {mode}: {len(matches):,} matches, total score {total:,.1f} in {elapsed:.2f} seconds")
+
+    return True
+
+def benchmark_deferred_acceptance():
+    """Time deferred-acceptance matching on a simulated month and on a 100k x 50k candidate graph"""
+    print("Benchmarking deferred-acceptance matching...")
+
+    from matching import deferred_acceptance
+
+    config = {
+        'simulation_months': 1,
+        'num_youth_agents': 20000,
+        'num_employer_agents': 2000,
+        'monthly_training_capacity': 100,
+        'matching_top_k': 20,
+        'seed': 42
+    }
+
+    sim = SimulationEngine(config)
+    youth_list = sim.population.select(np.flatnonzero(sim.population.status_mask('unemployed_seeking', 'underemployed')))
+    job_list = sim.generate_monthly_jobs()
+    accept_all = lambda y, j, score: True
+
+    print(f"  - Pairs: {len(youth_list):,} youth x {len(job_list):,} jobs")
+    for mode in ['top_k', 'deferred_acceptance']:
+        start = time.time()
+        matches = sim._assign_jobs(youth_list, job_list, accept_all, mode)
+        elapsed = time.time() - start
+        salaries = sim.calculate_job_salaries([(youth_list[y], job_list[j]) for y, j in matches])
+        print(f"  - {mode}: {len(matches):,} matches, mean salary {salaries.mean():,.0f} BDT in {elapsed:.2f} seconds")
+
+    # Proposal rounds alone, 20 candidate jobs per youth
+    n_youth, n_jobs, k = 100_000, 50_000, 20
+    rng = np.random.default_rng(0)
+    youth_index = np.repeat(np.arange(n_youth), k)
+    job_index = rng.integers(0, n_jobs, n_youth * k)
+    start = time.time()
+    held = deferred_acceptance(youth_index, job_index, rng.random(len(job_index)), rng.random(len(job_index)))
+    print(f"  - {n_youth:,} youth x {n_jobs:,} jobs, {len(job_index):,} candidate edges: "
+          f"{len(held):,} matches in {time.time() - start:.2f} seconds")
+
+    return True
+
+def main():
+    """Run all benchmarks"""
+    print("Bangladesh Youth Employment Simulation Framework - Benchmarks")
+    print("=" * 70)
+    print(f"Benchmark started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    benchmarks = [
+        ("Import Time", benchmark_import_time),
+        ("Job Matching", benchmark_job_matching),
+        ("Matching Modes", benchmark_matching_modes),
+        ("Sharded Matching", benchmark_sharded_matching),
+        ("Optimal Matching", benchmark_optimal_matching),
+        ("Deferred Acceptance", benchmark_deferred_acceptance),
+        ("Compiled Kernels", benchmark_compiled_kernels),
+        ("Hiring Draws", benchmark_hiring_draws),
+        ("Population Generation", benchmark_population_generation),
+        ("Job Generation", benchmark_job_generation),
+        ("Batch Runner", benchmark_batch_runner),
+        ("Replications", benchmark_replications),
+        ("Monthly Metrics", benchmark_monthly_metrics),
+        ("Training Stage", benchmark_training_stage),
+        ("Agent State Update", benchmark_agent_state_update),
+        ("Event Log", benchmark_event_log),
+        ("Results Storage", benchmark_results_storage),
+        ("Checkpoint", benchmark_checkpoint),
+        ("Scenario Branching", benchmark_scenario_branching)
+    ]
+
+    failed = []
+    for benchmark_name, benchmark_func in benchmarks:
+        print(f"\n{'='*50}")
+        print(f"Running: {benchmark_name}")
+        print(f"{'='*50}")
+        if not benchmark_func():
+            failed.append(benchmark_name)
+
+    if failed:
+        print(f"\n⚠️  Benchmarks over budget: {', '.join(failed)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,246 @@
+"""
+Columnar Event Log for Agent Histories
+
+Events are appended to growable NumPy columns -- agent index, month, event
+code and a few generic payload columns -- instead of per-agent lists of
+dicts. Each event also stores the row of the same agent's previous event,
+so one agent's history, its most recent event and the most recent event of
+an indexed type are pointer lookups rather than scans.
+
+An optional per-agent limit turns every agent's chain into a ring buffer:
+only the agent's most recent ``limit`` events stay visible, and rows that
+fall out of every buffer are compacted away in bulk.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Payload columns shared by every event type; what each one means is up to the caller
+PAYLOAD_COLUMNS = {
+    'category': np.int8,
+    'detail': np.int8,
+    'flags': np.uint8,
+    'value': np.float64
+}
+
+INITIAL_CAPACITY = 64
+MIN_COMPACT_SIZE = 1024
+
+
+class EventLog:
+    """Append-only columnar log of per-agent events"""
+
+    def __init__(self, n_agents: int, event_types: List[str], limit: Optional[int] = None,
+                 indexed: Sequence[str] = (), capacity: int = INITIAL_CAPACITY):
+        if limit is not None and limit < 1:
+            raise ValueError("Event limit must be at least 1")
+
+        self.n_agents = n_agents
+        self.event_types = list(event_types)
+        self.event_codes = {event: code for code, event in enumerate(self.event_types)}
+        self.limit = limit
+
+        self._size = 0
+        self._columns = {
+            'agent': np.zeros(capacity, dtype=np.int32),
+            'month': np.zeros(capacity, dtype=np.int16),
+            'event': np.zeros(capacity, dtype=np.int8),
+            'seq': np.zeros(capacity, dtype=np.int32),
+            'prev': np.zeros(capacity, dtype=np.int64),
+            **{name: np.zeros(capacity, dtype=dtype) for name, dtype in PAYLOAD_COLUMNS.items()}
+        }
+
+        # Per-agent chain heads and event counts (including events evicted by the limit)
+        self.last = np.full(n_agents, -1, dtype=np.int64)
+        self.total = np.zeros(n_agents, dtype=np.int32)
+        self.last_of = {event: np.full(n_agents, -1, dtype=np.int64) for event in indexed}
+
+    def column(self, name: str) -> np.ndarray:
+        """Stored rows of one column (a view, valid until the next append)"""
+        return self._columns[name][:self._size]
+
+    def append(self, agent: int, month: int, event: str, **payload):
+        """Record one event for one agent"""
+
+        self._reserve(1)
+        row = self._size
+        code = self.event_codes[event]
+
+        columns = self._columns
+        columns['agent'][row] = agent
+        columns['month'][row] = month
+        columns['event'][row] = code
+        columns['seq'][row] = self.total[agent]
+        columns['prev'][row] = self.last[agent]
+        for name, value in payload.items():
+            columns[name][row] = value
+
+        self.last[agent] = row
+        self.total[agent] += 1
+        if event in self.last_of:
+            self.last_of[event][agent] = row
+        self._size += 1
+        self._maybe_compact()
+
+    def extend(self, agents: np.ndarray, months, events, **payload):
+        """Record a batch of events; events of the same agent keep their batch order
+
+        ``months``, ``events`` (names or codes) and payload values may be
+        scalars or arrays aligned with ``agents``.
+        """
+
+        agents = np.asarray(agents, dtype=np.int64)
+        n = len(agents)
+        if n == 0:
+            return
+
+        self._reserve(n)
+        rows = np.arange(self._size, self._size + n)
+        codes = self.event_codes[events] if isinstance(events, str) else np.asarray(events)
+        codes = np.broadcast_to(codes, n)
+
+        # Chain each event to the agent's previous event, within the batch or before it
+        order = np.argsort(agents, kind='stable')
+        sorted_agents = agents[order]
+        first = np.ones(n, dtype=bool)
+        first[1:] = sorted_agents[1:] != sorted_agents[:-1]
+        prev = np.empty(n, dtype=np.int64)
+        prev[order[first]] = self.last[sorted_agents[first]]
+        prev[order[~first]] = rows[order[:-1][~first[1:]]]
+
+        position = np.arange(n) - np.maximum.accumulate(np.where(first, np.arange(n), 0))
+        seq = np.empty(n, dtype=np.int64)
+        seq[order] = self.total[sorted_agents] + position
+
+        end = slice(self._size, self._size + n)
+        columns = self._columns
+        columns['agent'][end] = agents
+        columns['month'][end] = months
+        columns['event'][end] = codes
+        columns['seq'][end] = seq
+        columns['prev'][end] = prev
+        for name, value in payload.items():
+            columns[name][end] = value
+
+        # Last event per agent is the last of its run in the stable sort
+        is_last = np.ones(n, dtype=bool)
+        is_last[:-1] = sorted_agents[1:] != sorted_agents[:-1]
+        self.last[sorted_agents[is_last]] = rows[order[is_last]]
+        np.add.at(self.total, agents, 1)
+
+        for event, latest in self.last_of.items():
+            of_type = codes == self.event_codes[event]
+            np.maximum.at(latest, agents[of_type], rows[of_type])
+
+        self._size += n
+        self._maybe_compact()
+
+    def count(self, agents=slice(None)) -> np.ndarray:
+        """Number of visible events per agent"""
+        total = self.total[agents]
+        return total if self.limit is None else np.minimum(total, self.limit)
+
+    def visible(self, rows: np.ndarray) -> np.ndarray:
+        """Whether rows (-1 meaning none) are still inside their agent's ring buffer"""
+
+        rows = np.asarray(rows)
+        found = rows >= 0
+        if self.limit is None:
+            return found
+        safe = np.where(found, rows, 0)
+        agents = self._columns['agent'][safe]
+        return found & (self._columns['seq'][safe] >= self.total[agents] - self.limit)
+
+    def lookup(self, name: str, rows: np.ndarray, default=0) -> np.ndarray:
+        """Values of one column at rows, with default where rows is -1"""
+
+        rows = np.asarray(rows)
+        found = rows >= 0
+        return np.where(found, self._columns[name][np.where(found, rows, 0)], default)
+
+    def latest(self, agents=slice(None), event: Optional[str] = None) -> np.ndarray:
+        """Row of each agent's most recent event (of an indexed type if given), or -1"""
+
+        rows = self.last[agents] if event is None else self.last_of[event][agents]
+        return np.where(self.visible(rows), rows, -1)
+
+    def agent_rows(self, agent: int) -> np.ndarray:
+        """Rows of one agent's visible events, oldest first"""
+
+        rows = []
+        row = self.last[agent]
+        prev = self._columns['prev']
+        for _ in range(int(self.count(agent))):
+            rows.append(row)
+            row = prev[row]
+        return np.array(rows[::-1], dtype=np.int64)
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the log columns and per-agent indices"""
+        return (sum(column.nbytes for column in self._columns.values()) + self.last.nbytes +
+                self.total.nbytes + sum(latest.nbytes for latest in self.last_of.values()))
+
+    def state(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Arrays and settings that fully describe the log, e.g. for a checkpoint"""
+
+        arrays = {name: self.column(name) for name in self._columns}
+        arrays.update(last=self.last, total=self.total)
+        arrays.update({f'last_of.{event}': latest for event, latest in self.last_of.items()})
+        settings = {'n_agents': self.n_agents, 'event_types': self.event_types, 'limit': self.limit,
+                    'indexed': list(self.last_of)}
+        return arrays, settings
+
+    @classmethod
+    def from_state(cls, arrays: Dict[str, np.ndarray], settings: Dict[str, Any]) -> 'EventLog':
+        """Rebuild a log from state(); the arrays are adopted, not copied"""
+
+        log = cls(settings['n_agents'], settings['event_types'], settings['limit'], settings['indexed'])
+        log._size = len(arrays['agent'])
+        if log._size:
+            # Stored columns hold exactly the rows in use; the next append grows them
+            log._columns = {name: arrays[name] for name in log._columns}
+        log.last = arrays['last']
+        log.total = arrays['total']
+        log.last_of = {event: arrays[f'last_of.{event}'] for event in settings['indexed']}
+        return log
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, n: int):
+        """Grow the columns (doubling) to fit n more rows"""
+
+        needed = self._size + n
+        capacity = len(self._columns['agent'])
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def _maybe_compact(self):
+        """Drop evicted rows once they make up more than half of the log"""
+
+        if self.limit is None or self._size < MIN_COMPACT_SIZE:
+            return
+        if self._size <= 2 * int(self.count().sum()):
+            return
+
+        keep = self.visible(np.arange(self._size))
+        new_row = np.cumsum(keep) - 1
+
+        def remap(rows: np.ndarray) -> np.ndarray:
+            # -1 (no event) indexes the last row harmlessly and is masked out
+            return np.where((rows >= 0) & keep[rows], new_row[rows], -1)
+
+        self._columns['prev'][:self._size] = remap(self._columns['prev'][:self._size])
+        self.last = remap(self.last)
+        self.last_of = {event: remap(latest) for event, latest in self.last_of.items()}
+
+        for column in self._columns.values():
+            kept = column[:self._size][keep]
+            column[:len(kept)] = kept
+        self._size = len(kept)
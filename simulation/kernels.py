@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Compiled Kernels for the Bangladesh Youth Employment Simulation
+
+The hot inner loops of the engine -- match scoring, hiring probabilities,
+job salaries, the greedy assignment scan and the monthly agent state
+update -- written as plain loops over
+arrays and compiled with numba's @njit when it is installed. Each kernel
+repeats the arithmetic of its NumPy (or scalar) counterpart operation by
+operation, so compiled and uncompiled runs give identical results.
+
+numba is optional: without it HAVE_NUMBA is False and callers keep using
+their NumPy implementations. numba itself is only imported when the first
+kernel is called, so importing the engine stays cheap. Compiled kernels are
+cached on disk so that later processes skip the JIT step; set
+SIMULATION_NUMBA_CACHE=0 to disable the cache, or SIMULATION_NUMBA=0 to
+disable compilation altogether.
+
+Kernels release the GIL, so engines running in threads score in parallel.
+Row-parallel kernels (prange) only run multi-threaded with
+SIMULATION_NUMBA_PARALLEL=1: engines already run side by side in threads
+and forked batch workers, and numba's threading layers are not safe under
+both (workqueue aborts on concurrent use, OpenMP and TBB break after fork).
+
+Author: AI-Enhanced Employment Framework Team
+Version: 1.0
+Date: 2025
+"""
+
+import functools
+import importlib.util
+import os
+import threading
+import numpy as np
+
+# numba is found without importing it; it is imported on the first kernel call
+HAVE_NUMBA = (os.environ.get('SIMULATION_NUMBA', '1') != '0'
+              and importlib.util.find_spec('numba') is not None)
+
+# Replaced by numba.prange when the kernels are compiled
+prange = range
+
+# Compiled kernels are written to __pycache__ and reused by later processes
+NUMBA_CACHE = os.environ.get('SIMULATION_NUMBA_CACHE', '1') != '0'
+
+# Whether row-parallel kernels use numba's thread pool
+NUMBA_PARALLEL = os.environ.get('SIMULATION_NUMBA_PARALLEL', '0') == '1'
+
+# Competition factor drawn for every hiring check: uniform on [low, high)
+COMPETITION_LOW = 0.7
+COMPETITION_HIGH = 1.0
+
+_kernels = {}
+_compile_lock = threading.Lock()
+
+
+class _Kernel:
+    """A kernel function that is compiled with numba.njit on its first call
+
+    Calls go to the compiled dispatcher once _compiled() has built it, or
+    to the plain Python function when numba is not available.
+    """
+
+    def __init__(self, function, options):
+        functools.update_wrapper(self, function)
+        self.function = function
+        self.options = options
+        self.dispatcher = None
+
+    def __call__(self, *args):
+        return (self.dispatcher or _compiled(self))(*args)
+
+
+def _compiled(kernel: _Kernel):
+    """The callable for a kernel, compiling all kernels on the first request
+
+    Kernels call each other through module globals, so every global is
+    rebound to its numba dispatcher (and prange to numba.prange) before
+    anything is compiled; numba resolves them when a kernel is first typed.
+    """
+
+    with _compile_lock:
+        if kernel.dispatcher is None:
+            global prange
+            try:
+                if not HAVE_NUMBA:
+                    raise ImportError("numba is not available")
+                import numba
+                prange = numba.prange
+                for name, lazy in _kernels.items():
+                    lazy.dispatcher = numba.njit(**lazy.options)(lazy.function)
+                    globals()[name] = lazy.dispatcher
+            except ImportError:
+                for lazy in _kernels.values():
+                    lazy.dispatcher = lazy.function
+    return kernel.dispatcher
+
+
+def njit(**options):
+    """Register a kernel to be compiled with numba.njit(**options) on first use"""
+
+    def register(function):
+        _kernels[function.__name__] = _Kernel(function, options)
+        return _kernels[function.__name__]
+
+    return register
+
+
+@njit(parallel=NUMBA_PARALLEL, nogil=True, cache=NUMBA_CACHE)
+def match_score_kernel(skills, youth_region, is_dhaka, english_proficiency, ai_collaboration, has_experience,
+                       cultural_constraints, req_index, req_value, req_valid, job_region, accepts_dhaka_mobility,
+                       remote_work, international, ai_collaboration_required, experience_required, out):
+    """Fill out[r, j] with the match score of youth row r and job j"""
+
+    n_rows, n_jobs = out.shape
+    n_slots = req_index.shape[1]
+    for r in prange(n_rows):
+        for j in range(n_jobs):
+            # Skill matching (50% weight)
+            skill_match = 0.0
+            total_requirements = 0
+            for slot in range(n_slots):
+                if req_valid[j, slot]:
+                    total_requirements += 1
+                    youth_level = skills[r, req_index[j, slot]]
+                    required_level = req_value[j, slot]
+                    if youth_level >= required_level:
+                        skill_match += 1.0
+                    else:
+                        skill_match += youth_level / required_level
+            score = (skill_match / total_requirements) * 0.5 if total_requirements > 0 else 0.0
+
+            # Geographic compatibility (15% weight)
+            if remote_work[j] or youth_region[r] == job_region[j]:
+                score += 0.15
+            elif is_dhaka[r] and accepts_dhaka_mobility[j]:
+                score += 0.10
+            else:
+                score += 0.0
+
+            # Language requirements (15% weight)
+            score += english_proficiency[r] * 0.15 if international[j] else 0.15
+
+            # AI collaboration capability (10% weight)
+            score += ai_collaboration[r] * 0.10 if ai_collaboration_required[j] else 0.10
+
+            # Experience factor (5% weight)
+            if experience_required[j]:
+                score += 0.05 if has_experience[r] else 0.02
+            else:
+                score += 0.05
+
+            # Cultural fit (5% weight)
+            cultural_fit = 1 - cultural_constraints[r]
+            if international[j]:
+                cultural_fit = cultural_fit * 1.2
+            score += cultural_fit * 0.05
+
+            out[r, j] = min(max(score, 0.0), 1.0)
+    return out
+
+
+@njit(nogil=True, cache=NUMBA_CACHE)
+def hiring_probability(match_score, skill_shortage, competition_factor):
+    """Hiring probability for one pair, as in SimulationEngine.calculate_hiring_probability"""
+
+    base_prob = match_score * 0.8
+    base_prob += skill_shortage * 0.2
+    base_prob *= competition_factor
+    return min(max(base_prob, 0.1), 0.9)
+
+
+@njit(nogil=True, cache=NUMBA_CACHE)
+def greedy_hiring_scan(youth_index, job_index, scores, order, start, youth_taken, job_taken, job_shortage,
+                       draws, matched_youth, matched_jobs, n_matched):
+    """Greedy pass with the random hiring check, driven by pre-drawn uniforms
+
+    Visits order[start:] and, for every pair whose youth and job are both
+    free, consumes two draws: the competition factor and the acceptance
+    draw, in the order calculate_hiring_probability and the engine draw
+    them. Stops when the pairs, the free youth or jobs, or the draws run
+    out. Returns (next position, draws used, matches so far).
+    """
+
+    competition_range = COMPETITION_HIGH - COMPETITION_LOW
+    youth_left = youth_taken.size - youth_taken.sum()
+    jobs_left = job_taken.size - job_taken.sum()
+    used = 0
+    position = start
+    while position < order.size and youth_left > 0 and jobs_left > 0:
+        pair = order[position]
+        y = youth_index[pair]
+        j = job_index[pair]
+        if not (youth_taken[y] or job_taken[j]):
+            if used + 2 > draws.size:
+                break
+            competition = COMPETITION_LOW + competition_range * draws[used]
+            probability = hiring_probability(scores[pair], job_shortage[j], competition)
+            accepted = draws[used + 1] < probability
+            used += 2
+            if accepted:
+                youth_taken[y] = True
+                job_taken[j] = True
+                matched_youth[n_matched] = y
+                matched_jobs[n_matched] = j
+                n_matched += 1
+                youth_left -= 1
+                jobs_left -= 1
+        position += 1
+    return position, used, n_matched
+
+
+@njit(parallel=NUMBA_PARALLEL, nogil=True, cache=NUMBA_CACHE)
+def job_salary_kernel(skills, ai_columns, req_index, req_value, salary_min, salary_max, has_experience,
+                      social_network_strength, motivation_level, out):
+    """Fill out[k] with the salary of matched pair k, as in SimulationEngine.calculate_job_salary
+
+    Row k of every argument describes one matched youth and their job.
+    """
+
+    n_ai = ai_columns.size
+    for k in prange(out.size):
+        base_salary = (salary_min[k] + salary_max[k]) / 2
+
+        # Skill premium
+        skill_premium = 0.0
+        for slot in range(req_index.shape[1]):
+            youth_skill = np.float64(skills[k, req_index[k, slot]])
+            if youth_skill > req_value[k, slot]:
+                skill_premium += (youth_skill - req_value[k, slot]) * 0.1
+
+        # AI skills premium (first value plus the sum of the rest, as np.mean adds them)
+        ai_rest = 0.0
+        for c in range(1, n_ai):
+            ai_rest += np.float64(skills[k, ai_columns[c]])
+        if (np.float64(skills[k, ai_columns[0]]) + ai_rest) / n_ai > 0.6:
+            skill_premium += 0.15
+
+        # Experience premium
+        if has_experience[k]:
+            skill_premium += 0.05
+
+        # Negotiation factor based on social network and motivation
+        negotiation_factor = (social_network_strength[k] + motivation_level[k]) / 2
+
+        final_salary = base_salary * (1 + skill_premium) * (0.9 + negotiation_factor * 0.2)
+        out[k] = min(max(final_salary, salary_min[k]), salary_max[k] * 1.2)
+    return out
+
+
+@njit(nogil=True, cache=NUMBA_CACHE)
+def agent_state_kernel(financial_resources, monthly_income, debt_burden, skills, n_traditional, employment_status,
+                       employed_formal, employed_informal, unemployed_seeking, recent_ai_job, motivation_level,
+                       ai_skill_sum):
+    """Monthly agent state update in one pass over the population, as in SimulationEngine.update_agent_states
+
+    Skills are updated in float64 and rounded to the float32 matrix, as
+    the per-skill writes did. Returns ai_skill_sum plus every changed
+    agent's AI skill gain, added agent by agent.
+    """
+
+    n_skills = skills.shape[1]
+    for i in range(skills.shape[0]):
+        # Financial resources
+        financial_resources[i] += monthly_income[i] - debt_burden[i] * 0.1
+
+        # Traditional skill decay
+        for c in range(n_traditional):
+            skills[i, c] = np.float64(skills[i, c]) * 0.999
+
+        status = employment_status[i]
+        if status == employed_formal or status == employed_informal:
+            # AI skill growth through AI-collaborating work (gain summed from -0.0, as NumPy sums a short row)
+            if recent_ai_job[i]:
+                gain = -0.0
+                for c in range(n_traditional, n_skills):
+                    old = np.float64(skills[i, c])
+                    skills[i, c] = min(old + 0.01, 1.0)
+                    gain += np.float64(skills[i, c]) - old
+                ai_skill_sum += gain
+
+            motivation_level[i] = min(motivation_level[i] + 0.02, 1.0)
+        elif status == unemployed_seeking:
+            motivation_level[i] = max(motivation_level[i] - 0.01, 0.1)
+    return ai_skill_sum
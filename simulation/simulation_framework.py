@@ -11,19 +11,39 @@ Date: 2025
 """
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Callable, Dict, List, Tuple, Optional, Any
+from collections.abc import MutableMapping, Sequence
 from enum import Enum
 import random
 import json
+import os
+import io
+import time
+import contextlib
+import tempfile
+import traceback
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set random seeds for reproducibility
+from events import EventLog
+from visualization import (
+    PLOT_STYLE, FIGURE_SIZE, DEFAULT_DPI, plot_data, plot_results, render_results, render_results_async, render_many
+)
+from results_store import DEFAULT_FORMAT, results_summary, save_results
+from checkpoint import read_checkpoint, write_checkpoint
+from kernels import HAVE_NUMBA, agent_state_kernel, job_salary_kernel
+from matching import (
+    HiringCheck, YouthMatchArrays, JobMatchArrays, MATCH_THRESHOLD, DEFAULT_TOP_K, DEFAULT_MAX_ROUNDS, DEFAULT_BUCKET_SIZE,
+    DEFAULT_DRAW_BLOCK, match_score_matrix, match_score_pairs, collect_candidates, greedy_assignment,
+    indexed_greedy_assignment, pruned_greedy_assignment, sharded_greedy_assignment, optimal_assignment,
+    deferred_acceptance_assignment, assignment_gap
+)
+
+# Set random seeds for reproducibility (engines without a 'seed' draw theirs from here)
 np.random.seed(42)
 random.seed(42)
 
@@ -52,6 +72,83 @@ class SkillLevel(Enum):
     ADVANCED = 3
     EXPERT = 4
 
+# Skill categories held by youth agents
+TRADITIONAL_SKILLS = [
+    'graphic_design', 'web_development', 'content_writing',
+    'digital_marketing', 'data_entry', 'video_editing',
+    'translation', 'customer_service'
+]
+
+AI_SKILLS = [
+    'prompt_engineering', 'ai_content_creation', 'data_annotation',
+    'ai_customer_support', 'human_ai_collaboration'
+]
+
+# Column order used by array-based youth skill matrices
+SKILL_NAMES = TRADITIONAL_SKILLS + AI_SKILLS
+SKILL_INDEX = {skill: i for i, skill in enumerate(SKILL_NAMES)}
+AI_SKILL_COLUMNS = np.array([SKILL_INDEX[skill] for skill in AI_SKILLS], dtype=np.intp)
+
+# Integer codes used by array-based categorical columns
+REGIONS = list(Region)
+REGION_CODES = {region: i for i, region in enumerate(REGIONS)}
+
+GENDERS = ['male', 'female']
+
+EDUCATION_LEVELS = [
+    'no_formal_education', 'primary_complete', 'secondary_complete',
+    'higher_secondary', 'bachelor_degree', 'master_plus'
+]
+
+EMPLOYMENT_STATUSES = [
+    'employed_formal', 'employed_informal', 'unemployed_seeking',
+    'underemployed', 'not_in_labor_force'
+]
+STATUS_CODES = {status: i for i, status in enumerate(EMPLOYMENT_STATUSES)}
+
+EMPLOYER_TYPES = ['local', 'international', 'startup', 'enterprise']
+COMPANY_SIZES = ['small', 'medium', 'large']
+INDUSTRIES = [
+    'technology', 'content_creation', 'customer_service',
+    'education', 'consulting', 'e_commerce', 'marketing'
+]
+
+# Base skill requirements by industry
+INDUSTRY_SKILLS = {
+    'technology': ['web_development', 'prompt_engineering', 'human_ai_collaboration'],
+    'content_creation': ['content_writing', 'ai_content_creation', 'graphic_design'],
+    'customer_service': ['customer_service', 'ai_customer_support', 'translation'],
+    'education': ['content_writing', 'ai_content_creation', 'human_ai_collaboration'],
+    'consulting': ['human_ai_collaboration', 'prompt_engineering', 'data_annotation'],
+    'e_commerce': ['digital_marketing', 'ai_content_creation', 'customer_service'],
+    'marketing': ['digital_marketing', 'ai_content_creation', 'data_annotation']
+}
+
+# Skill columns required by each industry code, in INDUSTRY_SKILLS order
+INDUSTRY_SKILL_INDEX = np.array([[SKILL_INDEX[skill] for skill in INDUSTRY_SKILLS[name]] for name in INDUSTRIES],
+                                dtype=np.intp)
+
+# Training programs: base completion rate, and the AI skills each improves with its gain factor
+TRAINING_TYPES = ['basic_ai_literacy', 'intermediate_ai_skills', 'advanced_ai_collaboration']
+TRAINING_COMPLETION_RATES = {
+    'basic_ai_literacy': 0.78,
+    'intermediate_ai_skills': 0.71,
+    'advanced_ai_collaboration': 0.65
+}
+TRAINING_SKILL_GAINS = {
+    'basic_ai_literacy': (['ai_content_creation', 'data_annotation'], 0.3),
+    'intermediate_ai_skills': (['prompt_engineering', 'ai_customer_support', 'ai_content_creation'], 0.4),
+    'advanced_ai_collaboration': (['human_ai_collaboration', 'prompt_engineering'], 0.5)
+}
+
+# Event types recorded in each agent history, and the flag bits of job events
+HISTORY_EVENTS = {
+    'employment_history': ['job_assigned', 'training_completed'],
+    'income_history': ['income'],
+    'skill_development_history': ['skill_development']
+}
+JOB_FLAGS = {'remote_work': 1, 'ai_collaboration': 2}
+
 @dataclass
 class YouthAgent:
     """Individual youth agent with comprehensive attributes"""
@@ -92,6 +189,11 @@ class YouthAgent:
     employment_history: List[Dict] = field(default_factory=list)
     income_history: List[float] = field(default_factory=list)
     skill_development_history: List[Dict] = field(default_factory=list)
+    
+    @property
+    def has_experience(self) -> bool:
+        """Whether the agent has any employment history"""
+        return len(self.employment_history) > 0
 
 @dataclass
 class EmployerAgent:
@@ -117,30 +219,751 @@ class EmployerAgent:
     certification_importance: float  # 0-1 scale
     cultural_fit_importance: float  # 0-1 scale
 
+class _ColumnAttribute:
+    """Descriptor exposing one YouthPopulation column as a YouthAgent attribute"""
+    
+    def __init__(self, values: Optional[List[Any]] = None):
+        self.values = values
+        self.codes = {value: code for code, value in enumerate(values)} if values else None
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        value = getattr(view._population, self.name)[view._index]
+        return self.values[value] if self.values else value.item()
+    
+    def __set__(self, view, value):
+        getattr(view._population, self.name)[view._index] = self.codes[value] if self.codes else value
+
+
+class SkillMapView(MutableMapping):
+    """Dict-like view of one agent's row in the population skill matrix"""
+    
+    def __init__(self, skills: np.ndarray, row: int, skill_names: List[str]):
+        self._skills = skills
+        self._row = row
+        self._names = skill_names
+    
+    def __getitem__(self, skill: str) -> float:
+        if skill not in self._names:
+            raise KeyError(skill)
+        return float(self._skills[self._row, SKILL_INDEX[skill]])
+    
+    def __setitem__(self, skill: str, value: float):
+        if skill not in self._names:
+            raise KeyError(f"Unknown skill for this skill set: {skill}")
+        self._skills[self._row, SKILL_INDEX[skill]] = value
+    
+    def __delitem__(self, skill: str):
+        raise TypeError("Skills cannot be removed from a columnar population")
+    
+    def __iter__(self):
+        return iter(self._names)
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class HistoryView(Sequence):
+    """List-like view of one agent's history in the population event logs
+    
+    Entries decode to the same dicts (floats for income) the list-based
+    histories held, and append() encodes new entries into the log.
+    """
+    
+    def __init__(self, population: 'YouthPopulation', kind: str, index: int):
+        self._population = population
+        self._kind = kind
+        self._index = index
+    
+    def __getitem__(self, position):
+        log = self._population.events[self._kind]
+        if position == -1:
+            row = int(log.latest(self._index))
+            if row < 0:
+                raise IndexError("history is empty")
+            return self._population.decode_event(self._kind, row)
+        
+        rows = log.agent_rows(self._index)
+        if isinstance(position, slice):
+            return [self._population.decode_event(self._kind, row) for row in rows[position]]
+        return self._population.decode_event(self._kind, rows[position])
+    
+    def __len__(self) -> int:
+        return int(self._population.events[self._kind].count(self._index))
+    
+    def __iter__(self):
+        for row in self._population.events[self._kind].agent_rows(self._index):
+            yield self._population.decode_event(self._kind, row)
+    
+    def append(self, entry):
+        self._population.record_event(self._kind, self._index, entry)
+    
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+    
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Sequence) and list(self) == list(other)
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class YouthAgentView:
+    """Thin YouthAgent-compatible view of one row of a YouthPopulation
+    
+    Attribute reads and writes go straight to the population columns, so
+    existing code written against YouthAgent keeps working unchanged.
+    """
+    
+    __slots__ = ('_population', '_index')
+    
+    age = _ColumnAttribute()
+    gender = _ColumnAttribute(GENDERS)
+    region = _ColumnAttribute(REGIONS)
+    education_level = _ColumnAttribute(EDUCATION_LEVELS)
+    employment_status = _ColumnAttribute(EMPLOYMENT_STATUSES)
+    monthly_income = _ColumnAttribute()
+    english_proficiency = _ColumnAttribute()
+    digital_literacy = _ColumnAttribute()
+    ai_familiarity = _ColumnAttribute()
+    family_support = _ColumnAttribute()
+    social_network_strength = _ColumnAttribute()
+    cultural_constraints = _ColumnAttribute()
+    motivation_level = _ColumnAttribute()
+    financial_resources = _ColumnAttribute()
+    debt_burden = _ColumnAttribute()
+    family_financial_pressure = _ColumnAttribute()
+    program_participation = _ColumnAttribute()
+    training_completion_rate = _ColumnAttribute()
+    months_in_program = _ColumnAttribute()
+    
+    # Derived from the employment history
+    has_experience = _ColumnAttribute()
+    job_ai_collaboration = _ColumnAttribute()
+    current_employer = _ColumnAttribute()
+    job_start_month = _ColumnAttribute()
+    
+    def __init__(self, population: 'YouthPopulation', index: int):
+        self._population = population
+        self._index = index
+    
+    @property
+    def id(self) -> str:
+        return self._population.agent_id(self._index)
+    
+    @property
+    def traditional_skills(self) -> SkillMapView:
+        return SkillMapView(self._population.skills, self._index, TRADITIONAL_SKILLS)
+    
+    @property
+    def ai_enhanced_skills(self) -> SkillMapView:
+        return SkillMapView(self._population.skills, self._index, AI_SKILLS)
+    
+    @property
+    def employment_history(self) -> HistoryView:
+        return self._population.history('employment_history', self._index)
+    
+    @property
+    def income_history(self) -> HistoryView:
+        return self._population.history('income_history', self._index)
+    
+    @property
+    def skill_development_history(self) -> HistoryView:
+        return self._population.history('skill_development_history', self._index)
+    
+    def __eq__(self, other) -> bool:
+        return isinstance(other, YouthAgentView) and other._population is self._population and other._index == self._index
+    
+    def __hash__(self) -> int:
+        return hash((id(self._population), self._index))
+    
+    def __repr__(self) -> str:
+        return f"YouthAgentView(id={self.id!r}, region={self.region.value!r}, employment_status={self.employment_status!r})"
+
+
+class YouthPopulation:
+    """Structure-of-arrays store for the youth population
+    
+    Every YouthAgent attribute is held as one NumPy column, skills as a dense
+    (n_agents x n_skills) float32 matrix in SKILL_NAMES order, and gender,
+    region, education and employment status as small integer codes. Indexing
+    the population yields YouthAgentView objects for code that works one
+    agent at a time.
+    """
+    
+    # Column dtypes; categorical columns hold indices into the matching code list
+    COLUMNS = {
+        'age': np.int8,
+        'gender': np.int8,
+        'region': np.int8,
+        'education_level': np.int8,
+        'employment_status': np.int8,
+        'monthly_income': np.float64,
+        'english_proficiency': np.float64,
+        'digital_literacy': np.float64,
+        'ai_familiarity': np.float64,
+        'family_support': np.float64,
+        'social_network_strength': np.float64,
+        'cultural_constraints': np.float64,
+        'motivation_level': np.float64,
+        'financial_resources': np.float64,
+        'debt_burden': np.float64,
+        'family_financial_pressure': np.float64,
+        'program_participation': bool,
+        'training_completion_rate': np.float64,
+        'months_in_program': np.int16
+    }
+    
+    # Columns derived from the employment history, kept current by the engine:
+    # any employment event recorded, latest event is a job needing AI
+    # collaboration, employer row of the current job (-1 if none) and the
+    # month it started (-1 if none)
+    DERIVED_COLUMNS = {
+        'has_experience': bool,
+        'job_ai_collaboration': bool,
+        'current_employer': np.int32,
+        'job_start_month': np.int16
+    }
+    
+    HISTORIES = tuple(HISTORY_EVENTS)
+    
+    def __init__(self, n_agents: int = 0, id_prefix: str = 'youth_', history_limit: Optional[int] = None):
+        self.n_agents = n_agents
+        self.id_prefix = id_prefix
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(n_agents, dtype=dtype))
+        self.skills = np.zeros((n_agents, len(SKILL_NAMES)), dtype=np.float32)
+        
+        for name, dtype in self.DERIVED_COLUMNS.items():
+            setattr(self, name, np.zeros(n_agents, dtype=dtype))
+        self.current_employer[:] = -1
+        self.job_start_month[:] = -1
+        
+        # One event log per history; history_limit keeps only each agent's latest events
+        self.events = {
+            kind: EventLog(n_agents, event_types, limit=history_limit,
+                           indexed=('job_assigned',) if kind == 'employment_history' else ())
+            for kind, event_types in HISTORY_EVENTS.items()
+        }
+        self._custom_ids: Optional[List[str]] = None
+    
+    @classmethod
+    def from_agents(cls, agents: List[YouthAgent]) -> 'YouthPopulation':
+        """Build a columnar population from YouthAgent records"""
+        
+        population = cls(len(agents))
+        views = [population[i] for i in range(len(agents))]
+        for view, agent in zip(views, agents):
+            for name in cls.COLUMNS:
+                setattr(view, name, getattr(agent, name))
+            view.traditional_skills.update(agent.traditional_skills)
+            view.ai_enhanced_skills.update(agent.ai_enhanced_skills)
+            for kind in cls.HISTORIES:
+                population.history(kind, view._index).extend(getattr(agent, kind))
+        population.derive_history_columns()
+        
+        ids = [agent.id for agent in agents]
+        if ids != [population.agent_id(i) for i in range(len(agents))]:
+            population._custom_ids = ids
+        
+        return population
+    
+    def state(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Arrays and settings that fully describe the population, e.g. for a checkpoint"""
+        
+        arrays = {name: getattr(self, name) for name in list(self.COLUMNS) + list(self.DERIVED_COLUMNS)}
+        arrays['skills'] = self.skills
+        settings = {'n_agents': self.n_agents, 'id_prefix': self.id_prefix, 'custom_ids': self._custom_ids,
+                    'events': {}}
+        for kind, log in self.events.items():
+            log_arrays, settings['events'][kind] = log.state()
+            arrays.update({f'{kind}.{name}': array for name, array in log_arrays.items()})
+        return arrays, settings
+    
+    @classmethod
+    def from_state(cls, arrays: Dict[str, np.ndarray], settings: Dict[str, Any]) -> 'YouthPopulation':
+        """Rebuild a population from state(); the arrays are adopted, not copied"""
+        
+        population = cls.__new__(cls)
+        population.n_agents = settings['n_agents']
+        population.id_prefix = settings['id_prefix']
+        population._custom_ids = settings['custom_ids']
+        for name in list(cls.COLUMNS) + list(cls.DERIVED_COLUMNS) + ['skills']:
+            setattr(population, name, arrays[name])
+        population.events = {}
+        for kind, log_settings in settings['events'].items():
+            prefix = f'{kind}.'
+            log_arrays = {name[len(prefix):]: array for name, array in arrays.items() if name.startswith(prefix)}
+            population.events[kind] = EventLog.from_state(log_arrays, log_settings)
+        return population
+    
+    def to_agent(self, index: int) -> YouthAgent:
+        """Materialize one agent as an independent YouthAgent record"""
+        
+        view = self[index]
+        return YouthAgent(
+            id=view.id,
+            **{name: getattr(view, name) for name in self.COLUMNS},
+            traditional_skills=dict(view.traditional_skills),
+            ai_enhanced_skills=dict(view.ai_enhanced_skills),
+            **{kind: list(self.history(kind, index)) for kind in self.HISTORIES}
+        )
+    
+    def agent_id(self, index: int) -> str:
+        """Get the string id of an agent"""
+        if self._custom_ids is not None:
+            return self._custom_ids[index]
+        return f"{self.id_prefix}{index:06d}"
+    
+    def history(self, kind: str, index: int) -> HistoryView:
+        """Get a list-like view of one agent's history"""
+        return HistoryView(self, kind, index)
+    
+    def has_history(self, kind: str, index: np.ndarray) -> np.ndarray:
+        """Check which agents in index have a non-empty history"""
+        return self.events[kind].count(index) > 0
+    
+    def record_event(self, kind: str, index: int, entry, month: Optional[int] = None):
+        """Encode one history entry (a dict, or a float for income) into its event log"""
+        
+        log = self.events[kind]
+        if kind == 'income_history':
+            log.append(index, -1 if month is None else month, 'income', value=entry)
+        elif kind == 'skill_development_history':
+            log.append(index, entry['month'], 'skill_development',
+                       category=TRAINING_TYPES.index(entry['training_type']), value=entry['progress'])
+        elif entry['event'] == 'job_assigned':
+            flags = ((JOB_FLAGS['remote_work'] if entry['remote_work'] else 0) |
+                     (JOB_FLAGS['ai_collaboration'] if entry['ai_collaboration'] else 0))
+            log.append(index, entry['month'], 'job_assigned',
+                       category=EMPLOYER_TYPES.index(entry['employer_type']),
+                       detail=INDUSTRIES.index(entry['industry']), flags=flags, value=entry['salary'])
+        else:
+            log.append(index, entry['month'], entry['event'],
+                       category=TRAINING_TYPES.index(entry['training_type']), value=entry['completion_rate'])
+    
+    def decode_event(self, kind: str, row: int):
+        """Rebuild the history entry stored at one row of an event log"""
+        
+        log = self.events[kind]
+        month = int(log.column('month')[row])
+        category = int(log.column('category')[row])
+        value = float(log.column('value')[row])
+        
+        if kind == 'income_history':
+            return value
+        if kind == 'skill_development_history':
+            return {'month': month, 'training_type': TRAINING_TYPES[category], 'progress': value,
+                    'skills_updated': list(AI_SKILLS)}
+        
+        event = log.event_types[log.column('event')[row]]
+        if event == 'job_assigned':
+            flags = int(log.column('flags')[row])
+            return {
+                'month': month,
+                'event': event,
+                'employer_type': EMPLOYER_TYPES[category],
+                'industry': INDUSTRIES[int(log.column('detail')[row])],
+                'salary': value,
+                'remote_work': bool(flags & JOB_FLAGS['remote_work']),
+                'ai_collaboration': bool(flags & JOB_FLAGS['ai_collaboration'])
+            }
+        return {'month': month, 'event': event, 'training_type': TRAINING_TYPES[category], 'completion_rate': value}
+    
+    def derive_history_columns(self):
+        """Rebuild the derived columns from the employment event log
+        
+        Histories do not record employers, so current_employer is only known
+        for jobs assigned through the engine and is reset here.
+        """
+        
+        log = self.events['employment_history']
+        employed = self.status_mask('employed_formal', 'employed_informal')
+        job_rows = self.latest_job()
+        
+        self.has_experience[:] = log.count() > 0
+        self.job_ai_collaboration[:] = self.recent_job_ai_collaboration()
+        self.current_employer[:] = -1
+        self.job_start_month[:] = np.where(employed & (job_rows >= 0), log.lookup('month', job_rows), -1)
+    
+    def tenure(self, month: int, index=slice(None)) -> np.ndarray:
+        """Months each agent has held its current job at the given month (0 without one)"""
+        start = self.job_start_month[index]
+        return np.where(start >= 0, month - start, 0)
+    
+    def latest_job(self, index=slice(None)) -> np.ndarray:
+        """Employment log row of each agent's most recent job, or -1"""
+        return self.events['employment_history'].latest(index, 'job_assigned')
+    
+    def recent_job_ai_collaboration(self, index=slice(None)) -> np.ndarray:
+        """Whether each agent's most recent employment event is a job requiring AI collaboration"""
+        
+        log = self.events['employment_history']
+        rows = log.latest(index)
+        is_job = log.lookup('event', rows, -1) == log.event_codes['job_assigned']
+        return is_job & (log.lookup('flags', rows) & JOB_FLAGS['ai_collaboration'] != 0)
+    
+    def status_mask(self, *statuses: str) -> np.ndarray:
+        """Boolean mask of agents whose employment status is one of statuses"""
+        return np.isin(self.employment_status, [STATUS_CODES[s] for s in statuses])
+    
+    def select(self, index: np.ndarray) -> 'YouthAgentSelection':
+        """Get a sequence of agent views for the given row indices"""
+        return YouthAgentSelection(self, np.asarray(index, dtype=np.intp))
+    
+    def index_of(self, youth_list) -> Optional[np.ndarray]:
+        """Get row indices for a selection or list of views of this population"""
+        
+        if isinstance(youth_list, YouthAgentSelection) and youth_list.population is self:
+            return youth_list.index
+        if all(isinstance(y, YouthAgentView) and y._population is self for y in youth_list):
+            return np.array([y._index for y in youth_list], dtype=np.intp)
+        return None
+    
+    def end_state(self) -> Dict[str, np.ndarray]:
+        """Per-agent columns for saving: every attribute and one skill_<name> column per skill"""
+        
+        columns = {name: getattr(self, name) for name in list(self.COLUMNS) + list(self.DERIVED_COLUMNS)}
+        columns.update({f'skill_{skill}': self.skills[:, i] for i, skill in enumerate(SKILL_NAMES)})
+        return columns
+    
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the columns, skill matrix and event logs"""
+        columns = list(self.COLUMNS) + list(self.DERIVED_COLUMNS)
+        return (sum(getattr(self, name).nbytes for name in columns) + self.skills.nbytes +
+                sum(log.memory_usage() for log in self.events.values()))
+    
+    def __len__(self) -> int:
+        return self.n_agents
+    
+    def __getitem__(self, index: int) -> YouthAgentView:
+        if index < 0:
+            index += self.n_agents
+        if not 0 <= index < self.n_agents:
+            raise IndexError("youth agent index out of range")
+        return YouthAgentView(self, index)
+    
+    def __iter__(self):
+        for index in range(self.n_agents):
+            yield YouthAgentView(self, index)
+
+
+class YouthAgentSelection(Sequence):
+    """Sequence of YouthAgentView objects for a subset of population rows"""
+    
+    def __init__(self, population: YouthPopulation, index: np.ndarray):
+        self.population = population
+        self.index = index
+    
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return YouthAgentSelection(self.population, self.index[position])
+        return YouthAgentView(self.population, int(self.index[position]))
+    
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+class EmployerTable:
+    """Columnar store of employer attributes, one row per employer
+    
+    Skill requirements are held as a dense (n_employers x n_skills) matrix in
+    SKILL_NAMES order together with a mask of the skills each employer
+    actually requires. The same requirements are also kept in sparse form,
+    as per-employer skill columns (req_index) and levels (req_value) in
+    INDUSTRY_SKILLS order, for scoring by integer indexing.
+    """
+    
+    def __init__(self, employer_type: np.ndarray, region: np.ndarray, industry: np.ndarray, size: np.ndarray,
+                 monthly_job_openings: np.ndarray, requirements: np.ndarray, required: np.ndarray,
+                 salary_min: np.ndarray, salary_max: np.ndarray, remote_work_capability: np.ndarray,
+                 ai_integration_level: np.ndarray, human_ai_collaboration_need: np.ndarray,
+                 experience_preference: np.ndarray, certification_importance: np.ndarray,
+                 cultural_fit_importance: np.ndarray):
+        self.employer_type = employer_type
+        self.region = region
+        self.industry = industry
+        self.size = size
+        self.monthly_job_openings = monthly_job_openings
+        self.requirements = requirements
+        self.required = required
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.remote_work_capability = remote_work_capability
+        self.ai_integration_level = ai_integration_level
+        self.human_ai_collaboration_need = human_ai_collaboration_need
+        self.experience_preference = experience_preference
+        self.certification_importance = certification_importance
+        self.cultural_fit_importance = cultural_fit_importance
+        self.req_index = INDUSTRY_SKILL_INDEX[industry]
+        self.req_value = np.take_along_axis(requirements, self.req_index, axis=1)
+    
+    # Constructor arguments; every other attribute is derived from them
+    FIELDS = (
+        'employer_type', 'region', 'industry', 'size', 'monthly_job_openings', 'requirements', 'required',
+        'salary_min', 'salary_max', 'remote_work_capability', 'ai_integration_level',
+        'human_ai_collaboration_need', 'experience_preference', 'certification_importance', 'cultural_fit_importance'
+    )
+    
+    def state(self) -> Dict[str, np.ndarray]:
+        """Columns that fully describe the table, e.g. for a checkpoint"""
+        return {name: getattr(self, name) for name in self.FIELDS}
+    
+    def __len__(self) -> int:
+        return len(self.employer_type)
+    
+    def employer_id(self, index: int) -> str:
+        """Get the string id of an employer"""
+        return f"employer_{index:04d}"
+    
+    def index_of(self, employer_id: str) -> int:
+        """Get the row of an employer from its string id (-1 if it is not one of ours)"""
+        
+        prefix, _, number = employer_id.rpartition('_')
+        if prefix != 'employer' or not number.isdigit() or int(number) >= len(self):
+            return -1
+        return int(number)
+    
+    def skill_requirements(self, index: int) -> Dict[str, float]:
+        """Get one employer's requirements as a skill-name dict in industry order"""
+        return {SKILL_NAMES[col]: float(value) for col, value in zip(self.req_index[index], self.req_value[index])}
+    
+    def to_agents(self) -> List[EmployerAgent]:
+        """Materialize every row as an EmployerAgent record"""
+        
+        return [
+            EmployerAgent(
+                id=self.employer_id(i),
+                type=EMPLOYER_TYPES[self.employer_type[i]],
+                region=REGIONS[self.region[i]],
+                industry=INDUSTRIES[self.industry[i]],
+                size=COMPANY_SIZES[self.size[i]],
+                monthly_job_openings=int(self.monthly_job_openings[i]),
+                skill_requirements=self.skill_requirements(i),
+                salary_range=(float(self.salary_min[i]), float(self.salary_max[i])),
+                remote_work_capability=float(self.remote_work_capability[i]),
+                ai_integration_level=float(self.ai_integration_level[i]),
+                human_ai_collaboration_need=float(self.human_ai_collaboration_need[i]),
+                experience_preference=float(self.experience_preference[i]),
+                certification_importance=float(self.certification_importance[i]),
+                cultural_fit_importance=float(self.cultural_fit_importance[i])
+            )
+            for i in range(len(self))
+        ]
+
+
+class JobTable(Sequence):
+    """Columnar table of the job openings posted in one month
+    
+    Each job stores its employer row and its own Bernoulli flags; employer
+    attributes (region, type, salary bounds, requirement matrix) are
+    gathered from the EmployerTable. Indexing returns the job as the dict
+    used by the scalar scoring functions, built once per row on demand.
+    """
+    
+    def __init__(self, employers: EmployerTable, employer_index: np.ndarray, remote_work: np.ndarray,
+                 ai_collaboration_required: np.ndarray, experience_required: np.ndarray,
+                 certification_required: np.ndarray):
+        self.employers = employers
+        self.employer_index = employer_index
+        self.remote_work = remote_work
+        self.ai_collaboration_required = ai_collaboration_required
+        self.experience_required = experience_required
+        self.certification_required = certification_required
+        self._rows: Dict[int, Dict[str, Any]] = {}
+    
+    @property
+    def region(self) -> np.ndarray:
+        return self.employers.region[self.employer_index]
+    
+    @property
+    def employer_type(self) -> np.ndarray:
+        return self.employers.employer_type[self.employer_index]
+    
+    @property
+    def salary_min(self) -> np.ndarray:
+        return self.employers.salary_min[self.employer_index]
+    
+    @property
+    def salary_max(self) -> np.ndarray:
+        return self.employers.salary_max[self.employer_index]
+    
+    @property
+    def requirements(self) -> np.ndarray:
+        return self.employers.requirements[self.employer_index]
+    
+    def __len__(self) -> int:
+        return len(self.employer_index)
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += len(self)
+        if index not in self._rows:
+            employer = int(self.employer_index[index])
+            employers = self.employers
+            self._rows[index] = {
+                'employer_id': employers.employer_id(employer),
+                'employer_type': EMPLOYER_TYPES[employers.employer_type[employer]],
+                'industry': INDUSTRIES[employers.industry[employer]],
+                'region': REGIONS[employers.region[employer]],
+                'skill_requirements': employers.skill_requirements(employer),
+                'salary_min': float(employers.salary_min[employer]),
+                'salary_max': float(employers.salary_max[employer]),
+                'remote_work': bool(self.remote_work[index]),
+                'ai_collaboration_required': bool(self.ai_collaboration_required[index]),
+                'experience_required': bool(self.experience_required[index]),
+                'certification_required': bool(self.certification_required[index])
+            }
+        return self._rows[index]
+
+
+class PopulationTotals:
+    """Running population totals behind the monthly metrics
+    
+    Status counts, income, training counts and skill sums are computed from
+    the columns once by refresh(); after that the engine reports every change
+    it makes to an agent through the hooks below, so reading the monthly
+    metrics costs O(changes) instead of a pass over the whole population.
+    """
+    
+    TOTALS = ('status_counts', 'total_income', 'in_training', 'completed_training', 'traditional_skill_sum',
+              'ai_skill_sum')
+    
+    def __init__(self, population: YouthPopulation):
+        self.population = population
+        self.refresh()
+    
+    def refresh(self):
+        """Recompute every total from the population columns"""
+        
+        population = self.population
+        n_traditional = len(TRADITIONAL_SKILLS)
+        self.status_counts = np.bincount(population.employment_status, minlength=len(EMPLOYMENT_STATUSES))
+        self.total_income = float(population.monthly_income.sum())
+        self.in_training = int(population.program_participation.sum())
+        self.completed_training = int((population.training_completion_rate >= 0.8).sum())
+        self.traditional_skill_sum = float(population.skills[:, :n_traditional].sum(dtype=np.float64))
+        self.ai_skill_sum = float(population.skills[:, n_traditional:].sum(dtype=np.float64))
+    
+    def state(self) -> Dict[str, Any]:
+        """The running totals, e.g. for a checkpoint"""
+        return {name: getattr(self, name) for name in self.TOTALS}
+    
+    @classmethod
+    def from_state(cls, population: YouthPopulation, state: Dict[str, Any]) -> 'PopulationTotals':
+        """Restore saved totals without a pass over the population
+        
+        Unlike refresh(), this keeps the exact floating-point sums the
+        saved run had accumulated.
+        """
+        
+        totals = cls.__new__(cls)
+        totals.population = population
+        for name in cls.TOTALS:
+            setattr(totals, name, state[name])
+        return totals
+    
+    def tracks(self, youth) -> bool:
+        """Whether youth is a view into the tracked population"""
+        return isinstance(youth, YouthAgentView) and youth._population is self.population
+    
+    def count(self, *statuses: str) -> int:
+        return int(sum(self.status_counts[STATUS_CODES[status]] for status in statuses))
+    
+    def status_changed(self, old_status: str, new_status: str):
+        self.status_counts[STATUS_CODES[old_status]] -= 1
+        self.status_counts[STATUS_CODES[new_status]] += 1
+    
+    def income_changed(self, old_income: float, new_income: float):
+        self.total_income += new_income - old_income
+    
+    def training_changed(self, was_participating: bool, is_participating: bool,
+                         old_completion: float, new_completion: float):
+        self.in_training += int(is_participating) - int(was_participating)
+        self.completed_training += int(new_completion >= 0.8) - int(old_completion >= 0.8)
+    
+    def skills_changed(self, old_rows: np.ndarray, new_rows: np.ndarray):
+        """Account for skill rows (one agent's or a stack of them) changing from old_rows to new_rows"""
+        
+        n_traditional = len(TRADITIONAL_SKILLS)
+        delta = new_rows.astype(np.float64) - old_rows
+        self.traditional_skill_sum += float(delta[..., :n_traditional].sum())
+        self.ai_skill_sum += float(delta[..., n_traditional:].sum())
+    
+    def traditional_skills_rescaled(self):
+        """Recount the traditional skill total after every agent's traditional skills were rescaled
+        
+        Scaling the running sum instead would drift from the matrix, whose
+        entries are rounded to float32 on every write.
+        """
+        n_traditional = len(TRADITIONAL_SKILLS)
+        self.traditional_skill_sum = float(self.population.skills[:, :n_traditional].sum(dtype=np.float64))
+
+
 class SimulationEngine:
     """Main simulation engine for the employment framework"""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.current_month = 0
+        self.months_completed = 0
         self.max_months = config.get('simulation_months', 36)
         
+        # Every draw in this engine comes from its own generator
+        self.seed_sequence = self._seed_sequence(config.get('seed'))
+        self.rng = np.random.default_rng(self.seed_sequence)
+        
         # Initialize data from realistic_data_module
         self.load_realistic_data()
         
         # Initialize agents
-        self.youth_agents: List[YouthAgent] = []
+        self.population = YouthPopulation()
         self.employer_agents: List[EmployerAgent] = []
+        self.employers: Optional[EmployerTable] = None
         
         # Tracking variables
         self.monthly_metrics = []
         self.intervention_effects = {}
         self.policy_impacts = {}
+        self.matching_reports = []
         
         # Generate initial population
         self.generate_youth_population()
         self.generate_employer_population()
         
+        # Running totals for the monthly metrics, updated as agents change
+        self.totals = PopulationTotals(self.population)
+        
+        # Average skill shortage of each employer's requirements, refreshed monthly
+        self.refresh_skill_shortage()
+    
+    @staticmethod
+    def _seed_sequence(seed) -> np.random.SeedSequence:
+        """SeedSequence for an engine from its 'seed' config (int, SeedSequence or None)
+        
+        Without a seed one is drawn from the module-level random state, so
+        unseeded engines stay reproducible from the seed set at import.
+        """
+        
+        if isinstance(seed, np.random.SeedSequence):
+            return seed
+        if seed is None:
+            seed = np.random.randint(0, 2**32)
+        return np.random.SeedSequence(seed)
+    
+    @property
+    def youth_agents(self) -> YouthPopulation:
+        """Youth agents as a sequence of YouthAgentView objects over the columnar population"""
+        return self.population
+        
     def load_realistic_data(self):
         """Load realistic data parameters from the data module"""
         
@@ -273,268 +1096,223 @@ class SimulationEngine:
         }
         
     def generate_youth_population(self):
-        """Generate representative youth population based on realistic data"""
+        """Generate representative youth population based on realistic data
         
-        num_agents = self.config.get('num_youth_agents', 10000)
+        Agents are drawn in batches straight into the columnar population,
+        using the same distributions as the per-agent draws via lookup
+        tables indexed by region, gender and education codes.
+        """
         
-        for i in range(num_agents):
-            # Determine region based on population distribution
-            region_prob = np.random.random()
-            if region_prob < 0.173:  # 17.3% in Dhaka
-                region = Region.DHAKA
-            elif region_prob < 0.270:  # 9.7% in Chittagong
-                region = Region.CHITTAGONG
-            elif region_prob < 0.321:  # 5.1% in Sylhet
-                region = Region.SYLHET
-            else:  # 67.9% in rural areas
-                region = Region.RURAL_AREAS
-            
-            # Determine gender
-            gender = 'male' if np.random.random() < 0.512 else 'female'
-            
-            # Determine education level
-            edu_rand = np.random.random() * 100
-            if edu_rand < 8.3:
-                education = 'no_formal_education'
-            elif edu_rand < 24.0:
-                education = 'primary_complete'
-            elif edu_rand < 56.4:
-                education = 'secondary_complete'
-            elif edu_rand < 84.5:
-                education = 'higher_secondary'
-            elif edu_rand < 97.3:
-                education = 'bachelor_degree'
-            else:
-                education = 'master_plus'
-            
-            # Determine employment status
-            emp_rand = np.random.random() * 100
-            if emp_rand < 23.4:
-                employment_status = 'employed_formal'
-            elif emp_rand < 65.2:
-                employment_status = 'employed_informal'
-            elif emp_rand < 82.0:
-                employment_status = 'unemployed_seeking'
-            elif emp_rand < 94.3:
-                employment_status = 'underemployed'
-            else:
-                employment_status = 'not_in_labor_force'
-            
-            # Generate skills based on region and demographics
-            regional_data = self.regional_data[region.value]
-            
-            # English proficiency with variation
-            base_english = regional_data['english_proficiency_avg']
-            english_proficiency = np.clip(np.random.normal(base_english, 0.15), 0, 1)
-            
-            # Digital literacy based on gender and region
-            if region in [Region.DHAKA, Region.CHITTAGONG]:
-                base_digital = 0.67 if gender == 'male' else 0.59
-            else:
-                base_digital = 0.34 if gender == 'male' else 0.22
-            digital_literacy = np.clip(np.random.normal(base_digital, 0.12), 0, 1)
-            
-            # AI familiarity
-            base_ai = regional_data['ai_awareness']
-            ai_familiarity = np.clip(np.random.normal(base_ai, 0.08), 0, 1)
-            
-            # Social factors
-            family_support = self._calculate_family_support(gender, region, education)
-            social_network = np.random.beta(2, 5)  # Skewed towards lower values
-            cultural_constraints = self._calculate_cultural_constraints(gender, region)
-            motivation_level = np.random.beta(3, 2)  # Skewed towards higher values
-            
-            # Economic factors
-            base_income = regional_data['average_monthly_income']
-            if employment_status == 'unemployed_seeking':
-                monthly_income = 0
-            elif employment_status == 'underemployed':
-                monthly_income = base_income * np.random.uniform(0.3, 0.6)
-            else:
-                monthly_income = base_income * np.random.uniform(0.7, 1.3)
-            
-            financial_resources = monthly_income * np.random.uniform(0.5, 3.0)
-            debt_burden = financial_resources * np.random.uniform(0, 0.4)
-            family_pressure = np.random.beta(2, 3) if monthly_income < base_income * 0.8 else np.random.beta(1, 4)
-            
-            # Create youth agent
-            youth = YouthAgent(
-                id=f"youth_{i:06d}",
-                age=np.random.randint(25, 36),
-                gender=gender,
-                region=region,
-                education_level=education,
-                employment_status=employment_status,
-                monthly_income=monthly_income,
-                english_proficiency=english_proficiency,
-                digital_literacy=digital_literacy,
-                ai_familiarity=ai_familiarity,
-                family_support=family_support,
-                social_network_strength=social_network,
-                cultural_constraints=cultural_constraints,
-                motivation_level=motivation_level,
-                financial_resources=financial_resources,
-                debt_burden=debt_burden,
-                family_financial_pressure=family_pressure
-            )
-            
-            # Initialize skill sets
-            youth.traditional_skills = self._generate_traditional_skills(youth)
-            youth.ai_enhanced_skills = self._generate_ai_skills(youth)
-            
-            self.youth_agents.append(youth)
+        num_agents = self.config.get('num_youth_agents', 10000)
+        chunk_size = self.config.get('generation_chunk_size', 1_000_000)
+        
+        self.population = YouthPopulation(num_agents, history_limit=self.config.get('history_limit'))
+        for start in range(0, num_agents, chunk_size):
+            self._generate_youth_batch(slice(start, min(start + chunk_size, num_agents)), self.rng)
+    
+    def _generate_youth_batch(self, rows: slice, rng: np.random.Generator):
+        """Draw one batch of youth agents into the population columns"""
+        
+        population = self.population
+        n = rows.stop - rows.start
+        
+        # Determine region based on population distribution
+        # (17.3% Dhaka, 9.7% Chittagong, 5.1% Sylhet, 67.9% rural areas)
+        region = rng.choice(len(REGIONS), size=n, p=[0.173, 0.097, 0.051, 0.679]).astype(np.int8)
+        
+        # Determine gender
+        gender = np.where(rng.random(n) < 0.512, GENDERS.index('male'), GENDERS.index('female')).astype(np.int8)
+        
+        # Determine education level
+        education_distribution = self.youth_demographics['education_distribution']
+        education_p = np.array([education_distribution[level] for level in EDUCATION_LEVELS]) / 100
+        education = rng.choice(len(EDUCATION_LEVELS), size=n, p=education_p).astype(np.int8)
+        
+        # Determine employment status (in EMPLOYMENT_STATUSES order)
+        status_p = np.array([23.4, 41.8, 16.8, 12.3, 5.7]) / 100
+        employment_status = rng.choice(len(EMPLOYMENT_STATUSES), size=n, p=status_p).astype(np.int8)
+        
+        # Regional lookup tables
+        regional = [self.regional_data[r.value] for r in REGIONS]
+        english_avg = np.array([data['english_proficiency_avg'] for data in regional])
+        ai_awareness = np.array([data['ai_awareness'] for data in regional])
+        average_income = np.array([data['average_monthly_income'] for data in regional], dtype=float)
+        
+        # English proficiency with variation
+        english_proficiency = np.clip(rng.normal(english_avg[region], 0.15), 0, 1)
+        
+        # Digital literacy based on gender and region (rows: rural/urban, columns: male/female)
+        urban = np.isin(region, [REGION_CODES[Region.DHAKA], REGION_CODES[Region.CHITTAGONG]])
+        base_digital = np.array([[0.34, 0.22], [0.67, 0.59]])[urban.astype(int), gender]
+        digital_literacy = np.clip(rng.normal(base_digital, 0.12), 0, 1)
+        
+        # AI familiarity
+        ai_familiarity = np.clip(rng.normal(ai_awareness[region], 0.08), 0, 1)
+        
+        # Social factors
+        family_support = self._calculate_family_support(gender, region, education, rng)
+        social_network = rng.beta(2, 5, n)  # Skewed towards lower values
+        cultural_constraints = self._calculate_cultural_constraints(gender, region, rng)
+        motivation_level = rng.beta(3, 2, n)  # Skewed towards higher values
+        
+        # Economic factors
+        base_income = average_income[region]
+        unemployed = employment_status == STATUS_CODES['unemployed_seeking']
+        underemployed = employment_status == STATUS_CODES['underemployed']
+        income_factor = np.where(underemployed, rng.uniform(0.3, 0.6, n), rng.uniform(0.7, 1.3, n))
+        monthly_income = np.where(unemployed, 0.0, base_income * income_factor)
+        
+        financial_resources = monthly_income * rng.uniform(0.5, 3.0, n)
+        debt_burden = financial_resources * rng.uniform(0, 0.4, n)
+        under_pressure = monthly_income < base_income * 0.8
+        family_pressure = rng.beta(np.where(under_pressure, 2, 1), np.where(under_pressure, 3, 4))
+        
+        population.age[rows] = rng.integers(25, 36, n)
+        population.gender[rows] = gender
+        population.region[rows] = region
+        population.education_level[rows] = education
+        population.employment_status[rows] = employment_status
+        population.monthly_income[rows] = monthly_income
+        population.english_proficiency[rows] = english_proficiency
+        population.digital_literacy[rows] = digital_literacy
+        population.ai_familiarity[rows] = ai_familiarity
+        population.family_support[rows] = family_support
+        population.social_network_strength[rows] = social_network
+        population.cultural_constraints[rows] = cultural_constraints
+        population.motivation_level[rows] = motivation_level
+        population.financial_resources[rows] = financial_resources
+        population.debt_burden[rows] = debt_burden
+        population.family_financial_pressure[rows] = family_pressure
+        
+        # Initialize skill sets
+        population.skills[rows, :len(TRADITIONAL_SKILLS)] = self._generate_traditional_skills(digital_literacy, education, rng)
+        population.skills[rows, len(TRADITIONAL_SKILLS):] = self._generate_ai_skills(ai_familiarity, digital_literacy, rng)
     
     def generate_employer_population(self):
-        """Generate employer agents representing demand side"""
+        """Generate employer agents representing demand side
+        
+        All employers are drawn at once into an EmployerTable; the
+        EmployerAgent list is materialized from it for per-employer access.
+        """
         
         num_employers = self.config.get('num_employer_agents', 1000)
+        rng = self.rng
         
-        for i in range(num_employers):
-            # Determine employer type and characteristics
-            employer_type = np.random.choice(
-                ['local', 'international', 'startup', 'enterprise'],
-                p=[0.4, 0.3, 0.2, 0.1]
-            )
-            
-            # Region distribution for employers
-            if employer_type == 'international':
-                region = np.random.choice([Region.DHAKA, Region.CHITTAGONG], p=[0.7, 0.3])
-            else:
-                region = np.random.choice(list(Region), p=[0.4, 0.25, 0.15, 0.2])
-            
-            # Industry distribution
-            industry = np.random.choice([
-                'technology', 'content_creation', 'customer_service',
-                'education', 'consulting', 'e_commerce', 'marketing'
-            ], p=[0.25, 0.18, 0.15, 0.12, 0.1, 0.12, 0.08])
-            
-            # Company size
-            size = np.random.choice(['small', 'medium', 'large'], p=[0.6, 0.3, 0.1])
-            
-            # Job openings based on size and type
-            if size == 'small':
-                monthly_openings = np.random.poisson(2)
-            elif size == 'medium':
-                monthly_openings = np.random.poisson(8)
-            else:
-                monthly_openings = np.random.poisson(20)
-            
-            # Salary ranges based on industry and type
-            base_salary = self._calculate_base_salary(employer_type, industry, region)
-            salary_range = (base_salary * 0.8, base_salary * 1.5)
-            
-            # AI integration level
-            ai_integration = np.random.beta(2, 3) if employer_type in ['startup', 'enterprise'] else np.random.beta(1, 4)
-            
-            # Skill requirements
-            skill_requirements = self._generate_skill_requirements(industry, ai_integration)
-            
-            employer = EmployerAgent(
-                id=f"employer_{i:04d}",
-                type=employer_type,
-                region=region,
-                industry=industry,
-                size=size,
-                monthly_job_openings=monthly_openings,
-                skill_requirements=skill_requirements,
-                salary_range=salary_range,
-                remote_work_capability=np.random.beta(3, 2) if employer_type == 'international' else np.random.beta(2, 3),
-                ai_integration_level=ai_integration,
-                human_ai_collaboration_need=ai_integration * np.random.uniform(0.7, 1.0),
-                experience_preference=np.random.beta(2, 2),
-                certification_importance=np.random.beta(3, 2),
-                cultural_fit_importance=np.random.beta(2, 2)
-            )
-            
-            self.employer_agents.append(employer)
-    
-    def _calculate_family_support(self, gender: str, region: Region, education: str) -> float:
-        """Calculate family support probability based on demographics"""
+        # Determine employer type and characteristics (in EMPLOYER_TYPES order)
+        employer_type = rng.choice(len(EMPLOYER_TYPES), size=num_employers, p=[0.4, 0.3, 0.2, 0.1]).astype(np.int8)
+        international = employer_type == EMPLOYER_TYPES.index('international')
         
-        base_support = 0.6
+        # Region distribution for employers
+        international_region = np.array([REGION_CODES[Region.DHAKA], REGION_CODES[Region.CHITTAGONG]])[
+            rng.choice(2, size=num_employers, p=[0.7, 0.3])
+        ]
+        other_region = rng.choice(len(REGIONS), size=num_employers, p=[0.4, 0.25, 0.15, 0.2])
+        region = np.where(international, international_region, other_region).astype(np.int8)
+        
+        # Industry distribution (in INDUSTRIES order)
+        industry = rng.choice(len(INDUSTRIES), size=num_employers,
+                              p=[0.25, 0.18, 0.15, 0.12, 0.1, 0.12, 0.08]).astype(np.int8)
+        
+        # Company size
+        size = rng.choice(len(COMPANY_SIZES), size=num_employers, p=[0.6, 0.3, 0.1]).astype(np.int8)
+        
+        # Job openings based on size (small, medium, large)
+        monthly_openings = rng.poisson(np.array([2, 8, 20])[size])
+        
+        # Salary ranges based on industry and type
+        base_salary = self._calculate_base_salary(employer_type, industry, region)
+        
+        # AI integration level
+        startup_or_enterprise = np.isin(employer_type, [EMPLOYER_TYPES.index('startup'), EMPLOYER_TYPES.index('enterprise')])
+        ai_integration = rng.beta(np.where(startup_or_enterprise, 2, 1), np.where(startup_or_enterprise, 3, 4))
+        
+        # Skill requirements
+        requirements, required = self._generate_skill_requirements(industry, ai_integration, rng)
+        
+        self.employers = EmployerTable(
+            employer_type=employer_type,
+            region=region,
+            industry=industry,
+            size=size,
+            monthly_job_openings=monthly_openings,
+            requirements=requirements,
+            required=required,
+            salary_min=base_salary * 0.8,
+            salary_max=base_salary * 1.5,
+            remote_work_capability=rng.beta(np.where(international, 3, 2), np.where(international, 2, 3)),
+            ai_integration_level=ai_integration,
+            human_ai_collaboration_need=ai_integration * rng.uniform(0.7, 1.0, num_employers),
+            experience_preference=rng.beta(2, 2, num_employers),
+            certification_importance=rng.beta(3, 2, num_employers),
+            cultural_fit_importance=rng.beta(2, 2, num_employers)
+        )
+        self.employer_agents = self.employers.to_agents()
+    
+    def _calculate_family_support(self, gender: np.ndarray, region: np.ndarray, education: np.ndarray,
+                                  rng: np.random.Generator) -> np.ndarray:
+        """Calculate family support based on demographics (gender, region and education codes)"""
+        
+        base_support = np.full(len(gender), 0.6)
         
         # Gender effect
-        if gender == 'female':
-            base_support *= 0.85
+        base_support *= np.where(gender == GENDERS.index('female'), 0.85, 1.0)
         
         # Region effect
-        if region == Region.DHAKA:
-            base_support *= 1.15
-        elif region == Region.RURAL_AREAS:
-            base_support *= 0.9
+        region_effect = np.ones(len(REGIONS))
+        region_effect[REGION_CODES[Region.DHAKA]] = 1.15
+        region_effect[REGION_CODES[Region.RURAL_AREAS]] = 0.9
+        base_support *= region_effect[region]
         
         # Education effect
-        if education in ['bachelor_degree', 'master_plus']:
-            base_support *= 1.2
-        elif education in ['no_formal_education', 'primary_complete']:
-            base_support *= 0.8
+        education_effect = np.array([0.8, 0.8, 1.0, 1.0, 1.2, 1.2])  # EDUCATION_LEVELS order
+        base_support *= education_effect[education]
         
-        return np.clip(np.random.normal(base_support, 0.15), 0, 1)
+        return np.clip(rng.normal(base_support, 0.15), 0, 1)
     
-    def _calculate_cultural_constraints(self, gender: str, region: Region) -> float:
-        """Calculate cultural constraints factor"""
+    def _calculate_cultural_constraints(self, gender: np.ndarray, region: np.ndarray,
+                                        rng: np.random.Generator) -> np.ndarray:
+        """Calculate cultural constraints factor (gender and region codes)"""
         
-        base_constraints = 0.3
+        base_constraints = np.full(len(gender), 0.3)
         
-        if gender == 'female':
-            base_constraints *= 1.8
-            
-        if region == Region.RURAL_AREAS:
-            base_constraints *= 1.5
-        elif region == Region.DHAKA:
-            base_constraints *= 0.7
+        base_constraints *= np.where(gender == GENDERS.index('female'), 1.8, 1.0)
         
-        return np.clip(np.random.normal(base_constraints, 0.12), 0, 1)
+        region_effect = np.ones(len(REGIONS))
+        region_effect[REGION_CODES[Region.RURAL_AREAS]] = 1.5
+        region_effect[REGION_CODES[Region.DHAKA]] = 0.7
+        base_constraints *= region_effect[region]
+        
+        return np.clip(rng.normal(base_constraints, 0.12), 0, 1)
     
-    def _generate_traditional_skills(self, youth: YouthAgent) -> Dict[str, float]:
-        """Generate traditional skill set for youth agent"""
+    def _generate_traditional_skills(self, digital_literacy: np.ndarray, education: np.ndarray,
+                                     rng: np.random.Generator) -> np.ndarray:
+        """Generate traditional skill levels, one column per TRADITIONAL_SKILLS entry"""
         
-        skills = {}
-        skill_categories = [
-            'graphic_design', 'web_development', 'content_writing',
-            'digital_marketing', 'data_entry', 'video_editing',
-            'translation', 'customer_service'
-        ]
+        # Base skill level influenced by education and digital literacy
+        base_level = digital_literacy[:, None] * 0.6 + rng.uniform(0, 0.4, (len(digital_literacy), len(TRADITIONAL_SKILLS)))
         
-        for skill in skill_categories:
-            # Base skill level influenced by education and digital literacy
-            base_level = youth.digital_literacy * 0.6 + np.random.uniform(0, 0.4)
-            
-            # Education bonus
-            if youth.education_level in ['bachelor_degree', 'master_plus']:
-                base_level += 0.2
-            elif youth.education_level in ['higher_secondary']:
-                base_level += 0.1
-            
-            skills[skill] = np.clip(base_level, 0, 1)
+        # Education bonus
+        education_bonus = np.array([0.0, 0.0, 0.0, 0.1, 0.2, 0.2])  # EDUCATION_LEVELS order
+        base_level += education_bonus[education][:, None]
         
-        return skills
+        return np.clip(base_level, 0, 1)
     
-    def _generate_ai_skills(self, youth: YouthAgent) -> Dict[str, float]:
-        """Generate AI-enhanced skill set for youth agent"""
+    def _generate_ai_skills(self, ai_familiarity: np.ndarray, digital_literacy: np.ndarray,
+                            rng: np.random.Generator) -> np.ndarray:
+        """Generate AI-enhanced skill levels, one column per AI_SKILLS entry"""
         
-        skills = {}
-        ai_skill_categories = [
-            'prompt_engineering', 'ai_content_creation', 'data_annotation',
-            'ai_customer_support', 'human_ai_collaboration'
-        ]
+        # Base AI skill influenced by AI familiarity and digital literacy
+        base_level = (ai_familiarity * 0.7 + digital_literacy * 0.3) * 0.5
         
-        for skill in ai_skill_categories:
-            # Base AI skill influenced by AI familiarity and digital literacy
-            base_level = (youth.ai_familiarity * 0.7 + youth.digital_literacy * 0.3) * 0.5
-            
-            # Add some randomness
-            base_level += np.random.uniform(0, 0.3)
-            
-            skills[skill] = np.clip(base_level, 0, 1)
+        # Add some randomness
+        base_level = base_level[:, None] + rng.uniform(0, 0.3, (len(ai_familiarity), len(AI_SKILLS)))
         
-        return skills
+        return np.clip(base_level, 0, 1)
     
-    def _calculate_base_salary(self, employer_type: str, industry: str, region: Region) -> float:
-        """Calculate base salary for employer"""
+    def _calculate_base_salary(self, employer_type: np.ndarray, industry: np.ndarray, region: np.ndarray) -> np.ndarray:
+        """Calculate base salary for employers (employer type, industry and region codes)"""
         
-        regional_data = self.regional_data[region.value]
-        base = regional_data['average_monthly_income']
+        base = np.array([self.regional_data[r.value]['average_monthly_income'] for r in REGIONS], dtype=float)[region]
         
         # Employer type multiplier
         type_multipliers = {
@@ -555,55 +1333,62 @@ class SimulationEngine:
             'e_commerce': 1.2
         }
         
-        return base * type_multipliers.get(employer_type, 1.0) * industry_multipliers.get(industry, 1.0)
+        type_table = np.array([type_multipliers.get(t, 1.0) for t in EMPLOYER_TYPES])
+        industry_table = np.array([industry_multipliers.get(i, 1.0) for i in INDUSTRIES])
+        
+        return base * type_table[employer_type] * industry_table[industry]
     
-    def _generate_skill_requirements(self, industry: str, ai_integration: float) -> Dict[str, float]:
-        """Generate skill requirements for employer"""
+    def _generate_skill_requirements(self, industry: np.ndarray, ai_integration: np.ndarray,
+                                     rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate skill requirement matrix and required-skill mask for employers"""
         
-        requirements = {}
+        # Required skills per industry code, as a (n_industries x n_skills) mask
+        industry_mask = np.zeros((len(INDUSTRIES), len(SKILL_NAMES)), dtype=bool)
+        np.put_along_axis(industry_mask, INDUSTRY_SKILL_INDEX, True, axis=1)
+        required = industry_mask[industry]
         
-        # Base requirements by industry
-        industry_skills = {
-            'technology': ['web_development', 'prompt_engineering', 'human_ai_collaboration'],
-            'content_creation': ['content_writing', 'ai_content_creation', 'graphic_design'],
-            'customer_service': ['customer_service', 'ai_customer_support', 'translation'],
-            'education': ['content_writing', 'ai_content_creation', 'human_ai_collaboration'],
-            'consulting': ['human_ai_collaboration', 'prompt_engineering', 'data_annotation'],
-            'e_commerce': ['digital_marketing', 'ai_content_creation', 'customer_service'],
-            'marketing': ['digital_marketing', 'ai_content_creation', 'data_annotation']
-        }
+        n = len(industry)
+        is_ai_skill = np.array([
+            'ai_' in skill or skill in ['prompt_engineering', 'human_ai_collaboration']
+            for skill in SKILL_NAMES
+        ])
         
-        relevant_skills = industry_skills.get(industry, ['content_writing', 'customer_service'])
+        # AI skills requirement influenced by AI integration level, traditional skills uniform
+        ai_levels = ai_integration[:, None] * rng.uniform(0.6, 1.0, (n, len(SKILL_NAMES)))
+        traditional_levels = rng.uniform(0.4, 0.8, (n, len(SKILL_NAMES)))
+        requirements = np.where(is_ai_skill, ai_levels, traditional_levels)
         
-        for skill in relevant_skills:
-            if 'ai_' in skill or skill in ['prompt_engineering', 'human_ai_collaboration']:
-                # AI skills requirement influenced by AI integration level
-                requirements[skill] = ai_integration * np.random.uniform(0.6, 1.0)
-            else:
-                # Traditional skills
-                requirements[skill] = np.random.uniform(0.4, 0.8)
-        
-        return requirements
+        return np.where(required, requirements, 0.0), required
     
     def run_simulation(self) -> Dict[str, Any]:
-        """Run the complete simulation"""
+        """Run the complete simulation
+        
+        Only months not yet simulated are run, so an engine restored with
+        from_checkpoint carries on from its checkpoint. With the
+        'checkpoint_every' config a checkpoint is saved after every that
+        many months to 'checkpoint_path' (default 'simulation_checkpoint';
+        a '{month}' field names one checkpoint per month, otherwise each
+        replaces the last).
+        """
+        
+        if self.months_completed:
+            print(f"Resuming simulation at month {self.months_completed} of {self.max_months}")
+        else:
+            print(f"Starting simulation with {len(self.youth_agents)} youth agents and {len(self.employer_agents)} employers")
+            print(f"Simulation duration: {self.max_months} months")
         
-        print(f"Starting simulation with {len(self.youth_agents)} youth agents and {len(self.employer_agents)} employers")
-        print(f"Simulation duration: {self.max_months} months")
+        checkpoint_every = self.config.get('checkpoint_every')
+        checkpoint_path = self.config.get('checkpoint_path', 'simulation_checkpoint')
         
-        for month in range(self.max_months):
-            self.current_month = month
-            
-            # Monthly simulation steps
-            self.update_market_conditions()
-            self.process_training_programs()
-            self.match_jobs()
-            self.update_agent_states()
-            self.calculate_monthly_metrics()
+        for month in range(self.months_completed, self.max_months):
+            self.run_month(month)
             
             # Progress reporting
             if month % 6 == 0:
                 print(f"Month {month}: {self.get_employment_rate():.1f}% employment rate")
+            
+            if checkpoint_every and self.months_completed % checkpoint_every == 0 and self.months_completed < self.max_months:
+                self.save_checkpoint(checkpoint_path.format(month=self.months_completed))
         
         # Generate final results
         results = self.generate_results()
@@ -615,6 +1400,93 @@ class SimulationEngine:
         
         return results
     
+    def run_month(self, month: int):
+        """Simulate one month"""
+        
+        self.current_month = month
+        
+        # Monthly simulation steps
+        self.update_market_conditions()
+        self.process_training_programs()
+        self.match_jobs()
+        self.update_agent_states()
+        self.calculate_monthly_metrics()
+        
+        self.months_completed = month + 1
+    
+    def save_checkpoint(self, path: str = 'simulation_checkpoint') -> str:
+        """Save the complete engine state to the checkpoint directory ``path``
+        
+        Covers the population (columns, skills and event logs), employers,
+        the market data mutated each month, metrics, running totals and the
+        random generator state, so a run resumed with from_checkpoint gives
+        exactly the results of an uninterrupted one.
+        """
+        
+        population_arrays, population_settings = self.population.state()
+        arrays = {f'population.{name}': array for name, array in population_arrays.items()}
+        arrays.update({f'employers.{name}': array for name, array in self.employers.state().items()})
+        
+        state = {
+            'config': self.config,
+            'current_month': self.current_month,
+            'months_completed': self.months_completed,
+            'max_months': self.max_months,
+            'seed_sequence': self.seed_sequence,
+            'rng_state': self.rng.bit_generator.state,
+            'ai_skills_demand': self.ai_skills_demand,
+            'monthly_metrics': self.monthly_metrics,
+            'intervention_effects': self.intervention_effects,
+            'policy_impacts': self.policy_impacts,
+            'matching_reports': self.matching_reports,
+            'population': population_settings,
+            'totals': self.totals.state()
+        }
+        return write_checkpoint(path, arrays, state)
+    
+    @classmethod
+    def from_checkpoint(cls, path: str = 'simulation_checkpoint', mmap: bool = False,
+                        config_overrides: Optional[Dict[str, Any]] = None) -> 'SimulationEngine':
+        """Restore an engine saved by save_checkpoint, ready to continue with run_simulation
+        
+        With mmap=True the population and employer arrays are memory-mapped
+        copy-on-write from the checkpoint files instead of read up front,
+        which makes resuming a large population nearly instant; pages are
+        loaded as the simulation touches them. config_overrides are merged
+        into the saved config and apply to the months still to run.
+        """
+        
+        arrays, state = read_checkpoint(path, mmap)
+        
+        def group(prefix: str) -> Dict[str, np.ndarray]:
+            return {name[len(prefix):]: array for name, array in arrays.items() if name.startswith(prefix)}
+        
+        engine = cls.__new__(cls)
+        engine.config = state['config']
+        engine.current_month = state['current_month']
+        engine.months_completed = state['months_completed']
+        engine.max_months = state['max_months']
+        if config_overrides:
+            engine.config = {**engine.config, **config_overrides}
+            engine.max_months = engine.config.get('simulation_months', engine.max_months)
+        engine.seed_sequence = state['seed_sequence']
+        engine.rng = np.random.default_rng(engine.seed_sequence)
+        engine.rng.bit_generator.state = state['rng_state']
+        
+        engine.load_realistic_data()
+        engine.ai_skills_demand = state['ai_skills_demand']
+        engine.monthly_metrics = state['monthly_metrics']
+        engine.intervention_effects = state['intervention_effects']
+        engine.policy_impacts = state['policy_impacts']
+        engine.matching_reports = state['matching_reports']
+        
+        engine.population = YouthPopulation.from_state(group('population.'), state['population'])
+        engine.employers = EmployerTable(**group('employers.'))
+        engine.employer_agents = engine.employers.to_agents()
+        engine.totals = PopulationTotals.from_state(engine.population, state['totals'])
+        engine.refresh_skill_shortage()
+        return engine
+    
     def update_market_conditions(self):
         """Update market conditions for current month"""
         
@@ -628,34 +1500,177 @@ class SimulationEngine:
                 data['average_hourly_rate_usd'] *= 1.02  # 2% monthly increase for high shortage
             elif data['skill_shortage_index'] < 0.3:
                 data['average_hourly_rate_usd'] *= 0.99  # 1% monthly decrease for oversupply
+        
+        self.refresh_skill_shortage()
+    
+    def refresh_skill_shortage(self):
+        """Precompute the average shortage index of every employer's required skills
+        
+        Skills without market data count as zero shortage. Slots are summed
+        in requirement order so the averages equal the per-job loop in
+        calculate_hiring_probability.
+        """
+        
+        shortage = np.zeros(len(SKILL_NAMES))
+        for skill, data in self.ai_skills_demand.items():
+            if skill in SKILL_INDEX:
+                shortage[SKILL_INDEX[skill]] = data['skill_shortage_index']
+        
+        req_index = self.employers.req_index
+        total = np.zeros(len(req_index))
+        for slot in range(req_index.shape[1]):
+            total = total + shortage[req_index[:, slot]]
+        self.employer_skill_shortage = total / req_index.shape[1] if req_index.shape[1] else total
     
     def process_training_programs(self):
-        """Process training program participation and outcomes"""
+        """Process training program participation and outcomes
+        
+        Eligibility, priority scores and participant selection work on
+        population columns; progress for every active participant is then
+        updated in one vectorized pass (see _update_training_progress).
+        """
         
         # Identify eligible youth for training programs
-        eligible_youth = [
-            youth for youth in self.youth_agents
-            if not youth.program_participation and
-            youth.employment_status in ['unemployed_seeking', 'underemployed'] and
-            youth.motivation_level > 0.5
-        ]
+        population = self.population
+        eligible = np.flatnonzero(
+            ~population.program_participation &
+            population.status_mask('unemployed_seeking', 'underemployed') &
+            (population.motivation_level > 0.5)
+        )
         
         # Program capacity constraints
         monthly_capacity = self.config.get('monthly_training_capacity', 500)
         
         # Select participants based on eligibility criteria
-        participants = self.select_training_participants(eligible_youth, monthly_capacity)
+        participants = self._select_training_participants(eligible, monthly_capacity)
         
         # Enroll participants
-        for youth in participants:
-            youth.program_participation = True
-            youth.months_in_program = 1
+        population.program_participation[participants] = True
+        population.months_in_program[participants] = 1
+        self.totals.in_training += len(participants)
         
         # Update existing participants
-        for youth in self.youth_agents:
-            if youth.program_participation:
-                youth.months_in_program += 1
-                self.update_training_progress(youth)
+        active = np.flatnonzero(population.program_participation)
+        population.months_in_program[active] += 1
+        self._update_training_progress(active)
+    
+    def _training_priority_scores(self, index: np.ndarray) -> np.ndarray:
+        """Array version of calculate_training_priority_score for the agents in index"""
+        
+        population = self.population
+        status = population.employment_status[index]
+        
+        score = population.motivation_level[index] * 0.3
+        score += population.family_support[index] * 0.2
+        score += population.digital_literacy[index] * 0.2
+        score += np.where(status == STATUS_CODES['unemployed_seeking'], 0.15,
+                          np.where(status == STATUS_CODES['underemployed'], 0.10, 0.0))
+        score += (1 - population.cultural_constraints[index]) * 0.1
+        score += np.where(population.gender[index] == GENDERS.index('female'), 0.05, 0.0)
+        
+        return score
+    
+    def _select_training_participants(self, eligible: np.ndarray, capacity: int) -> np.ndarray:
+        """Rows of the capacity highest-priority eligible youth
+        
+        Same selection as select_training_participants: ties on the cutoff
+        score go to the earlier rows, as with a stable descending sort.
+        """
+        
+        if capacity <= 0 or len(eligible) == 0:
+            return eligible[:0]
+        if capacity >= len(eligible):
+            return eligible
+        
+        scores = self._training_priority_scores(eligible)
+        kth = len(scores) - capacity
+        cutoff = scores[np.argpartition(scores, kth)[kth]]
+        above = scores > cutoff
+        tied = np.flatnonzero(scores == cutoff)[:capacity - int(above.sum())]
+        
+        return np.sort(np.concatenate([eligible[above], eligible[tied]]))
+    
+    def _update_training_progress(self, active: np.ndarray):
+        """Array version of update_training_progress for every participant in active
+        
+        Random skill gains are drawn in one block in the same per-agent,
+        per-skill order as the per-agent methods, so both give identical
+        results for the same generator state.
+        """
+        
+        population = self.population
+        digital_literacy = population.digital_literacy[active]
+        
+        # Determine training type based on youth characteristics (TRAINING_TYPES codes)
+        training_type = np.where(
+            (digital_literacy > 0.7) & (population.ai_familiarity[active] > 0.3), 2,
+            np.where(digital_literacy > 0.5, 1, 0)
+        )
+        
+        # Calculate completion probability
+        adjustments = population.motivation_level[active] * 0.2
+        adjustments += population.family_support[active] * 0.15
+        adjustments += (1 - population.cultural_constraints[active]) * 0.1
+        adjustments += (1 - population.family_financial_pressure[active]) * 0.1
+        adjustments += digital_literacy * 0.1
+        base_prob = np.array([TRAINING_COMPLETION_RATES[t] for t in TRAINING_TYPES])[training_type]
+        completion_prob = np.clip(base_prob + adjustments - 0.3, 0.1, 0.95)
+        
+        # Update completion rate
+        months = population.months_in_program[active]
+        old_completion = population.training_completion_rate[active]
+        completion_rate = np.minimum(months / 6, 1.0) * completion_prob
+        population.training_completion_rate[active] = completion_rate
+        
+        # Skill development based on training progress (after 20% completion)
+        learning = completion_rate > 0.2
+        learners = active[learning]
+        learner_type = training_type[learning]
+        progress = completion_rate[learning]
+        old_skills = population.skills[learners]
+        
+        num_draws = np.array([len(TRAINING_SKILL_GAINS[t][0]) for t in TRAINING_TYPES])[learner_type]
+        draws = self.rng.uniform(0.8, 1.2, int(num_draws.sum()))
+        first_draw = np.cumsum(num_draws) - num_draws
+        
+        for code, name in enumerate(TRAINING_TYPES):
+            of_type = np.flatnonzero(learner_type == code)
+            if not len(of_type):
+                continue
+            skills, gain = TRAINING_SKILL_GAINS[name]
+            rows, columns = learners[of_type], [SKILL_INDEX[skill] for skill in skills]
+            for j, column in enumerate(columns):
+                improvement = progress[of_type] * gain * draws[first_draw[of_type] + j]
+                population.skills[rows, column] = np.minimum(population.skills[rows, column].astype(float) + improvement, 1.0)
+            
+            if name == 'basic_ai_literacy':
+                population.digital_literacy[rows] = np.minimum(population.digital_literacy[rows] + progress[of_type] * 0.2, 1.0)
+        
+        # Check for program completion
+        done = (months >= 6) & (completion_rate > 0.8)
+        completed = active[done]
+        population.program_participation[completed] = False
+        population.has_experience[completed] = True
+        population.job_ai_collaboration[completed] = False
+        
+        ai_columns = slice(len(TRADITIONAL_SKILLS), None)
+        population.skills[completed, ai_columns] = np.minimum(population.skills[completed, ai_columns].astype(float) + 0.2, 1.0)
+        population.motivation_level[completed] = np.minimum(population.motivation_level[completed] + 0.1, 1.0)
+        population.social_network_strength[completed] = np.minimum(population.social_network_strength[completed] + 0.15, 1.0)
+        
+        # Record skill development and completions
+        population.events['skill_development_history'].extend(
+            learners, self.current_month, 'skill_development', category=learner_type, value=progress
+        )
+        population.events['employment_history'].extend(
+            completed, self.current_month, 'training_completed',
+            category=training_type[done], value=completion_rate[done]
+        )
+        
+        # Completions only happen to learners, so their rows cover every skill change
+        self.totals.in_training -= len(completed)
+        self.totals.completed_training += int((completion_rate >= 0.8).sum() - (old_completion >= 0.8).sum())
+        self.totals.skills_changed(old_skills, population.skills[learners])
     
     def select_training_participants(self, eligible_youth: List[YouthAgent], capacity: int) -> List[YouthAgent]:
         """Select training participants based on prioritization criteria"""
@@ -706,6 +1721,10 @@ class SimulationEngine:
     def update_training_progress(self, youth: YouthAgent):
         """Update training progress and skill development"""
         
+        tracked = self.totals.tracks(youth)
+        if tracked:
+            was_participating, old_completion = youth.program_participation, youth.training_completion_rate
+        
         # Determine training type based on youth characteristics
         training_type = self.determine_training_type(youth)
         
@@ -723,6 +1742,10 @@ class SimulationEngine:
         if youth.months_in_program >= 6 and youth.training_completion_rate > 0.8:
             youth.program_participation = False
             self.record_training_completion(youth, training_type)
+        
+        if tracked:
+            self.totals.training_changed(was_participating, youth.program_participation,
+                                         old_completion, youth.training_completion_rate)
     
     def determine_training_type(self, youth: YouthAgent) -> str:
         """Determine appropriate training type for youth"""
@@ -737,13 +1760,7 @@ class SimulationEngine:
     def calculate_completion_probability(self, youth: YouthAgent, training_type: str) -> float:
         """Calculate probability of training completion"""
         
-        base_rates = {
-            'basic_ai_literacy': 0.78,
-            'intermediate_ai_skills': 0.71,
-            'advanced_ai_collaboration': 0.65
-        }
-        
-        base_prob = base_rates.get(training_type, 0.75)
+        base_prob = TRAINING_COMPLETION_RATES.get(training_type, 0.75)
         
         # Adjust based on individual factors
         adjustments = [
@@ -757,31 +1774,26 @@ class SimulationEngine:
         final_prob = base_prob + sum(adjustments) - 0.3  # Normalize
         return np.clip(final_prob, 0.1, 0.95)
     
-    def update_skills_from_training(self, youth: YouthAgent, training_type: str):
+    def update_skills_from_training(self, youth: YouthAgent, training_type: str,
+                                    rng: Optional[np.random.Generator] = None):
         """Update youth skills based on training progress"""
         
+        rng = rng or self.rng
         progress_factor = youth.training_completion_rate
+        old_skills = self._skill_row(youth)
         
+        # Improve the AI skills targeted by this training type
+        skills, gain = TRAINING_SKILL_GAINS.get(training_type, ([], 0))
+        for skill in skills:
+            improvement = progress_factor * gain * rng.uniform(0.8, 1.2)
+            youth.ai_enhanced_skills[skill] = min(youth.ai_enhanced_skills[skill] + improvement, 1.0)
+        
+        # Basic AI literacy also improves digital literacy
         if training_type == 'basic_ai_literacy':
-            # Improve basic AI skills
-            for skill in ['ai_content_creation', 'data_annotation']:
-                improvement = progress_factor * 0.3 * np.random.uniform(0.8, 1.2)
-                youth.ai_enhanced_skills[skill] = min(youth.ai_enhanced_skills[skill] + improvement, 1.0)
-            
-            # Improve digital literacy
             youth.digital_literacy = min(youth.digital_literacy + progress_factor * 0.2, 1.0)
         
-        elif training_type == 'intermediate_ai_skills':
-            # Improve intermediate AI skills
-            for skill in ['prompt_engineering', 'ai_customer_support', 'ai_content_creation']:
-                improvement = progress_factor * 0.4 * np.random.uniform(0.8, 1.2)
-                youth.ai_enhanced_skills[skill] = min(youth.ai_enhanced_skills[skill] + improvement, 1.0)
-        
-        elif training_type == 'advanced_ai_collaboration':
-            # Improve advanced AI skills
-            for skill in ['human_ai_collaboration', 'prompt_engineering']:
-                improvement = progress_factor * 0.5 * np.random.uniform(0.8, 1.2)
-                youth.ai_enhanced_skills[skill] = min(youth.ai_enhanced_skills[skill] + improvement, 1.0)
+        if old_skills is not None:
+            self.totals.skills_changed(old_skills, self._skill_row(youth))
         
         # Record skill development
         youth.skill_development_history.append({
@@ -796,10 +1808,14 @@ class SimulationEngine:
         
         # Final skill boost upon completion
         completion_bonus = 0.2
+        old_skills = self._skill_row(youth)
         
         for skill in youth.ai_enhanced_skills:
             youth.ai_enhanced_skills[skill] = min(youth.ai_enhanced_skills[skill] + completion_bonus, 1.0)
         
+        if old_skills is not None:
+            self.totals.skills_changed(old_skills, self._skill_row(youth))
+        
         # Improve other attributes
         youth.motivation_level = min(youth.motivation_level + 0.1, 1.0)
         youth.social_network_strength = min(youth.social_network_strength + 0.15, 1.0)
@@ -811,15 +1827,19 @@ class SimulationEngine:
             'training_type': training_type,
             'completion_rate': youth.training_completion_rate
         })
+        
+        # The latest employment event is no longer a job
+        if self.totals.tracks(youth):
+            youth.has_experience = True
+            youth.job_ai_collaboration = False
     
     def match_jobs(self):
         """Match youth with available jobs"""
         
         # Get available youth (unemployed or underemployed)
-        available_youth = [
-            youth for youth in self.youth_agents
-            if youth.employment_status in ['unemployed_seeking', 'underemployed']
-        ]
+        available_youth = self.population.select(
+            np.flatnonzero(self.population.status_mask('unemployed_seeking', 'underemployed'))
+        )
         
         # Generate job opportunities for this month
         job_opportunities = self.generate_monthly_jobs()
@@ -827,71 +1847,235 @@ class SimulationEngine:
         # Perform matching
         matches = self.perform_job_matching(available_youth, job_opportunities)
         
-        # Apply matches
-        for youth, job in matches:
-            self.assign_job(youth, job)
-    
-    def generate_monthly_jobs(self) -> List[Dict[str, Any]]:
-        """Generate job opportunities for the current month"""
-        
-        jobs = []
-        
-        for employer in self.employer_agents:
-            # Number of jobs this month (Poisson distribution)
-            num_jobs = np.random.poisson(employer.monthly_job_openings)
-            
-            for _ in range(num_jobs):
-                # Generate job characteristics
-                job = {
-                    'employer_id': employer.id,
-                    'employer_type': employer.type,
-                    'industry': employer.industry,
-                    'region': employer.region,
-                    'skill_requirements': employer.skill_requirements.copy(),
-                    'salary_min': employer.salary_range[0],
-                    'salary_max': employer.salary_range[1],
-                    'remote_work': np.random.random() < employer.remote_work_capability,
-                    'ai_collaboration_required': np.random.random() < employer.human_ai_collaboration_need,
-                    'experience_required': np.random.random() < employer.experience_preference,
-                    'certification_required': np.random.random() < employer.certification_importance
-                }
-                
-                jobs.append(job)
-        
-        return jobs
+        # Apply matches, pricing all of them in one pass
+        salaries = self.calculate_job_salaries(matches)
+        for (youth, job), salary in zip(matches, salaries):
+            self.assign_job(youth, job, salary)
+    
+    def generate_monthly_jobs(self, rng: Optional[np.random.Generator] = None) -> JobTable:
+        """Generate job opportunities for the current month
+        
+        Job counts for all employers come from one Poisson draw and the
+        per-job flags from one Bernoulli pass over the whole table.
+        """
+        
+        employers = self.employers
+        rng = rng or self.rng
+        
+        # Number of jobs this month (Poisson distribution)
+        num_jobs = rng.poisson(employers.monthly_job_openings)
+        employer_index = np.repeat(np.arange(len(employers)), num_jobs)
+        total_jobs = len(employer_index)
+        
+        # Generate job characteristics
+        flags = rng.random((4, total_jobs))
+        return JobTable(
+            employers=employers,
+            employer_index=employer_index,
+            remote_work=flags[0] < employers.remote_work_capability[employer_index],
+            ai_collaboration_required=flags[1] < employers.human_ai_collaboration_need[employer_index],
+            experience_required=flags[2] < employers.experience_preference[employer_index],
+            certification_required=flags[3] < employers.certification_importance[employer_index]
+        )
     
     def perform_job_matching(self, youth_list: List[YouthAgent], job_list: List[Dict[str, Any]]) -> List[Tuple[YouthAgent, Dict[str, Any]]]:
-        """Perform job matching between youth and opportunities"""
+        """Perform job matching between youth and opportunities
+        
+        The 'matching_mode' config selects 'exact' greedy matching over every
+        pair above the threshold, 'indexed' matching with the same result that
+        skips bucket pairs whose score bound cannot clear the threshold, or
+        'top_k' matching over only the best 'matching_top_k' candidates per
+        youth (or per job, see 'matching_top_k_axis'), 'sharded' matching
+        that runs greedy matching per region on 'matching_workers' threads and
+        then one global pass for remote jobs and cross-region moves, or
+        'optimal' matching that maximizes the total match score over the same
+        top-k candidate lists instead of taking the best pairs first, or
+        'deferred_acceptance' matching in which youth choose among their
+        top-k candidate jobs by salary and employers keep the best-matching
+        applicant (the youth-optimal stable matching).
+        """
+        
+        if not youth_list or not job_list:
+            return []
+        
+        # Additional probability check based on market conditions (calculate_hiring_probability as arrays)
+        accept = HiringCheck(job_shortage=self._job_skill_shortage(job_list), rng=self.rng,
+                             block_size=self.config.get('hiring_draw_block', DEFAULT_DRAW_BLOCK))
+        
+        assignments = self._assign_jobs(youth_list, job_list, accept, self.config.get('matching_mode', 'exact'))
+        accept.settle()
+        
+        if self.config.get('report_matching_gap', False) and self.config.get('matching_mode', 'exact') != 'exact':
+            self.matching_reports.append({'month': self.current_month, **self.compare_matching_modes(youth_list, job_list)})
+        
+        return [(youth_list[y], job_list[j]) for y, j in assignments]
+    
+    def _assign_jobs(self, youth_list: List[YouthAgent], job_list: List[Dict[str, Any]], accept, mode: str) -> List[Tuple[int, int]]:
+        """Score candidates and assign jobs with the selected matching mode"""
+        
+        youth_arrays = self._youth_match_arrays(youth_list)
+        job_arrays = self._job_match_arrays(job_list)
+        
+        if mode == 'exact':
+            # Every pair above the minimum threshold, assigned in descending score order
+            youth_index, job_index, scores = collect_candidates(youth_arrays, job_arrays, MATCH_THRESHOLD)
+            return greedy_assignment(youth_index, job_index, scores, len(youth_list), len(job_list), accept)
+        
+        if mode == 'indexed':
+            # Same assignment as exact, scoring only region/skill buckets that can clear the threshold
+            return indexed_greedy_assignment(
+                youth_arrays, job_arrays, accept,
+                threshold=MATCH_THRESHOLD,
+                bucket_size=self.config.get('matching_bucket_size', DEFAULT_BUCKET_SIZE)
+            )
         
-        matches = []
+        if mode == 'sharded':
+            # Greedy matching per region on worker threads, then a global pass over what is left
+            return sharded_greedy_assignment(
+                youth_arrays, job_arrays, accept,
+                threshold=MATCH_THRESHOLD,
+                max_workers=self.config.get('matching_workers')
+            )
         
-        # Calculate match scores for all youth-job pairs
-        match_scores = []
+        if mode == 'optimal':
+            # Largest total match score over the top-k candidate graph, re-solved for youth left unmatched
+            return optimal_assignment(
+                youth_arrays, job_arrays, accept,
+                k=self.config.get('matching_top_k', DEFAULT_TOP_K),
+                axis=self.config.get('matching_top_k_axis', 'youth'),
+                threshold=MATCH_THRESHOLD,
+                max_rounds=self.config.get('matching_max_rounds', DEFAULT_MAX_ROUNDS)
+            )
         
-        for youth in youth_list:
-            for job in job_list:
-                score = self.calculate_match_score(youth, job)
-                if score > 0.3:  # Minimum threshold
-                    match_scores.append((youth, job, score))
+        if mode == 'deferred_acceptance':
+            # Stable matching over the top-k candidate graph: youth prefer pay, employers prefer fit
+            return deferred_acceptance_assignment(
+                youth_arrays, job_arrays, accept, self._pair_salaries(youth_list, job_list),
+                k=self.config.get('matching_top_k', DEFAULT_TOP_K),
+                axis=self.config.get('matching_top_k_axis', 'youth'),
+                threshold=MATCH_THRESHOLD,
+                max_rounds=self.config.get('matching_max_rounds', DEFAULT_MAX_ROUNDS)
+            )
         
-        # Sort by match score (highest first)
-        match_scores.sort(key=lambda x: x[2], reverse=True)
+        if mode == 'top_k':
+            # Only the best candidates per youth (or per job), assigned from a lazy priority queue
+            return pruned_greedy_assignment(
+                youth_arrays, job_arrays, accept,
+                k=self.config.get('matching_top_k', DEFAULT_TOP_K),
+                axis=self.config.get('matching_top_k_axis', 'youth'),
+                threshold=MATCH_THRESHOLD,
+                max_rounds=self.config.get('matching_max_rounds', DEFAULT_MAX_ROUNDS)
+            )
         
-        # Assign jobs (each youth and job can only be matched once)
-        assigned_youth = set()
-        assigned_jobs = set()
+        raise ValueError(f"Unknown matching mode: {mode}")
+    
+    def compare_matching_modes(self, youth_list: List[YouthAgent], job_list: List[Dict[str, Any]]) -> Dict[str, float]:
+        """Compare the configured matching mode against exact greedy matching
+        
+        Both assignments are run without the random hiring check so that the
+        difference reflects candidate pruning only.
+        """
+        
+        accept_all = lambda y, j, score: True
+        exact = self._assign_jobs(youth_list, job_list, accept_all, 'exact')
+        pruned = self._assign_jobs(youth_list, job_list, accept_all, self.config.get('matching_mode', 'exact'))
+        
+        # Score only the assigned pairs, not the full youth x jobs matrix
+        pairs = sorted(set(exact) | set(pruned))
+        pair_index = np.array(pairs, dtype=np.intp).reshape(-1, 2)
+        scores = match_score_pairs(self._youth_match_arrays(youth_list), self._job_match_arrays(job_list),
+                                   pair_index[:, 0], pair_index[:, 1])
+        pair_scores = dict(zip(pairs, scores.tolist()))
+        
+        return assignment_gap(exact, pruned, pair_scores)
+    
+    def calculate_match_scores(self, youth_list: List[YouthAgent], job_list: List[Dict[str, Any]]) -> np.ndarray:
+        """Calculate the (youth x jobs) match score matrix in one vectorized pass"""
+        
+        return match_score_matrix(self._youth_match_arrays(youth_list), self._job_match_arrays(job_list))
+    
+    def _youth_match_arrays(self, youth_list: List[YouthAgent]) -> YouthMatchArrays:
+        """Pack youth attributes used by the match score into arrays"""
+        
+        index = self.population.index_of(youth_list)
+        if index is not None:
+            # Fast path: slice the population columns directly
+            population = self.population
+            status = population.employment_status[index]
+            return YouthMatchArrays(
+                skills=population.skills[index],
+                region=population.region[index],
+                is_dhaka=population.region[index] == REGION_CODES[Region.DHAKA],
+                english_proficiency=population.english_proficiency[index],
+                ai_collaboration=population.skills[index, SKILL_INDEX['human_ai_collaboration']].astype(float),
+                has_experience=population.has_experience[index] |
+                               (status != STATUS_CODES['unemployed_seeking']),
+                cultural_constraints=population.cultural_constraints[index]
+            )
         
-        for youth, job, score in match_scores:
-            if youth.id not in assigned_youth and id(job) not in assigned_jobs:
-                # Additional probability check based on market conditions
-                hiring_prob = self.calculate_hiring_probability(youth, job, score)
-                
-                if np.random.random() < hiring_prob:
-                    matches.append((youth, job))
-                    assigned_youth.add(youth.id)
-                    assigned_jobs.add(id(job))
+        skills = np.zeros((len(youth_list), len(SKILL_NAMES)))
+        for row, youth in enumerate(youth_list):
+            for skill, col in SKILL_INDEX.items():
+                skills[row, col] = max(
+                    youth.traditional_skills.get(skill, 0),
+                    youth.ai_enhanced_skills.get(skill, 0)
+                )
+        
+        return YouthMatchArrays(
+            skills=skills,
+            region=np.array([REGION_CODES[y.region] for y in youth_list]),
+            is_dhaka=np.array([y.region == Region.DHAKA for y in youth_list]),
+            english_proficiency=np.array([y.english_proficiency for y in youth_list], dtype=float),
+            ai_collaboration=np.array([y.ai_enhanced_skills.get('human_ai_collaboration', 0) for y in youth_list], dtype=float),
+            has_experience=np.array([
+                y.has_experience or y.employment_status != 'unemployed_seeking'
+                for y in youth_list
+            ]),
+            cultural_constraints=np.array([y.cultural_constraints for y in youth_list], dtype=float)
+        )
+    
+    def _job_match_arrays(self, job_list: List[Dict[str, Any]]) -> JobMatchArrays:
+        """Pack job attributes used by the match score into arrays"""
+        
+        if isinstance(job_list, JobTable):
+            # Fast path: gather the sparse employer requirement rows for every job
+            employers = job_list.employers
+            employer_index = job_list.employer_index
+            region = job_list.region
+            return JobMatchArrays(
+                req_index=employers.req_index[employer_index],
+                req_value=employers.req_value[employer_index],
+                req_valid=np.ones((len(employer_index), employers.req_index.shape[1]), dtype=bool),
+                region=region,
+                accepts_dhaka_mobility=np.isin(region, [REGION_CODES[Region.CHITTAGONG], REGION_CODES[Region.SYLHET]]),
+                remote_work=job_list.remote_work,
+                international=job_list.employer_type == EMPLOYER_TYPES.index('international'),
+                ai_collaboration_required=job_list.ai_collaboration_required,
+                experience_required=job_list.experience_required
+            )
         
-        return matches
+        max_requirements = max((len(job['skill_requirements']) for job in job_list), default=0)
+        req_index = np.zeros((len(job_list), max_requirements), dtype=np.intp)
+        req_value = np.ones((len(job_list), max_requirements))
+        req_valid = np.zeros((len(job_list), max_requirements), dtype=bool)
+        
+        for row, job in enumerate(job_list):
+            for slot, (skill, required_level) in enumerate(job['skill_requirements'].items()):
+                req_index[row, slot] = SKILL_INDEX[skill]
+                req_value[row, slot] = required_level
+                req_valid[row, slot] = True
+        
+        return JobMatchArrays(
+            req_index=req_index,
+            req_value=req_value,
+            req_valid=req_valid,
+            region=np.array([REGION_CODES[job['region']] for job in job_list]),
+            accepts_dhaka_mobility=np.array([job['region'] in [Region.CHITTAGONG, Region.SYLHET] for job in job_list]),
+            remote_work=np.array([job['remote_work'] for job in job_list], dtype=bool),
+            international=np.array([job['employer_type'] == 'international' for job in job_list]),
+            ai_collaboration_required=np.array([job['ai_collaboration_required'] for job in job_list], dtype=bool),
+            experience_required=np.array([job['experience_required'] for job in job_list], dtype=bool)
+        )
     
     def calculate_match_score(self, youth: YouthAgent, job: Dict[str, Any]) -> float:
         """Calculate match score between youth and job"""
@@ -902,14 +2086,12 @@ class SimulationEngine:
         skill_match = 0.0
         total_requirements = 0
         
-        for skill, required_level in job['skill_requirements'].items():
+        skill_levels = self._youth_skill_levels(youth)
+        for col, required_level in zip(*self._job_requirements(job)):
             total_requirements += 1
             
-            # Check both traditional and AI-enhanced skills
-            youth_skill_level = max(
-                youth.traditional_skills.get(skill, 0),
-                youth.ai_enhanced_skills.get(skill, 0)
-            )
+            # Best of traditional and AI-enhanced level
+            youth_skill_level = skill_levels[col]
             
             if youth_skill_level >= required_level:
                 skill_match += 1.0
@@ -942,7 +2124,7 @@ class SimulationEngine:
         # Experience factor (5% weight)
         if job['experience_required']:
             # Check employment history
-            has_experience = len(youth.employment_history) > 0 or youth.employment_status != 'unemployed_seeking'
+            has_experience = youth.has_experience or youth.employment_status != 'unemployed_seeking'
             score += 0.05 if has_experience else 0.02
         else:
             score += 0.05
@@ -955,37 +2137,60 @@ class SimulationEngine:
         
         return np.clip(score, 0, 1)
     
-    def calculate_hiring_probability(self, youth: YouthAgent, job: Dict[str, Any], match_score: float) -> float:
+    def calculate_hiring_probability(self, youth: YouthAgent, job: Dict[str, Any], match_score: float,
+                                     rng: Optional[np.random.Generator] = None) -> float:
         """Calculate probability of actual hiring given match score"""
         
+        rng = rng or self.rng
         base_prob = match_score * 0.8  # Base probability from match score
         
         # Market conditions adjustment
-        skill_shortage = 0
-        for skill in job['skill_requirements']:
-            if skill in self.ai_skills_demand:
-                skill_shortage += self.ai_skills_demand[skill]['skill_shortage_index']
-        
         if len(job['skill_requirements']) > 0:
-            avg_shortage = skill_shortage / len(job['skill_requirements'])
+            avg_shortage = self._skill_shortage(job)
             base_prob += avg_shortage * 0.2  # Higher shortage increases hiring probability
         
         # Competition factor (simplified)
-        competition_factor = np.random.uniform(0.7, 1.0)
+        competition_factor = rng.uniform(0.7, 1.0)
         base_prob *= competition_factor
         
         return np.clip(base_prob, 0.1, 0.9)
     
-    def assign_job(self, youth: YouthAgent, job: Dict[str, Any]):
+    def _skill_shortage(self, job: Dict[str, Any]) -> float:
+        """Average shortage index of a job's required skills, precomputed for our employers"""
+        
+        employer = self._job_employer(job)
+        if employer >= 0:
+            return self.employer_skill_shortage[employer]
+        
+        skill_shortage = 0
+        for skill in job['skill_requirements']:
+            if skill in self.ai_skills_demand:
+                skill_shortage += self.ai_skills_demand[skill]['skill_shortage_index']
+        return skill_shortage / len(job['skill_requirements']) if job['skill_requirements'] else 0.0
+    
+    def _job_skill_shortage(self, job_list: List[Dict[str, Any]]) -> np.ndarray:
+        """Average skill shortage of every job in a list"""
+        
+        if isinstance(job_list, JobTable) and job_list.employers is self.employers:
+            return self.employer_skill_shortage[job_list.employer_index]
+        return np.array([self._skill_shortage(job) for job in job_list], dtype=float)
+    
+    def assign_job(self, youth: YouthAgent, job: Dict[str, Any], salary: Optional[float] = None):
         """Assign job to youth and update their status"""
         
         # Calculate salary based on skills and negotiation
-        salary = self.calculate_job_salary(youth, job)
+        if salary is None:
+            salary = self.calculate_job_salary(youth, job)
         
         # Update youth employment status
+        old_status, old_income = youth.employment_status, youth.monthly_income
         youth.employment_status = 'employed_formal' if job['employer_type'] in ['enterprise', 'international'] else 'employed_informal'
         youth.monthly_income = salary
         
+        if self.totals.tracks(youth):
+            self.totals.status_changed(old_status, youth.employment_status)
+            self.totals.income_changed(old_income, youth.monthly_income)
+        
         # Record employment event
         youth.employment_history.append({
             'month': self.current_month,
@@ -1000,6 +2205,13 @@ class SimulationEngine:
         # Update income history
         youth.income_history.append(salary)
         
+        # Update the derived current-job columns
+        if self.totals.tracks(youth):
+            youth.has_experience = True
+            youth.job_ai_collaboration = bool(job['ai_collaboration_required'])
+            youth.current_employer = self.employers.index_of(job['employer_id'])
+            youth.job_start_month = self.current_month
+        
         # Improve social network and motivation
         youth.social_network_strength = min(youth.social_network_strength + 0.1, 1.0)
         youth.motivation_level = min(youth.motivation_level + 0.05, 1.0)
@@ -1011,21 +2223,22 @@ class SimulationEngine:
         
         # Skill premium
         skill_premium = 0
-        for skill, required_level in job['skill_requirements'].items():
-            youth_skill = max(
-                youth.traditional_skills.get(skill, 0),
-                youth.ai_enhanced_skills.get(skill, 0)
-            )
+        skill_levels = self._youth_skill_levels(youth)
+        for col, required_level in zip(*self._job_requirements(job)):
+            youth_skill = skill_levels[col]
             if youth_skill > required_level:
                 skill_premium += (youth_skill - required_level) * 0.1
         
         # AI skills premium
-        ai_skills_avg = np.mean(list(youth.ai_enhanced_skills.values()))
+        if self.totals.tracks(youth):
+            ai_skills_avg = np.mean(self.population.skills[youth._index, len(TRADITIONAL_SKILLS):], dtype=np.float64)
+        else:
+            ai_skills_avg = np.mean(list(youth.ai_enhanced_skills.values()))
         if ai_skills_avg > 0.6:
             skill_premium += 0.15
         
         # Experience premium
-        if len(youth.employment_history) > 0:
+        if youth.has_experience:
             skill_premium += 0.05
         
         # Negotiation factor based on social network and motivation
@@ -1035,50 +2248,182 @@ class SimulationEngine:
         
         return np.clip(final_salary, job['salary_min'], job['salary_max'] * 1.2)
     
-    def update_agent_states(self):
-        """Update agent states for the current month"""
+    def calculate_job_salaries(self, matches: List[Tuple[YouthAgent, Dict[str, Any]]]) -> np.ndarray:
+        """Calculate the salaries of a list of (youth, job) matches in one array pass
+        
+        Matches of population youth to jobs of our employers are priced by
+        the compiled salary kernel (or its NumPy equivalent); any others go
+        through calculate_job_salary one by one.
+        """
+        
+        if not matches:
+            return np.empty(0)
+        
+        rows = np.array([youth._index if self.totals.tracks(youth) else -1 for youth, _ in matches])
+        employer = np.array([self._job_employer(job) for _, job in matches])
+        if (rows < 0).any() or (employer < 0).any():
+            return np.array([self.calculate_job_salary(youth, job) for youth, job in matches], dtype=float)
+        
+        salary_min = np.array([job['salary_min'] for _, job in matches], dtype=float)
+        salary_max = np.array([job['salary_max'] for _, job in matches], dtype=float)
+        return self._salaries(rows, employer, salary_min, salary_max)
+    
+    def _pair_salaries(self, youth_list: List[YouthAgent],
+                       job_list: List[Dict[str, Any]]) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+        """Salary function for (youth, job) index pairs into the two lists"""
+        
+        rows = self.population.index_of(youth_list)
+        if rows is not None and isinstance(job_list, JobTable) and job_list.employers is self.employers:
+            def salary(youth_index: np.ndarray, job_index: np.ndarray) -> np.ndarray:
+                employer = job_list.employer_index[job_index]
+                return self._salaries(rows[youth_index], employer, self.employers.salary_min[employer].astype(float),
+                                      self.employers.salary_max[employer].astype(float))
+            return salary
+        
+        return lambda youth_index, job_index: self.calculate_job_salaries(
+            [(youth_list[y], job_list[j]) for y, j in zip(youth_index.tolist(), job_index.tolist())]
+        )
+    
+    def _salaries(self, rows: np.ndarray, employer: np.ndarray, salary_min: np.ndarray,
+                  salary_max: np.ndarray) -> np.ndarray:
+        """Salaries of population rows hired into jobs of the given employer rows"""
+        
+        population, employers = self.population, self.employers
+        skills = population.skills[rows]
+        req_index, req_value = employers.req_index[employer], employers.req_value[employer]
+        has_experience = population.has_experience[rows]
+        social, motivation = population.social_network_strength[rows], population.motivation_level[rows]
         
-        for youth in self.youth_agents:
+        if HAVE_NUMBA:
+            return job_salary_kernel(skills, AI_SKILL_COLUMNS, req_index, req_value, salary_min, salary_max,
+                                     has_experience, social, motivation, np.empty(len(rows)))
+        
+        base_salary = (salary_min + salary_max) / 2
+        
+        # Skill premium
+        skill_premium = np.zeros(len(rows))
+        for slot in range(req_index.shape[1]):
+            youth_skill = np.take_along_axis(skills, req_index[:, slot:slot + 1], axis=1)[:, 0].astype(np.float64)
+            skill_premium += np.where(youth_skill > req_value[:, slot], (youth_skill - req_value[:, slot]) * 0.1, 0.0)
+        
+        # AI skills premium (first value plus the sum of the rest, as np.mean adds them)
+        ai_skills = skills[:, AI_SKILL_COLUMNS].astype(np.float64)
+        ai_rest = np.zeros(len(rows))
+        for col in range(1, ai_skills.shape[1]):
+            ai_rest += ai_skills[:, col]
+        skill_premium += np.where((ai_skills[:, 0] + ai_rest) / ai_skills.shape[1] > 0.6, 0.15, 0.0)
+        
+        # Experience premium
+        skill_premium += np.where(has_experience, 0.05, 0.0)
+        
+        # Negotiation factor based on social network and motivation
+        negotiation_factor = (social + motivation) / 2
+        
+        final_salary = base_salary * (1 + skill_premium) * (0.9 + negotiation_factor * 0.2)
+        return np.clip(final_salary, salary_min, salary_max * 1.2)
+    
+    def _youth_skill_levels(self, youth) -> List[float]:
+        """One youth's skill levels in SKILL_NAMES order, the best of traditional and AI level"""
+        
+        if self.totals.tracks(youth):
+            return self.population.skills[youth._index].tolist()
+        return [max(youth.traditional_skills.get(skill, 0), youth.ai_enhanced_skills.get(skill, 0))
+                for skill in SKILL_NAMES]
+    
+    def _job_employer(self, job: Dict[str, Any]) -> int:
+        """Employer row of a job posted by one of our employers, -1 otherwise"""
+        return self.employers.index_of(job['employer_id']) if 'employer_id' in job else -1
+    
+    def _job_requirements(self, job: Dict[str, Any]) -> Tuple[List[int], List[float]]:
+        """Required skill columns and levels of a job, in requirement order"""
+        
+        employer = self._job_employer(job)
+        if employer >= 0:
+            return self.employers.req_index[employer].tolist(), self.employers.req_value[employer].tolist()
+        requirements = job['skill_requirements']
+        return [SKILL_INDEX[skill] for skill in requirements], list(requirements.values())
+    
+    def update_agent_states(self):
+        """Update agent states for the current month
+        
+        Financial resources, traditional skill decay, AI skill growth for
+        agents employed in AI-collaborating jobs and motivation are updated
+        together in one pass over the population columns (the compiled
+        agent state kernel, or the NumPy equivalent). Results, including the
+        float32 rounding of every skill write and the running AI skill
+        total, are identical to updating one agent at a time; the
+        traditional skill total is recounted from the decayed columns.
+        """
+        
+        population = self.population
+        n_traditional = len(TRADITIONAL_SKILLS)
+        
+        if HAVE_NUMBA:
+            self.totals.ai_skill_sum = agent_state_kernel(
+                population.financial_resources, population.monthly_income, population.debt_burden,
+                population.skills, n_traditional, population.employment_status,
+                STATUS_CODES['employed_formal'], STATUS_CODES['employed_informal'],
+                STATUS_CODES['unemployed_seeking'], population.job_ai_collaboration, population.motivation_level,
+                self.totals.ai_skill_sum
+            )
+        else:
             # Update financial resources
-            youth.financial_resources += youth.monthly_income - youth.debt_burden * 0.1
+            population.financial_resources += population.monthly_income - population.debt_burden * 0.1
             
             # Skill decay for unused skills (very small)
-            for skill in youth.traditional_skills:
-                youth.traditional_skills[skill] *= 0.999
+            population.skills[:, :n_traditional] = population.skills[:, :n_traditional].astype(np.float64) * 0.999
             
             # AI skills improvement through usage (if employed in AI-related work)
-            if youth.employment_status in ['employed_formal', 'employed_informal']:
-                recent_job = youth.employment_history[-1] if youth.employment_history else None
-                if recent_job and recent_job.get('ai_collaboration', False):
-                    for skill in youth.ai_enhanced_skills:
-                        youth.ai_enhanced_skills[skill] = min(youth.ai_enhanced_skills[skill] + 0.01, 1.0)
+            employed = population.status_mask('employed_formal', 'employed_informal')
+            rows = np.flatnonzero(employed & population.job_ai_collaboration)
+            old_skills = population.skills[rows, n_traditional:]
+            population.skills[rows, n_traditional:] = np.minimum(old_skills.astype(np.float64) + 0.01, 1.0)
+            gains = (population.skills[rows, n_traditional:].astype(np.float64) - old_skills).sum(axis=1)
+            
+            # Running total gains are added agent by agent, in order
+            self.totals.ai_skill_sum = float(np.add.accumulate(np.concatenate(([self.totals.ai_skill_sum], gains)))[-1])
             
             # Update motivation based on employment status
-            if youth.employment_status in ['employed_formal', 'employed_informal']:
-                youth.motivation_level = min(youth.motivation_level + 0.02, 1.0)
-            elif youth.employment_status == 'unemployed_seeking':
-                youth.motivation_level = max(youth.motivation_level - 0.01, 0.1)
+            motivation = population.motivation_level
+            motivation[employed] = np.minimum(motivation[employed] + 0.02, 1.0)
+            seeking = population.employment_status == STATUS_CODES['unemployed_seeking']
+            motivation[seeking] = np.maximum(motivation[seeking] - 0.01, 0.1)
+        
+        self.totals.traditional_skills_rescaled()
+    
+    def _skill_row(self, youth) -> Optional[np.ndarray]:
+        """Copy of a tracked youth's skill row, or None for agents outside the population"""
+        return self.population.skills[youth._index].copy() if self.totals.tracks(youth) else None
     
     def calculate_monthly_metrics(self):
-        """Calculate and store monthly performance metrics"""
+        """Calculate and store monthly performance metrics
+        
+        Metrics are read from the running totals maintained by the agent
+        update hooks. Setting 'incremental_metrics' to False recomputes the
+        totals from the population columns every month instead.
+        """
+        
+        totals = self.totals
+        if not self.config.get('incremental_metrics', True):
+            totals.refresh()
         
         # Employment metrics
-        total_youth = len(self.youth_agents)
-        employed = len([y for y in self.youth_agents if y.employment_status in ['employed_formal', 'employed_informal']])
-        unemployed = len([y for y in self.youth_agents if y.employment_status == 'unemployed_seeking'])
-        underemployed = len([y for y in self.youth_agents if y.employment_status == 'underemployed'])
+        total_youth = len(self.population)
+        employed = totals.count('employed_formal', 'employed_informal')
+        unemployed = totals.count('unemployed_seeking')
+        underemployed = totals.count('underemployed')
         
         # Income metrics
-        total_income = sum(y.monthly_income for y in self.youth_agents)
+        total_income = totals.total_income
         avg_income = total_income / total_youth if total_youth > 0 else 0
         
         # Training metrics
-        in_training = len([y for y in self.youth_agents if y.program_participation])
-        completed_training = len([y for y in self.youth_agents if y.training_completion_rate >= 0.8])
+        in_training = totals.in_training
+        completed_training = totals.completed_training
         
         # Skills metrics
-        avg_ai_skills = np.mean([np.mean(list(y.ai_enhanced_skills.values())) for y in self.youth_agents])
-        avg_traditional_skills = np.mean([np.mean(list(y.traditional_skills.values())) for y in self.youth_agents])
+        avg_ai_skills = totals.ai_skill_sum / (total_youth * len(AI_SKILLS))
+        avg_traditional_skills = totals.traditional_skill_sum / (total_youth * len(TRADITIONAL_SKILLS))
         
         # Economic impact
         monthly_economic_impact = total_income * self.economic_multipliers['total_multiplier']
@@ -1101,8 +2446,8 @@ class SimulationEngine:
     
     def get_employment_rate(self) -> float:
         """Get current employment rate"""
-        total = len(self.youth_agents)
-        employed = len([y for y in self.youth_agents if y.employment_status in ['employed_formal', 'employed_informal']])
+        total = len(self.population)
+        employed = self.totals.count('employed_formal', 'employed_informal')
         return (employed / total) * 100 if total > 0 else 0
     
     def generate_results(self) -> Dict[str, Any]:
@@ -1121,21 +2466,23 @@ class SimulationEngine:
         # Economic impact calculation
         total_economic_impact = sum(m['economic_impact'] for m in self.monthly_metrics)
         
+        population = self.population
+        employed_mask = population.status_mask('employed_formal', 'employed_informal')
+        
         # Training effectiveness
         total_trained = sum(m['completed_training'] for m in self.monthly_metrics)
         training_employment_rate = 0
         if total_trained > 0:
-            trained_youth = [y for y in self.youth_agents if y.training_completion_rate >= 0.8]
-            employed_trained = [y for y in trained_youth if y.employment_status in ['employed_formal', 'employed_informal']]
-            training_employment_rate = (len(employed_trained) / len(trained_youth)) * 100
+            trained_mask = population.training_completion_rate >= 0.8
+            training_employment_rate = ((trained_mask & employed_mask).sum() / trained_mask.sum()) * 100
         
         # Gender analysis
-        male_employment = len([y for y in self.youth_agents if y.gender == 'male' and 
-                             y.employment_status in ['employed_formal', 'employed_informal']])
-        female_employment = len([y for y in self.youth_agents if y.gender == 'female' and 
-                               y.employment_status in ['employed_formal', 'employed_informal']])
-        total_male = len([y for y in self.youth_agents if y.gender == 'male'])
-        total_female = len([y for y in self.youth_agents if y.gender == 'female'])
+        male_mask = population.gender == GENDERS.index('male')
+        female_mask = population.gender == GENDERS.index('female')
+        male_employment = int((male_mask & employed_mask).sum())
+        female_employment = int((female_mask & employed_mask).sum())
+        total_male = int(male_mask.sum())
+        total_female = int(female_mask.sum())
         
         male_employment_rate = (male_employment / total_male) * 100 if total_male > 0 else 0
         female_employment_rate = (female_employment / total_female) * 100 if total_female > 0 else 0
@@ -1143,18 +2490,19 @@ class SimulationEngine:
         # Regional analysis
         regional_results = {}
         for region in Region:
-            region_youth = [y for y in self.youth_agents if y.region == region]
-            region_employed = [y for y in region_youth if y.employment_status in ['employed_formal', 'employed_informal']]
+            region_mask = population.region == REGION_CODES[region]
+            region_total = int(region_mask.sum())
+            region_employed = int((region_mask & employed_mask).sum())
             regional_results[region.value] = {
-                'total_youth': len(region_youth),
-                'employed': len(region_employed),
-                'employment_rate': (len(region_employed) / len(region_youth)) * 100 if region_youth else 0,
-                'avg_income': np.mean([y.monthly_income for y in region_youth]) if region_youth else 0
+                'total_youth': region_total,
+                'employed': region_employed,
+                'employment_rate': (region_employed / region_total) * 100 if region_total else 0,
+                'avg_income': float(population.monthly_income[region_mask].mean()) if region_total else 0
             }
         
         results = {
             'simulation_months': self.max_months,
-            'total_youth_agents': len(self.youth_agents),
+            'total_youth_agents': len(self.population),
             'final_employment_rate': final_metrics.get('employment_rate', 0),
             'employment_rate_improvement': employment_improvement,
             'average_income_increase': income_improvement,
@@ -1172,89 +2520,322 @@ class SimulationEngine:
         
         return results
     
-    def generate_visualizations(self, results: Dict[str, Any]):
-        """Generate visualization plots for simulation results"""
-        
-        # Set up the plotting style
-        plt.style.use('seaborn-v0_8')
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        fig.suptitle('Bangladesh Youth Employment Simulation Results', fontsize=16, fontweight='bold')
-        
-        # 1. Employment Rate Over Time
-        months = [m['month'] for m in results['monthly_metrics']]
-        employment_rates = [m['employment_rate'] for m in results['monthly_metrics']]
-        
-        axes[0, 0].plot(months, employment_rates, linewidth=2, color='#2E8B57')
-        axes[0, 0].set_title('Employment Rate Over Time')
-        axes[0, 0].set_xlabel('Month')
-        axes[0, 0].set_ylabel('Employment Rate (%)')
-        axes[0, 0].grid(True, alpha=0.3)
-        
-        # 2. Average Income Progression
-        avg_incomes = [m['average_income'] for m in results['monthly_metrics']]
-        
-        axes[0, 1].plot(months, avg_incomes, linewidth=2, color='#4169E1')
-        axes[0, 1].set_title('Average Monthly Income Progression')
-        axes[0, 1].set_xlabel('Month')
-        axes[0, 1].set_ylabel('Average Income (BDT)')
-        axes[0, 1].grid(True, alpha=0.3)
-        
-        # 3. Training Participation and Completion
-        in_training = [m['in_training'] for m in results['monthly_metrics']]
-        completed_training = [m['completed_training'] for m in results['monthly_metrics']]
-        
-        axes[0, 2].plot(months, in_training, label='In Training', linewidth=2, color='#FF6347')
-        axes[0, 2].plot(months, completed_training, label='Completed Training', linewidth=2, color='#32CD32')
-        axes[0, 2].set_title('Training Participation')
-        axes[0, 2].set_xlabel('Month')
-        axes[0, 2].set_ylabel('Number of Youth')
-        axes[0, 2].legend()
-        axes[0, 2].grid(True, alpha=0.3)
-        
-        # 4. Skills Development
-        ai_skills = [m['avg_ai_skills'] for m in results['monthly_metrics']]
-        traditional_skills = [m['avg_traditional_skills'] for m in results['monthly_metrics']]
-        
-        axes[1, 0].plot(months, ai_skills, label='AI-Enhanced Skills', linewidth=2, color='#9370DB')
-        axes[1, 0].plot(months, traditional_skills, label='Traditional Skills', linewidth=2, color='#CD853F')
-        axes[1, 0].set_title('Skills Development Over Time')
-        axes[1, 0].set_xlabel('Month')
-        axes[1, 0].set_ylabel('Average Skill Level (0-1)')
-        axes[1, 0].legend()
-        axes[1, 0].grid(True, alpha=0.3)
-        
-        # 5. Regional Employment Comparison
-        regions = list(results['regional_results'].keys())
-        regional_rates = [results['regional_results'][r]['employment_rate'] for r in regions]
-        
-        bars = axes[1, 1].bar(regions, regional_rates, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'])
-        axes[1, 1].set_title('Final Employment Rate by Region')
-        axes[1, 1].set_ylabel('Employment Rate (%)')
-        axes[1, 1].tick_params(axis='x', rotation=45)
-        
-        # Add value labels on bars
-        for bar, rate in zip(bars, regional_rates):
-            axes[1, 1].text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
-                           f'{rate:.1f}%', ha='center', va='bottom')
-        
-        # 6. Gender Employment Comparison
-        gender_data = ['Male', 'Female']
-        gender_rates = [results['male_employment_rate'], results['female_employment_rate']]
-        
-        bars = axes[1, 2].bar(gender_data, gender_rates, color=['#87CEEB', '#FFB6C1'])
-        axes[1, 2].set_title('Employment Rate by Gender')
-        axes[1, 2].set_ylabel('Employment Rate (%)')
-        
-        # Add value labels on bars
-        for bar, rate in zip(bars, gender_rates):
-            axes[1, 2].text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
-                           f'{rate:.1f}%', ha='center', va='bottom')
-        
-        plt.tight_layout()
-        plt.savefig('simulation_results.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        return fig
+    def save_results(self, results: Dict[str, Any], path: str = 'simulation_results', format: str = DEFAULT_FORMAT) -> str:
+        """Save results and the youth population's end state to the directory ``path``
+        
+        Monthly metrics and per-agent columns are written as compressed
+        Parquet (or NPZ) tables next to a summary.json of the headline
+        results; see the results_store module for loading them back.
+        """
+        
+        return save_results(results, path, agents=self.population.end_state(), format=format)
+    
+    def generate_visualizations(self, results: Dict[str, Any], output: Any = 'simulation_results.png',
+                                dpi: int = DEFAULT_DPI, show: bool = False, background: bool = False):
+        """Generate visualization plots for simulation results
+        
+        The figure is rendered on an Agg canvas by the visualization module
+        and written to ``output`` (a path or a binary buffer), which is
+        returned. With background=True rendering runs on a background
+        thread and a Future for ``output`` is returned instead. show=True
+        also displays the figure through pyplot and blocks until the window
+        is closed; it is ignored under the 'headless' config (default: the
+        SIMULATION_HEADLESS=1 environment variable).
+        """
+        
+        headless = self.config.get('headless', os.environ.get('SIMULATION_HEADLESS') == '1')
+        if show and not headless:
+            import matplotlib.pyplot as plt
+            
+            plt.style.use(PLOT_STYLE)
+            fig, axes = plt.subplots(2, 3, figsize=FIGURE_SIZE)
+            plot_results(fig, axes, results)
+            plt.tight_layout()
+            fig.savefig(output, dpi=dpi, bbox_inches='tight')
+            plt.show()
+            plt.close(fig)
+            return output
+        
+        if background:
+            return render_results_async(plot_data(results), output, dpi)
+        return render_results(results, output, dpi)
+
+# Parallel Batch Runner
+@dataclass
+class BatchRunResult:
+    """Outcome of one simulation run in a batch"""
+    name: str
+    seed: int
+    results: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    agents: Optional[Dict[str, np.ndarray]] = None  # per-agent end state, if requested
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_batch_simulation(name: str, config: Dict[str, Any], seed: int, quiet: bool = True,
+                          reducer: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                          agents: bool = False) -> BatchRunResult:
+    """Run one simulation of a batch with its own seed (executed in a worker process)"""
+    
+    start = time.time()
+    
+    try:
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            engine = SimulationEngine({**config, 'seed': seed})
+            results = engine.run_simulation()
+        if reducer is not None:
+            results = reducer(results)
+        return BatchRunResult(name, seed, results=results, elapsed=time.time() - start,
+                              agents=engine.population.end_state() if agents else None)
+    except Exception:
+        return BatchRunResult(name, seed, error=traceback.format_exc(), elapsed=time.time() - start)
+
+
+def _run_branch(name: str, checkpoint_path: str, overrides: Dict[str, Any], seed: int, quiet: bool = True,
+                reducer: Optional[Callable[[Dict[str, Any]], Any]] = None, agents: bool = False) -> BatchRunResult:
+    """Run one branch from the shared prefix checkpoint to the end (executed in a worker process)"""
+    
+    start = time.time()
+    
+    try:
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            engine = SimulationEngine.from_checkpoint(checkpoint_path, mmap=True, config_overrides=overrides)
+            results = engine.run_simulation()
+        if reducer is not None:
+            results = reducer(results)
+        return BatchRunResult(name, seed, results=results, elapsed=time.time() - start,
+                              agents=engine.population.end_state() if agents else None)
+    except Exception:
+        return BatchRunResult(name, seed, error=traceback.format_exc(), elapsed=time.time() - start)
+
+
+def _run_isolated(worker: Callable[..., BatchRunResult], name: str, seed: int, args: tuple) -> BatchRunResult:
+    """Re-run one task alone in a fresh process after its pool broke"""
+    
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(worker, *args).result()
+        except BrokenProcessPool as e:
+            return BatchRunResult(name, seed, error=f"Worker process died: {e}")
+
+
+def _fan_out(worker: Callable[..., BatchRunResult], tasks: List[Tuple[str, int, tuple]], max_workers: Optional[int]):
+    """Run worker(*args) for each (name, seed, args) task in worker processes, yielding results as they finish
+    
+    max_workers=0 runs the tasks in-process one after another. If a worker
+    process dies, the tasks it took down are retried alone so only the
+    culprit fails.
+    """
+    
+    if max_workers == 0:
+        for name, seed, args in tasks:
+            yield worker(*args)
+        return
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    queue = list(tasks)
+    
+    while queue:
+        broken = []
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            # Keep at most max_workers tasks in flight so a broken pool only affects those
+            in_flight = {}
+            while queue or in_flight:
+                while queue and len(in_flight) < max_workers:
+                    task = queue.pop(0)
+                    in_flight[pool.submit(worker, *task[2])] = task
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = in_flight.pop(future)
+                    try:
+                        yield future.result()
+                    except BrokenProcessPool:
+                        broken.append(task)
+                
+                if broken:
+                    broken.extend(in_flight.values())
+                    break
+        
+        for name, seed, args in broken:
+            yield _run_isolated(worker, name, seed, args)
+
+
+def batch_seeds(names: List[str], base_seed: int = 42) -> Dict[str, int]:
+    """Derive one deterministic seed per run from a base seed"""
+    
+    children = np.random.SeedSequence(base_seed).spawn(len(names))
+    return {name: int(child.generate_state(1)[0]) for name, child in zip(names, children)}
+
+
+def run_simulation_batch(configs: Dict[str, Dict[str, Any]], max_workers: Optional[int] = None,
+                         base_seed: int = 42, quiet: bool = True,
+                         reducer: Optional[Callable[[Dict[str, Any]], Any]] = None, agents: bool = False):
+    """Run independent simulations in parallel, yielding each BatchRunResult as it finishes
+    
+    Configs are fanned out over a ProcessPoolExecutor with max_workers
+    processes (default: all cores; 0 runs in-process one after another).
+    Every run gets a deterministic seed derived from base_seed, unless its
+    config sets 'seed'. A failing run yields a result with its traceback in
+    ``error``; if a worker process dies, the runs it took down are retried
+    alone so only the culprit fails. An optional picklable ``reducer`` is
+    applied to each run's results inside the worker, so only what it
+    returns is sent back. With agents=True each result also carries the
+    run's per-agent end state (YouthPopulation.end_state) in ``agents``.
+    """
+    
+    seeds = batch_seeds(list(configs), base_seed)
+    seeds.update({name: config['seed'] for name, config in configs.items() if 'seed' in config})
+    
+    tasks = [(name, seeds[name], (name, config, seeds[name], quiet, reducer, agents))
+             for name, config in configs.items()]
+    yield from _fan_out(_run_batch_simulation, tasks, max_workers)
+
+
+def run_branches(base_config: Dict[str, Any], branches: Dict[str, Dict[str, Any]], branch_month: int = 0,
+                 max_workers: Optional[int] = None, base_seed: int = 42, quiet: bool = True,
+                 reducer: Optional[Callable[[Dict[str, Any]], Any]] = None, agents: bool = False):
+    """Run scenario branches that share a warm-up, yielding each BatchRunResult as it finishes
+    
+    One engine is built from base_config and simulated for the first
+    branch_month months. Its state is checkpointed once, and every branch
+    is restored from that checkpoint (memory-mapped, so worker processes
+    share its pages until they write to them), has its overrides merged
+    into the config and runs the remaining months. The total cost is one
+    prefix plus one suffix per branch instead of one full run per branch.
+    
+    Every branch continues the prefix's random stream (seeded from
+    base_config's 'seed', else base_seed), so branches differ only through
+    their overrides. Workers, errors, the reducer and agents behave as in
+    run_simulation_batch. branch_month must lie within base_config's
+    simulation months.
+    """
+    
+    horizon = base_config.get('simulation_months', 36)
+    if not 0 <= branch_month <= horizon:
+        raise ValueError(f"branch_month must be between 0 and simulation_months ({horizon}), got {branch_month}")
+    
+    seed = base_config.get('seed', base_seed)
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            engine = SimulationEngine({**base_config, 'seed': seed})
+            for month in range(branch_month):
+                engine.run_month(month)
+        checkpoint_path = engine.save_checkpoint(os.path.join(workdir, 'prefix'))
+        del engine
+        
+        tasks = [(name, seed, (name, checkpoint_path, overrides, seed, quiet, reducer, agents))
+                 for name, overrides in branches.items()]
+        yield from _fan_out(_run_branch, tasks, max_workers)
+
+
+# Monte Carlo Replication
+class RunningStatistics:
+    """Streaming mean and variance accumulator (Welford's algorithm)
+    
+    Works on scalars or fixed-shape arrays, e.g. a monthly time series.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def add(self, value):
+        """Add one observation"""
+        value = np.asarray(value, dtype=float)
+        self.count += 1
+        delta = value - self.mean
+        self.mean = self.mean + delta / self.count
+        self._m2 = self._m2 + delta * (value - self.mean)
+    
+    @property
+    def variance(self):
+        """Sample variance of the observations"""
+        return self._m2 / (self.count - 1) if self.count > 1 else np.zeros_like(self.mean)
+    
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+    
+    def confidence_interval(self, confidence: float = 0.95) -> Tuple[Any, Any]:
+        """Student-t confidence interval for the mean"""
+        
+        from scipy import stats
+        
+        if self.count < 2:
+            return self.mean, self.mean
+        half_width = stats.t.ppf((1 + confidence) / 2, self.count - 1) * self.std / np.sqrt(self.count)
+        return self.mean - half_width, self.mean + half_width
+    
+    def summary(self, confidence: float = 0.95) -> Dict[str, Any]:
+        """Mean, standard deviation and confidence interval as plain values"""
+        
+        ci_low, ci_high = self.confidence_interval(confidence)
+        to_plain = lambda value: np.asarray(value).tolist()
+        return {
+            'n': self.count,
+            'mean': to_plain(self.mean),
+            'std': to_plain(self.std),
+            'ci_low': to_plain(ci_low),
+            'ci_high': to_plain(ci_high)
+        }
+
+
+def extract_replication_metrics(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce one run's results to the metrics aggregated across replications"""
+    
+    metrics = {
+        'final_employment_rate': results['final_employment_rate'],
+        'employment_rate_improvement': results['employment_rate_improvement'],
+        'average_income_increase': results['average_income_increase'],
+        'total_economic_impact': results['total_economic_impact'],
+        'training_employment_rate': results['training_employment_rate'],
+        'male_employment_rate': results['male_employment_rate'],
+        'female_employment_rate': results['female_employment_rate'],
+        'gender_gap': results['gender_gap'],
+        'monthly_employment_rate': [m['employment_rate'] for m in results['monthly_metrics']]
+    }
+    for region, regional in results['regional_results'].items():
+        metrics[f'{region}_employment_rate'] = regional['employment_rate']
+    
+    return metrics
+
+
+def run_replications(config: Dict[str, Any], n_replications: int = 100, max_workers: Optional[int] = None,
+                     base_seed: int = 42, confidence: float = 0.95) -> Dict[str, Any]:
+    """Run independent Monte Carlo replications of one config and summarize them
+    
+    Every replication gets its own seed and runs through the parallel batch
+    runner. Worker processes reduce their results to scalar metrics, which are
+    folded into running accumulators as they arrive, so per-run results are
+    never held in memory together.
+    """
+    
+    configs = {f'replication_{i:04d}': config for i in range(n_replications)}
+    accumulators: Dict[str, RunningStatistics] = {}
+    failures = []
+    
+    for run in run_simulation_batch(configs, max_workers=max_workers, base_seed=base_seed,
+                                    reducer=extract_replication_metrics):
+        if not run.ok:
+            failures.append(run.name)
+            continue
+        for name, value in run.results.items():
+            accumulators.setdefault(name, RunningStatistics()).add(value)
+    
+    return {
+        'n_replications': n_replications,
+        'failed_replications': failures,
+        'confidence': confidence,
+        'metrics': {name: stats.summary(confidence) for name, stats in accumulators.items()}
+    }
+
 
 # Example usage and configuration
 def run_simulation_example():
@@ -1273,12 +2854,12 @@ def run_simulation_example():
     sim = SimulationEngine(config)
     results = sim.run_simulation()
     
-    # Generate visualizations
-    sim.generate_visualizations(results)
+    # Generate visualizations in the background while the results are saved
+    rendering = sim.generate_visualizations(results, 'simulation_results.png', background=True)
     
     # Save results
-    with open('simulation_results.json', 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    sim.save_results(results, 'simulation_results')
+    rendering.result()
     
     return results
 
@@ -1294,10 +2875,16 @@ def run_simulation_example():
     return results
 
 # Scenario Testing Functions
-def run_scenario_analysis():
-    """Run multiple scenarios for comparison"""
+def run_scenario_analysis(max_workers: Optional[int] = None, scenarios: Optional[Dict[str, Dict[str, Any]]] = None,
+                          output_dir: str = '.'):
+    """Run multiple scenarios for comparison (in parallel worker processes)
     
-    scenarios = {
+    Each scenario's results, per-agent end states included, and figure are
+    saved under output_dir. ``scenarios`` replaces the default
+    conservative, optimistic and crisis configs.
+    """
+    
+    scenarios = scenarios or {
         'conservative': {
             'simulation_months': 36,
             'num_youth_agents': 8000,
@@ -1323,15 +2910,23 @@ def run_scenario_analysis():
     
     scenario_results = {}
     
-    for scenario_name, config in scenarios.items():
-        print(f"\nRunning {scenario_name} scenario...")
-        sim = SimulationEngine(config)
-        results = sim.run_simulation()
-        scenario_results[scenario_name] = results
+    print(f"\nRunning {len(scenarios)} scenarios...")
+    for run in run_simulation_batch(scenarios, max_workers=max_workers, agents=True):
+        if not run.ok:
+            print(f"  {run.name} scenario failed:\n{run.error}")
+            continue
+        
+        print(f"  {run.name} scenario finished in {run.elapsed:.1f}s "
+              f"({run.results['final_employment_rate']:.1f}% employment)")
+        scenario_results[run.name] = run.results
         
         # Save individual scenario results
-        with open(f'scenario_{scenario_name}_results.json', 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        save_results(run.results, os.path.join(output_dir, f'scenario_{run.name}_results'), agents=run.agents)
+    
+    # Render one figure per scenario in parallel worker processes
+    for name, path in render_many(scenario_results, os.path.join(output_dir, 'scenario_{name}_results.png'),
+                                  max_workers=max_workers):
+        print(f"  {name} scenario figure saved to {path}")
     
     # Compare scenarios
     print("\n=== Scenario Comparison ===")
@@ -1348,18 +2943,29 @@ def run_scenario_analysis():
     for metric_name, metric_key in metrics:
         values = []
         for scenario in ['conservative', 'optimistic', 'crisis']:
+            if scenario not in scenario_results:
+                values.append('n/a')
+                continue
             value = scenario_results[scenario][metric_key]
             if metric_key == 'total_economic_impact':
                 value = value / 1_000_000  # Convert to millions
-            values.append(value)
+            values.append(f"{value:.1f}")
         
-        print(f"{metric_name:<30} {values[0]:<15.1f} {values[1]:<15.1f} {values[2]:<15.1f}")
+        print(f"{metric_name:<30} {values[0]:<15} {values[1]:<15} {values[2]:<15}")
     
     return scenario_results
 
 # Policy Impact Testing
-def test_policy_interventions():
-    """Test different policy intervention scenarios"""
+def test_policy_interventions(max_workers: Optional[int] = None, branch_month: int = 0):
+    """Test different policy intervention scenarios (in parallel worker processes)
+    
+    The baseline population is generated once and every intervention
+    branches off that shared state. By default the interventions apply
+    from month 0, for the whole run. A later branch_month shares that many
+    months of baseline warm-up, so the interventions only start at
+    branch_month; a 'baseline' branch without overrides is then run too,
+    as the comparison for the shortened treatments.
+    """
     
     base_config = {
         'simulation_months': 36,
@@ -1371,34 +2977,40 @@ def test_policy_interventions():
     
     interventions = {
         'increased_capacity': {
-            **base_config,
             'monthly_training_capacity': 1000,
             'intervention': 'doubled_training_capacity'
         },
         'enhanced_support': {
-            **base_config,
             'family_support_boost': 0.2,
             'intervention': 'enhanced_family_support'
         },
         'ai_focus': {
-            **base_config,
             'ai_skills_emphasis': 1.5,
             'intervention': 'ai_skills_focus'
         },
         'gender_targeted': {
-            **base_config,
             'female_participation_boost': 0.3,
             'intervention': 'gender_targeted_programs'
         }
     }
     
+    if branch_month > 0:
+        interventions = {'baseline': {}, **interventions}
+    
     intervention_results = {}
     
-    for intervention_name, config in interventions.items():
-        print(f"\nTesting {intervention_name} intervention...")
-        sim = SimulationEngine(config)
-        results = sim.run_simulation()
-        intervention_results[intervention_name] = results
+    print(f"\nTesting {len(interventions)} interventions, applied from month {branch_month} "
+          f"of {base_config['simulation_months']}...")
+    for run in run_branches(base_config, interventions, branch_month=branch_month, max_workers=max_workers,
+                            agents=True):
+        if not run.ok:
+            print(f"  {run.name} intervention failed:\n{run.error}")
+            continue
+        
+        print(f"  {run.name} intervention finished in {run.elapsed:.1f}s "
+              f"({run.results['final_employment_rate']:.1f}% employment)")
+        intervention_results[run.name] = run.results
+        save_results(run.results, f'intervention_{run.name}_results', agents=run.agents)
     
     return intervention_results
 
@@ -1421,11 +3033,11 @@ if __name__ == "__main__":
     # Generate comprehensive report
     print("\n4. Generating comprehensive analysis report...")
     
-    # Save all results
+    # Save a summary of all results; monthly metrics are in each run's tables
     comprehensive_results = {
-        'basic_simulation': basic_results,
-        'scenario_analysis': scenario_results,
-        'policy_interventions': intervention_results,
+        'basic_simulation': results_summary(basic_results),
+        'scenario_analysis': {name: results_summary(results) for name, results in scenario_results.items()},
+        'policy_interventions': {name: results_summary(results) for name, results in intervention_results.items()},
         'metadata': {
             'simulation_date': datetime.now().isoformat(),
             'framework_version': '1.0',
@@ -1438,9 +3050,10 @@ if __name__ == "__main__":
     
     print("\n=== Simulation Framework Complete ===")
     print("Results saved to:")
-    print("- simulation_results.json (basic simulation)")
-    print("- scenario_*_results.json (individual scenarios)")
-    print("- comprehensive_simulation_results.json (all results)")
+    print("- simulation_results/ (basic simulation)")
+    print("- scenario_*_results/ (individual scenarios)")
+    print("- intervention_*_results/ (policy interventions)")
+    print("- comprehensive_simulation_results.json (summary of all results)")
     print("- simulation_results.png (visualizations)")
     
     print("\nFramework ready for policy analysis and decision support!")
\ No newline at end of file
@@ -9,12 +9,15 @@ Usage: python test_simulation.py
 """
 
 import sys
-import json
 import time
 from datetime import datetime
 
 try:
-    from simulation_framework import SimulationEngine, run_simulation_example
+    from simulation_framework import (
+        SimulationEngine, run_simulation_example, run_scenario_analysis, run_simulation_batch, run_branches, run_replications,
+        RunningStatistics, YouthPopulation, Region,
+        SKILL_NAMES, SKILL_INDEX, STATUS_CODES, TRADITIONAL_SKILLS
+    )
     import numpy as np
     import pandas as pd
 except ImportError as e:
@@ -165,7 +168,7 @@ def test_data_consistency():
     
     test_config = {
         'simulation_months': 6,
-        'num_youth_agents': 100,
+        'num_youth_agents': 2000,  # Large enough for a stable gender share
         'num_employer_agents': 20,
         'monthly_training_capacity': 10,
         'scenario': 'test'
@@ -300,6 +303,1284 @@ def test_job_matching():
         print(f"✗ Job matching test failed: {e}")
         return False
 
+def test_columnar_population():
+    """Test the columnar youth population and its YouthAgent views"""
+    print("\nTesting columnar youth population...")
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 100,
+        'num_employer_agents': 10,
+        'monthly_training_capacity': 5,
+        'scenario': 'test'
+    }
+    
+    try:
+        sim = SimulationEngine(test_config)
+        population = sim.population
+        
+        # Skills are one dense float32 matrix, categories are small integer codes
+        assert population.skills.shape == (100, len(SKILL_NAMES)), "Skill matrix has wrong shape"
+        assert population.skills.dtype == np.float32, "Skill matrix is not float32"
+        assert population.employment_status.dtype == np.int8, "Status column is not int8"
+        
+        # Views read and write through to the columns
+        youth = sim.youth_agents[3]
+        youth.motivation_level = 0.25
+        youth.employment_status = 'underemployed'
+        youth.ai_enhanced_skills['prompt_engineering'] = 0.5
+        assert population.motivation_level[3] == 0.25, "View write not stored in column"
+        assert population.employment_status[3] == STATUS_CODES['underemployed'], "Status write not encoded"
+        assert abs(population.skills[3, SKILL_INDEX['prompt_engineering']] - 0.5) < 1e-6, "Skill write not stored"
+        assert youth.region in list(Region), "Region not decoded to enum"
+        
+        # Round trip through YouthAgent records
+        agent = population.to_agent(3)
+        rebuilt = YouthPopulation.from_agents([population.to_agent(i) for i in range(len(population))])
+        assert rebuilt[3].id == agent.id == youth.id, "Agent ids not preserved"
+        assert np.array_equal(rebuilt.skills, population.skills), "Skills not preserved"
+        
+        bytes_per_agent = population.memory_usage() / len(population)
+        assert bytes_per_agent < 300, f"Columnar storage too large: {bytes_per_agent:.0f} bytes per agent"
+        
+        print(f"✓ Columnar population validated")
+        print(f"  - {bytes_per_agent:.0f} bytes per agent")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Columnar population test failed: {e}")
+        return False
+
+def test_batch_population_generation():
+    """Test that batched population generation follows the target distributions"""
+    print("\nTesting batched population generation...")
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 20000,
+        'num_employer_agents': 10,
+        'monthly_training_capacity': 5,
+        'generation_chunk_size': 7000,
+        'scenario': 'test'
+    }
+    
+    try:
+        start_time = time.time()
+        sim = SimulationEngine(test_config)
+        setup_time = time.time() - start_time
+        population = sim.population
+        
+        # Region shares: 17.3% Dhaka, 9.7% Chittagong, 5.1% Sylhet, 67.9% rural
+        region_shares = np.bincount(population.region, minlength=4) / len(population)
+        assert np.allclose(region_shares, [0.173, 0.097, 0.051, 0.679], atol=0.015), f"Region shares off: {region_shares}"
+        
+        # Unemployed youth have no income, everyone else does
+        unemployed = population.status_mask('unemployed_seeking')
+        assert (population.monthly_income[unemployed] == 0).all(), "Unemployed youth with income"
+        assert (population.monthly_income[~unemployed] > 0).all(), "Employed youth without income"
+        
+        # Values stay in range across chunk boundaries
+        for column in ['english_proficiency', 'digital_literacy', 'ai_familiarity', 'family_support', 'cultural_constraints']:
+            values = getattr(population, column)
+            assert values.min() >= 0 and values.max() <= 1, f"{column} out of range"
+        assert population.skills.min() >= 0 and population.skills.max() <= 1, "Skills out of range"
+        assert population.age.min() >= 25 and population.age.max() <= 35, "Age out of range"
+        assert population.skills[-1].sum() > 0, "Last chunk not generated"
+        
+        print(f"✓ Batched population generation validated")
+        print(f"  - {len(population):,} agents generated in {setup_time:.2f} seconds")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Batched population generation test failed: {e}")
+        return False
+
+def test_job_table_generation():
+    """Test columnar employer and monthly job generation"""
+    print("\nTesting job table generation...")
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 50,
+        'num_employer_agents': 500,
+        'monthly_training_capacity': 5,
+        'scenario': 'test'
+    }
+    
+    try:
+        sim = SimulationEngine(test_config)
+        employers = sim.employers
+        assert len(employers) == len(sim.employer_agents) == 500, "Employer table out of sync"
+        assert (employers.required.sum(axis=1) == 3).all(), "Employers should require three skills"
+        
+        jobs = sim.generate_monthly_jobs()
+        assert len(jobs) == len(jobs.employer_index), "Job table length mismatch"
+        assert (np.diff(jobs.employer_index) >= 0).all(), "Jobs not grouped by employer"
+        
+        # Rows expose the same dict fields as before
+        job = jobs[0]
+        employer = sim.employer_agents[int(jobs.employer_index[0])]
+        expected_keys = {
+            'employer_id', 'employer_type', 'industry', 'region', 'skill_requirements',
+            'salary_min', 'salary_max', 'remote_work', 'ai_collaboration_required',
+            'experience_required', 'certification_required'
+        }
+        assert set(job.keys()) == expected_keys, "Job row fields changed"
+        assert job['employer_id'] == employer.id, "Job row points at wrong employer"
+        assert job['skill_requirements'] == employer.skill_requirements, "Job requirements differ from employer"
+        assert jobs[0] is job, "Job rows should be built once"
+        
+        # Bernoulli flags follow the employer probabilities
+        expected_remote = employers.remote_work_capability[jobs.employer_index].mean()
+        assert abs(jobs.remote_work.mean() - expected_remote) < 0.05, "Remote work flags off"
+        
+        print(f"✓ Job table generation validated")
+        print(f"  - {len(jobs):,} jobs from {len(employers)} employers")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Job table generation test failed: {e}")
+        return False
+
+def test_vectorized_match_scores():
+    """Test that vectorized match scores agree with the scalar match score"""
+    print("\nTesting vectorized match scoring...")
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 200,
+        'num_employer_agents': 30,
+        'monthly_training_capacity': 10,
+        'scenario': 'test'
+    }
+    
+    try:
+        sim = SimulationEngine(test_config)
+        job_list = sim.generate_monthly_jobs()
+        youth_list = sim.youth_agents
+        
+        vectorized = sim.calculate_match_scores(youth_list, job_list)
+        assert vectorized.shape == (len(youth_list), len(job_list)), "Score matrix has wrong shape"
+        
+        reference = np.array([[sim.calculate_match_score(y, job) for job in job_list] for y in youth_list])
+        assert np.allclose(vectorized, reference), "Vectorized scores differ from calculate_match_score"
+        
+        # Matching only pairs each youth and job once
+        matches = sim.perform_job_matching(youth_list, job_list)
+        assert len({y.id for y, job in matches}) == len(matches), "Youth matched more than once"
+        assert len({id(job) for y, job in matches}) == len(matches), "Job matched more than once"
+        
+        print(f"✓ Vectorized match scoring validated")
+        print(f"  - {vectorized.size:,} pairs scored")
+        print(f"  - {len(matches)} matches assigned")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Vectorized match scoring test failed: {e}")
+        return False
+
+def test_requirement_registry():
+    """Test the sparse employer requirements and precomputed skill shortage"""
+    print("\nTesting requirement registry...")
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 100,
+        'num_employer_agents': 50,
+        'monthly_training_capacity': 10,
+        'scenario': 'test'
+    }
+    
+    try:
+        sim = SimulationEngine(test_config)
+        employers = sim.employers
+        job_list = sim.generate_monthly_jobs()
+        
+        # Sparse rows hold the dense requirements in industry order
+        for i, employer in enumerate(sim.employer_agents):
+            assert [SKILL_NAMES[col] for col in employers.req_index[i]] == list(employer.skill_requirements), \
+                "Requirement columns out of industry order"
+            assert np.all(employers.req_value[i] == employers.requirements[i, employers.req_index[i]]), \
+                "Sparse requirement levels differ from the dense matrix"
+        
+        # Precomputed shortage equals the per-skill average over the demand table
+        for i, employer in enumerate(sim.employer_agents):
+            shortages = [sim.ai_skills_demand.get(skill, {}).get('skill_shortage_index', 0)
+                         for skill in employer.skill_requirements]
+            assert np.isclose(sim.employer_skill_shortage[i], np.mean(shortages)), "Wrong employer skill shortage"
+        
+        # Integer-indexed scoring agrees with plain dict records of the same agents
+        youth = sim.youth_agents[0]
+        record = sim.population.to_agent(0)
+        job = job_list[0]
+        detached_job = {**job, 'employer_id': 'external'}
+        assert sim.calculate_match_score(youth, job) == sim.calculate_match_score(record, detached_job), \
+            "Indexed match score differs from dict lookup"
+        assert sim.calculate_job_salary(youth, job) == sim.calculate_job_salary(record, detached_job), \
+            "Indexed salary differs from dict lookup"
+        state = sim.rng.bit_generator.state
+        indexed = sim.calculate_hiring_probability(youth, job, 0.5)
+        sim.rng.bit_generator.state = state
+        assert indexed == sim.calculate_hiring_probability(record, detached_job, 0.5), \
+            "Precomputed shortage changes the hiring probability"
+        
+        # Vectorized scores sum requirements in the same order as the scalar score
+        vectorized = sim.calculate_match_scores(sim.youth_agents, job_list)
+        reference = np.array([[sim.calculate_match_score(y, job) for job in job_list] for y in sim.youth_agents])
+        assert np.array_equal(vectorized, reference), "Vectorized scores not identical to scalar scores"
+        
+        print(f"✓ Requirement registry validated")
+        print(f"  - {len(employers)} employers, {employers.req_index.shape[1]} requirements each")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Requirement registry test failed: {e}")
+        return False
+
+def test_compiled_kernels():
+    """Test that the compiled kernels agree exactly with the NumPy and scalar code"""
+    print("\nTesting compiled kernels...")
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 300,
+        'num_employer_agents': 40,
+        'monthly_training_capacity': 10,
+        'scenario': 'test'
+    }
+    
+    try:
+        from kernels import HAVE_NUMBA
+        from matching import HiringCheck, match_score_block, match_score_block_numpy, collect_candidates, \
+            greedy_assignment
+        
+        sim = SimulationEngine(test_config)
+        job_list = sim.generate_monthly_jobs()
+        youth_list = sim.youth_agents
+        youth_arrays = sim._youth_match_arrays(youth_list)
+        job_arrays = sim._job_match_arrays(job_list)
+        
+        # Match scores
+        assert np.array_equal(match_score_block(youth_arrays, job_arrays),
+                              match_score_block_numpy(youth_arrays, job_arrays)), "Match score kernel differs"
+        
+        # Greedy pass with the hiring check draws the same numbers as the per-pair calls
+        check = HiringCheck(job_shortage=sim._job_skill_shortage(job_list), rng=np.random.default_rng(3))
+        youth_index, job_index, scores = collect_candidates(youth_arrays, job_arrays)
+        compiled = greedy_assignment(youth_index, job_index, scores, len(youth_list), len(job_list), check)
+        reference_rng = np.random.default_rng(3)
+        reference_check = HiringCheck(job_shortage=check.job_shortage, rng=reference_rng)
+        reference = greedy_assignment(youth_index, job_index, scores, len(youth_list), len(job_list),
+                                      lambda y, j, score: reference_check(y, j, score))
+        check.settle()
+        reference_check.settle()
+        assert compiled == reference, "Compiled greedy pass differs from the per-pair pass"
+        assert check.rng.random() == reference_rng.random(), "Compiled greedy pass left the generator elsewhere"
+        
+        # Hiring check against the engine's scalar hiring probability
+        state = sim.rng.bit_generator.state
+        decisions = []
+        for job in job_list:
+            hiring_prob = sim.calculate_hiring_probability(youth_list[0], job, 0.6)
+            decisions.append(sim.rng.random() < hiring_prob)
+        sim.rng.bit_generator.state = state
+        check = HiringCheck(job_shortage=sim._job_skill_shortage(job_list), rng=sim.rng)
+        assert decisions == [check(0, j, 0.6) for j in range(len(job_list))], "Hiring check differs"
+        
+        # Salaries
+        matches = [(youth_list[i], job_list[i % len(job_list)]) for i in range(len(youth_list))]
+        salaries = sim.calculate_job_salaries(matches)
+        assert np.array_equal(salaries, [sim.calculate_job_salary(y, job) for y, job in matches]), \
+            "Salary kernel differs from calculate_job_salary"
+        
+        print(f"✓ Compiled kernels validated ({'numba' if HAVE_NUMBA else 'NumPy fallback'})")
+        print(f"  - {len(compiled)} matches, {len(salaries)} salaries")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Compiled kernels test failed: {e}")
+        return False
+
+def test_top_k_matching():
+    """Test pruned top-k matching against exact greedy matching"""
+    print("\nTesting top-k pruned matching...")
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 300,
+        'num_employer_agents': 40,
+        'monthly_training_capacity': 10,
+        'matching_mode': 'top_k',
+        'matching_top_k': 5,
+        'scenario': 'test'
+    }
+    
+    try:
+        sim = SimulationEngine(test_config)
+        job_list = sim.generate_monthly_jobs()
+        youth_list = [y for y in sim.youth_agents if y.employment_status in ['unemployed_seeking', 'underemployed']]
+        
+        # With unlimited candidates the lazy heap visits pairs in exact greedy order
+        sim.config['matching_top_k'] = len(job_list)
+        state = np.random.get_state()
+        exact = sim._assign_jobs(youth_list, job_list, lambda y, j, s: np.random.random() < 0.5, 'exact')
+        np.random.set_state(state)
+        pruned = sim._assign_jobs(youth_list, job_list, lambda y, j, s: np.random.random() < 0.5, 'top_k')
+        assert exact == pruned, "Unpruned top-k matching differs from exact greedy"
+        
+        # Pruned matching reports its gap to exact greedy, scoring only the assigned pairs
+        from matching import match_score_pairs
+        pairs = np.array(exact + pruned)
+        pair_scores = match_score_pairs(sim._youth_match_arrays(youth_list), sim._job_match_arrays(job_list),
+                                        pairs[:, 0], pairs[:, 1])
+        dense = sim.calculate_match_scores(youth_list, job_list)
+        assert np.array_equal(pair_scores, dense[pairs[:, 0], pairs[:, 1]]), "Pair scores differ from the score matrix"
+        sim.config['matching_top_k'] = 5
+        gap = sim.compare_matching_modes(youth_list, job_list)
+        assert gap['pruned_matches'] <= min(len(youth_list), len(job_list)), "Too many pruned matches"
+        assert gap['score_gap_pct'] < 10, f"Pruned matching too far from exact: {gap['score_gap_pct']:.1f}%"
+        
+        print(f"✓ Top-k matching validated")
+        print(f"  - Exact matches: {gap['exact_matches']}, pruned matches: {gap['pruned_matches']}")
+        print(f"  - Total score gap: {gap['score_gap_pct']:.2f}%")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Top-k matching test failed: {e}")
+        return False
+
+def test_indexed_matching():
+    """Test that bucket-indexed matching reproduces exact greedy matching"""
+    print("\nTesting indexed matching...")
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 400,
+        'num_employer_agents': 40,
+        'monthly_training_capacity': 10,
+        'matching_mode': 'indexed',
+        'matching_bucket_size': 8,
+        'scenario': 'test'
+    }
+    
+    try:
+        sim = SimulationEngine(test_config)
+        job_list = sim.generate_monthly_jobs()
+        youth_list = [y for y in sim.youth_agents if y.employment_status in ['unemployed_seeking', 'underemployed']]
+        
+        # Same pairs offered in the same order, so the same random hiring decisions
+        offers = {}
+        for mode in ['exact', 'indexed']:
+            offers[mode] = []
+            rng = np.random.default_rng(7)
+            def accept(y, j, score, offered=offers[mode]):
+                offered.append((y, j, score))
+                return rng.random() < 0.5
+            offers[mode].append(sim._assign_jobs(youth_list, job_list, accept, mode))
+        assert offers['exact'] == offers['indexed'], "Indexed matching differs from exact greedy"
+        
+        # Bucket bounds are never below the scores of the pairs they cover
+        from matching import build_match_index, match_score_matrix
+        youth_arrays = sim._youth_match_arrays(youth_list)
+        job_arrays = sim._job_match_arrays(job_list)
+        index = build_match_index(youth_arrays, job_arrays, bucket_size=8)
+        bounds = match_score_matrix(index.youth_bounds, index.job_representatives)
+        scores = match_score_matrix(youth_arrays, job_arrays)
+        youth_bucket = np.repeat(np.arange(len(index.youth_starts) - 1), np.diff(index.youth_starts))
+        job_bucket = np.repeat(np.arange(len(index.job_starts) - 1), np.diff(index.job_starts))
+        covering = bounds[np.ix_(youth_bucket, job_bucket)]
+        assert np.all(covering >= scores[np.ix_(index.youth_order, index.job_order)]), "Bucket bound below a pair score"
+        
+        print(f"✓ Indexed matching validated")
+        print(f"  - {len(index.youth_starts) - 1} youth buckets x {len(index.job_starts) - 1} job buckets")
+        print(f"  - {len(offers['exact'][-1])} matches from {len(offers['exact']) - 1} offers")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Indexed matching test failed: {e}")
+        return False
+
+def test_parallel_batch_runner():
+    """Test the process-pool batch runner"""
+    print("\nTesting parallel batch runner...")
+    
+    base_config = {
+        'simulation_months': 3,
+        'num_youth_agents': 200,
+        'num_employer_agents': 20,
+        'monthly_training_capacity': 10,
+        'scenario': 'test'
+    }
+    
+    configs = {
+        'run_a': base_config,
+        'run_b': {**base_config, 'monthly_training_capacity': 30},
+        'broken': {**base_config, 'num_youth_agents': -1}
+    }
+    
+    try:
+        runs = {run.name: run for run in run_simulation_batch(configs, max_workers=2)}
+        assert set(runs) == set(configs), "Not every run reported back"
+        
+        # One failing run does not take down the batch
+        assert not runs['broken'].ok, "Broken config should fail"
+        assert runs['run_a'].ok and runs['run_b'].ok, "Valid runs should succeed"
+        
+        # Seeds are deterministic per run, in or out of worker processes
+        sequential = {run.name: run for run in run_simulation_batch(configs, max_workers=0)}
+        for name in ['run_a', 'run_b']:
+            assert runs[name].seed == sequential[name].seed, "Seeds differ between batches"
+            assert runs[name].results['monthly_metrics'] == sequential[name].results['monthly_metrics'], \
+                "Parallel run not reproducible"
+        
+        print(f"✓ Parallel batch runner validated")
+        print(f"  - {sum(run.ok for run in runs.values())}/{len(runs)} runs succeeded")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Parallel batch runner test failed: {e}")
+        return False
+
+def test_engine_rng():
+    """Test that seeded engines are reproducible across threads"""
+    print("\nTesting per-engine random generators...")
+    
+    config = {
+        'simulation_months': 3,
+        'num_youth_agents': 300,
+        'num_employer_agents': 30,
+        'monthly_training_capacity': 20,
+        'scenario': 'test',
+        'seed': 1234
+    }
+    
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+        
+        sequential = SimulationEngine(config).run_simulation()
+        
+        # Engines running side by side in threads share no random state
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            threaded = list(pool.map(lambda _: SimulationEngine(config).run_simulation(), range(4)))
+        for results in threaded:
+            assert results['monthly_metrics'] == sequential['monthly_metrics'], "Threaded run not reproducible"
+        
+        # Global random state does not leak into seeded engines
+        np.random.seed(0)
+        assert SimulationEngine(config).run_simulation()['monthly_metrics'] == sequential['monthly_metrics'], \
+            "Seeded engine depends on global random state"
+        
+        other = SimulationEngine({**config, 'seed': 4321}).run_simulation()
+        assert other['monthly_metrics'] != sequential['monthly_metrics'], "Different seeds gave identical runs"
+        
+        print(f"✓ Per-engine random generators validated")
+        print(f"  - {len(threaded)} threaded runs identical to the sequential run")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Engine RNG test failed: {e}")
+        return False
+
+def test_incremental_metrics():
+    """Test that running metric totals match a full recount of the population"""
+    print("\nTesting incremental monthly metrics...")
+    
+    config = {
+        'simulation_months': 8,
+        'num_youth_agents': 500,
+        'num_employer_agents': 50,
+        'monthly_training_capacity': 50,
+        'scenario': 'test',
+        'seed': 11
+    }
+    
+    try:
+        incremental = SimulationEngine(config).run_simulation()['monthly_metrics']
+        recounted = SimulationEngine({**config, 'incremental_metrics': False}).run_simulation()['monthly_metrics']
+        
+        for fast, full in zip(incremental, recounted):
+            for key, value in full.items():
+                assert abs(fast[key] - value) <= 1e-6 * max(abs(value), 1), \
+                    f"Month {full['month']} {key}: {fast[key]} != {value}"
+        
+        print(f"✓ Incremental metrics validated")
+        print(f"  - {len(incremental)} months match a full recount")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Incremental metrics test failed: {e}")
+        return False
+
+def _per_agent_training(sim):
+    """Reference training stage built from the per-agent methods"""
+    population = sim.population
+    eligible_youth = population.select(np.flatnonzero(
+        ~population.program_participation &
+        population.status_mask('unemployed_seeking', 'underemployed') &
+        (population.motivation_level > 0.5)
+    ))
+    participants = sim.select_training_participants(eligible_youth, sim.config.get('monthly_training_capacity', 500))
+    for youth in participants:
+        youth.program_participation = True
+        youth.months_in_program = 1
+    sim.totals.in_training += len(participants)
+    for youth in population.select(np.flatnonzero(population.program_participation)):
+        youth.months_in_program += 1
+        sim.update_training_progress(youth)
+
+def test_vectorized_training():
+    """Test the vectorized training stage against the per-agent methods"""
+    print("\nTesting vectorized training stage...")
+    
+    config = {
+        'simulation_months': 10,
+        'num_youth_agents': 600,
+        'num_employer_agents': 40,
+        'monthly_training_capacity': 40,
+        'scenario': 'test',
+        'seed': 5
+    }
+    
+    try:
+        vectorized = SimulationEngine(config)
+        reference = SimulationEngine(config)
+        
+        # Identical candidates tie on priority score; the earlier rows must win
+        for sim in [vectorized, reference]:
+            sim.population.employment_status[:50] = STATUS_CODES['unemployed_seeking']
+            for column in ['motivation_level', 'family_support', 'digital_literacy', 'cultural_constraints']:
+                getattr(sim.population, column)[:50] = 0.6
+            sim.population.gender[:50] = 0
+        
+        reference.process_training_programs = lambda: _per_agent_training(reference)
+        vectorized_results = vectorized.run_simulation()
+        reference_results = reference.run_simulation()
+        
+        fast, slow = vectorized.population, reference.population
+        for column in fast.COLUMNS:
+            assert np.array_equal(getattr(fast, column), getattr(slow, column)), f"Column {column} differs"
+        assert np.array_equal(fast.skills, slow.skills), "Skills differ"
+        for kind in fast.HISTORIES:
+            assert all(fast.history(kind, i) == slow.history(kind, i) for i in range(len(fast))), f"{kind} differs"
+        assert vectorized_results['monthly_metrics'] == reference_results['monthly_metrics'], "Metrics differ"
+        
+        print(f"✓ Vectorized training stage validated")
+        print(f"  - {vectorized_results['total_youth_trained']} completions identical to the per-agent path")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Vectorized training test failed: {e}")
+        return False
+
+def test_event_log_histories():
+    """Test the array-backed event log behind agent histories"""
+    print("\nTesting event log histories...")
+    
+    try:
+        population = YouthPopulation(3, history_limit=2)
+        youth = population[1]
+        jobs = [
+            {'month': month, 'event': 'job_assigned', 'employer_type': 'startup', 'industry': 'marketing',
+             'salary': 20000.0 + month, 'remote_work': month % 2 == 0, 'ai_collaboration': month == 2}
+            for month in range(3)
+        ]
+        for job in jobs:
+            youth.employment_history.append(job)
+            youth.income_history.append(job['salary'])
+        
+        # Only the most recent events survive the per-agent limit, decoded as before
+        assert list(youth.employment_history) == jobs[-2:], "Ring buffer kept the wrong events"
+        assert youth.employment_history[-1] == jobs[-1], "Latest event lookup failed"
+        assert list(youth.income_history) == [20001.0, 20002.0], "Income history not capped"
+        assert len(population[0].employment_history) == 0, "Other agents affected"
+        
+        # Indexed lookups over the whole population
+        assert list(population.recent_job_ai_collaboration()) == [False, True, False], "AI job lookup failed"
+        assert (population.latest_job() >= 0).tolist() == [False, True, False], "Latest job lookup failed"
+        
+        # A capped simulation keeps working and bounds every history
+        config = {
+            'simulation_months': 6,
+            'num_youth_agents': 300,
+            'num_employer_agents': 30,
+            'monthly_training_capacity': 30,
+            'scenario': 'test',
+            'history_limit': 1
+        }
+        sim = SimulationEngine(config)
+        sim.run_simulation()
+        longest = max(len(y.skill_development_history) for y in sim.youth_agents)
+        assert longest <= 1, f"History longer than its limit: {longest}"
+        
+        print(f"✓ Event log histories validated")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Event log test failed: {e}")
+        return False
+
+def test_derived_history_columns():
+    """Test the per-agent columns derived from employment histories"""
+    print("\nTesting derived history columns...")
+    
+    config = {
+        'simulation_months': 8,
+        'num_youth_agents': 400,
+        'num_employer_agents': 40,
+        'monthly_training_capacity': 40,
+        'scenario': 'test',
+        'seed': 21
+    }
+    
+    try:
+        sim = SimulationEngine(config)
+        sim.run_simulation()
+        population = sim.population
+        log = population.events['employment_history']
+        
+        # Columns maintained by the engine agree with the event log
+        assert np.array_equal(population.has_experience, log.count() > 0), "has_experience out of sync"
+        assert np.array_equal(population.job_ai_collaboration, population.recent_job_ai_collaboration()), \
+            "job_ai_collaboration out of sync"
+        
+        hired = np.flatnonzero(population.latest_job() >= 0)
+        assert len(hired) > 0, "No jobs assigned"
+        assert (population.current_employer[hired] >= 0).all(), "Hired youth without an employer"
+        assert np.array_equal(population.job_start_month[hired], log.lookup('month', population.latest_job(hired))), \
+            "Job start month out of sync"
+        assert (population.tenure(sim.current_month, hired) >= 0).all(), "Negative tenure"
+        
+        # Rebuilding from the log gives the same columns (employers are not in the log)
+        has_experience = population.has_experience.copy()
+        job_ai = population.job_ai_collaboration.copy()
+        population.derive_history_columns()
+        assert np.array_equal(population.has_experience, has_experience), "Rebuilt has_experience differs"
+        assert np.array_equal(population.job_ai_collaboration, job_ai), "Rebuilt job_ai_collaboration differs"
+        
+        youth = population[int(hired[0])]
+        employer = sim.employers.employer_id(youth.current_employer)
+        assert employer.startswith('employer_'), "Current employer not an employer row"
+        
+        print(f"✓ Derived history columns validated")
+        print(f"  - {len(hired)} youth with a current job")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Derived history columns test failed: {e}")
+        return False
+
+def test_monte_carlo_replications():
+    """Test Monte Carlo replications with streaming confidence intervals"""
+    print("\nTesting Monte Carlo replications...")
+    
+    config = {
+        'simulation_months': 3,
+        'num_youth_agents': 200,
+        'num_employer_agents': 20,
+        'monthly_training_capacity': 10,
+        'scenario': 'test'
+    }
+    
+    try:
+        # Streaming statistics agree with the batch formulas
+        values = np.random.default_rng(0).normal(50, 5, size=200)
+        stats = RunningStatistics()
+        for value in values:
+            stats.add(value)
+        assert abs(stats.mean - values.mean()) < 1e-9, "Running mean is wrong"
+        assert abs(stats.variance - values.var(ddof=1)) < 1e-9, "Running variance is wrong"
+        low, high = stats.confidence_interval(0.95)
+        assert low < values.mean() < high, "Confidence interval does not contain the mean"
+        
+        summary = run_replications(config, n_replications=6, max_workers=0)
+        metrics = summary['metrics']
+        assert not summary['failed_replications'], "Replications failed"
+        for name in ['final_employment_rate', 'gender_gap', 'total_economic_impact', 'dhaka_employment_rate']:
+            assert metrics[name]['n'] == 6, f"Missing replications for {name}"
+            assert metrics[name]['ci_low'] <= metrics[name]['mean'] <= metrics[name]['ci_high'], \
+                f"Inconsistent interval for {name}"
+        assert len(metrics['monthly_employment_rate']['mean']) == config['simulation_months'], \
+            "Monthly series has the wrong length"
+        
+        # Same base seed gives the same summary
+        assert run_replications(config, n_replications=6, max_workers=0)['metrics'] == metrics, \
+            "Replications not reproducible"
+        
+        rate = metrics['final_employment_rate']
+        print(f"✓ Monte Carlo replications validated")
+        print(f"  - Final employment rate: {rate['mean']:.1f}% (95% CI {rate['ci_low']:.1f}-{rate['ci_high']:.1f})")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Monte Carlo replication test failed: {e}")
+        return False
+
+def test_lazy_imports():
+    """Test that importing the engine and running it leaves the plotting stack unloaded"""
+    print("\nTesting lazy heavy imports...")
+    
+    import os
+    import subprocess
+    import tempfile
+    
+    script = (
+        "import sys, io, contextlib\n"
+        "from simulation_framework import SimulationEngine\n"
+        "print('numba' in sys.modules)\n"
+        "sim = SimulationEngine({'simulation_months': 2, 'num_youth_agents': 100, 'num_employer_agents': 10,\n"
+        "                        'headless': True, 'seed': 1})\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    results = sim.run_simulation()\n"
+        "print(sorted(m for m in ('pandas', 'seaborn', 'matplotlib', 'pyarrow') if m in sys.modules))\n"
+        "sim.generate_visualizations(results)\n"
+        "print('matplotlib.pyplot' in sys.modules)\n"
+    )
+    
+    try:
+        here = os.path.dirname(os.path.abspath(__file__))
+        with tempfile.TemporaryDirectory() as workdir:
+            output = subprocess.run([sys.executable, '-c', script], cwd=workdir, capture_output=True, text=True,
+                                    env={**os.environ, 'PYTHONPATH': here}, check=True).stdout.split('\n')
+            assert output[0] == 'False', "numba imported with the engine instead of on the first kernel call"
+            assert output[1] == '[]', f"Heavy modules loaded by a plain run: {output[1]}"
+            assert output[2] == 'False', "Headless visualization imported pyplot"
+            assert os.path.exists(os.path.join(workdir, 'simulation_results.png')), "Headless figure not saved"
+        
+        print(f"✓ Lazy imports validated")
+        print(f"  - No plotting or pandas modules loaded by engine runs, numba only on first kernel call")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Lazy imports test failed: {e}")
+        return False
+
+def test_visualization_export():
+    """Test rendering figures to buffers, in the background and across worker processes"""
+    print("\nTesting visualization export...")
+    
+    import io
+    import os
+    import tempfile
+    import contextlib
+    
+    test_config = {
+        'simulation_months': 3,
+        'num_youth_agents': 200,
+        'num_employer_agents': 20,
+        'monthly_training_capacity': 10,
+        'seed': 5,
+        'scenario': 'test'
+    }
+    
+    try:
+        from visualization import render_many
+        
+        sim = SimulationEngine(test_config)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = sim.run_simulation()
+        
+        # Buffers receive the encoded image
+        buffer = io.BytesIO()
+        assert sim.generate_visualizations(results, buffer, dpi=50) is buffer, "Buffer not returned"
+        assert buffer.getvalue().startswith(b'\x89PNG'), "Buffer does not hold a PNG image"
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            # Background rendering hands back a future for the output path
+            path = os.path.join(workdir, 'background.svg')
+            rendering = sim.generate_visualizations(results, path, dpi=50, background=True)
+            assert rendering.result(timeout=60) == path and os.path.getsize(path) > 0, "Background render failed"
+            
+            # Many result sets, fed lazily from a generator, rendered by two workers
+            result_sets = ((f'run{i}', results) for i in range(3))
+            rendered = dict(render_many(result_sets, os.path.join(workdir, '{name}.png'), max_workers=2, dpi=50))
+            assert sorted(rendered) == ['run0', 'run1', 'run2'], "Not every result set was rendered"
+            assert all(os.path.getsize(path) > 0 for path in rendered.values()), "Empty figure file"
+        
+        print(f"✓ Visualization export validated")
+        print(f"  - {len(buffer.getvalue()):,} byte PNG buffer, {len(rendered)} figures rendered in parallel")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Visualization export test failed: {e}")
+        return False
+
+def test_results_storage():
+    """Test saving results as columnar tables and reading metrics back across runs"""
+    print("\nTesting columnar results storage...")
+    
+    import io
+    import os
+    import tempfile
+    import contextlib
+    
+    test_config = {
+        'simulation_months': 4,
+        'num_youth_agents': 200,
+        'num_employer_agents': 20,
+        'monthly_training_capacity': 10,
+        'seed': 9,
+        'scenario': 'test'
+    }
+    
+    try:
+        from results_store import HAVE_PYARROW, load_metric, load_results, load_summary, load_table, save_results
+        
+        sim = SimulationEngine(test_config)
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = sim.run_simulation()
+        
+        formats = ['npz'] + (['parquet'] if HAVE_PYARROW else [])
+        with tempfile.TemporaryDirectory() as workdir:
+            for format in formats:
+                path = sim.save_results(results, os.path.join(workdir, format, 'run_0'), format=format)
+                
+                # Results round-trip exactly; the summary leaves the monthly metrics out
+                assert load_results(path) == results, f"{format} results did not round-trip"
+                assert 'monthly_metrics' not in load_summary(path), "Monthly metrics duplicated in summary"
+                
+                agents = load_table(path, 'agents', ['employment_status', 'skill_prompt_engineering'])
+                assert np.array_equal(agents['employment_status'], sim.population.employment_status), "Agent column mismatch"
+                assert np.array_equal(agents['skill_prompt_engineering'],
+                                      sim.population.skills[:, SKILL_INDEX['prompt_engineering']]), "Skill column mismatch"
+            
+            # One metric across several runs, found under a root directory
+            for i in range(1, 4):
+                save_results(results, os.path.join(workdir, 'npz', f'run_{i}'), format='npz')
+            employment = load_metric(os.path.join(workdir, 'npz'), 'employment_rate')
+            expected = [m['employment_rate'] for m in results['monthly_metrics']]
+            assert len(employment) == 4, f"Expected 4 runs, found {len(employment)}"
+            assert all(series.tolist() == expected for series in employment.values()), "Metric series mismatch"
+            
+            # Scenario runs save their per-agent end states from the batch workers
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_scenario_analysis(max_workers=0, scenarios={'test': test_config}, output_dir=workdir)
+            scenario_agents = load_table(os.path.join(workdir, 'scenario_test_results'), 'agents', ['employment_status'])
+            assert np.array_equal(scenario_agents['employment_status'], sim.population.employment_status), \
+                "Scenario run saved without its agent end states"
+        
+        print(f"✓ Results storage validated")
+        print(f"  - Formats round-tripped: {', '.join(formats)}; one metric read from {len(employment)} runs")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Results storage test failed: {e}")
+        return False
+
+def test_checkpoint_resume():
+    """Test that a run resumed from a checkpoint matches an uninterrupted run exactly"""
+    print("\nTesting checkpoint and resume...")
+    
+    import io
+    import os
+    import tempfile
+    import contextlib
+    
+    test_config = {
+        'simulation_months': 7,
+        'num_youth_agents': 1000,
+        'num_employer_agents': 80,
+        'monthly_training_capacity': 50,
+        'history_limit': 2,
+        'seed': 17,
+        'scenario': 'test'
+    }
+    
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            uninterrupted = SimulationEngine(dict(test_config))
+            expected = uninterrupted.run_simulation()
+        expected_arrays, _ = uninterrupted.population.state()
+        
+        with tempfile.TemporaryDirectory() as workdir:
+            with contextlib.redirect_stdout(io.StringIO()):
+                sim = SimulationEngine({**test_config, 'checkpoint_every': 3,
+                                        'checkpoint_path': os.path.join(workdir, 'month_{month}')})
+                sim.run_simulation()
+            assert sorted(os.listdir(workdir)) == ['month_3', 'month_6'], f"Unexpected checkpoints: {os.listdir(workdir)}"
+            
+            for mmap in (False, True):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    resumed = SimulationEngine.from_checkpoint(os.path.join(workdir, 'month_3'), mmap=mmap)
+                    assert resumed.months_completed == 3, "Checkpoint taken at the wrong month"
+                    results = resumed.run_simulation()
+                
+                assert results == expected, f"Resumed results differ (mmap={mmap})"
+                resumed_arrays, _ = resumed.population.state()
+                assert all(np.array_equal(resumed_arrays[name], array) for name, array in expected_arrays.items()), \
+                    f"Resumed population differs (mmap={mmap})"
+        
+        print(f"✓ Checkpoint and resume validated")
+        print(f"  - Runs resumed at month 3 (eager and memory-mapped) match the uninterrupted run")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Checkpoint and resume test failed: {e}")
+        return False
+
+def test_scenario_branching():
+    """Test branches forked from a shared warm-up against full runs"""
+    print("\nTesting scenario branching...")
+    
+    import io
+    import contextlib
+    
+    base_config = {
+        'simulation_months': 6,
+        'num_youth_agents': 800,
+        'num_employer_agents': 60,
+        'monthly_training_capacity': 20,
+        'seed': 23,
+        'scenario': 'test'
+    }
+    branches = {
+        'baseline': {},
+        'extended': {'simulation_months': 9},
+        'broken': {'monthly_training_capacity': 'unlimited'}
+    }
+    
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            full_run = SimulationEngine(dict(base_config)).run_simulation()
+        
+        runs = {run.name: run for run in run_branches(base_config, branches, branch_month=3, max_workers=2)}
+        assert sorted(runs) == sorted(branches), f"Missing branches: {sorted(runs)}"
+        assert not runs['broken'].ok and 'Traceback' in runs['broken'].error, "Failing branch not reported"
+        
+        # A branch without overrides is the uninterrupted run
+        assert runs['baseline'].ok and runs['baseline'].results == full_run, "Baseline branch differs from full run"
+        
+        # Overrides apply from the branch point; a longer run continues the same random stream
+        extended = runs['extended'].results['monthly_metrics']
+        assert len(extended) == 9, f"Extended branch ran {len(extended)} months"
+        assert extended[:6] == full_run['monthly_metrics'], "Extended branch diverged from the shared stream"
+        
+        # Branch points outside the base run's horizon are rejected
+        for branch_month in [-1, base_config['simulation_months'] + 1]:
+            try:
+                list(run_branches(base_config, branches, branch_month=branch_month, max_workers=0))
+            except ValueError:
+                continue
+            raise AssertionError(f"Branch month {branch_month} accepted")
+        
+        print(f"✓ Scenario branching validated")
+        print(f"  - {len(branches)} branches forked at month 3 of {base_config['simulation_months']}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Scenario branching test failed: {e}")
+        return False
+
+def test_agent_state_update():
+    """Test the fused agent state update against the per-agent update it replaces"""
+    print("\nTesting fused agent state update...")
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 3000,
+        'num_employer_agents': 50,
+        'seed': 29,
+        'scenario': 'test'
+    }
+    
+    def prepare(sim):
+        # Every status, AI-collaborating jobs and AI skills close to the cap
+        rng = np.random.default_rng(0)
+        population = sim.population
+        population.employment_status[:] = rng.integers(0, len(STATUS_CODES), len(population))
+        population.job_ai_collaboration[:] = rng.random(len(population)) < 0.5
+        population.skills[:, len(SKILL_NAMES) - 5:] = rng.uniform(0.95, 1.0, (len(population), 5))
+        population.motivation_level[:] = rng.uniform(0.05, 1.0, len(population))
+        sim.totals.refresh()
+    
+    try:
+        sim, reference = SimulationEngine(dict(test_config)), SimulationEngine(dict(test_config))
+        prepare(sim)
+        prepare(reference)
+        
+        for month in range(3):
+            sim.update_agent_states()
+            
+            # Per-agent reference update through the agent views
+            for youth in reference.youth_agents:
+                youth.financial_resources += youth.monthly_income - youth.debt_burden * 0.1
+                for skill in youth.traditional_skills:
+                    youth.traditional_skills[skill] *= 0.999
+                if youth.employment_status in ['employed_formal', 'employed_informal']:
+                    if youth.job_ai_collaboration:
+                        old_skills = reference._skill_row(youth)
+                        for skill in youth.ai_enhanced_skills:
+                            youth.ai_enhanced_skills[skill] = min(youth.ai_enhanced_skills[skill] + 0.01, 1.0)
+                        reference.totals.skills_changed(old_skills, reference._skill_row(youth))
+                    youth.motivation_level = min(youth.motivation_level + 0.02, 1.0)
+                elif youth.employment_status == 'unemployed_seeking':
+                    youth.motivation_level = max(youth.motivation_level - 0.01, 0.1)
+            reference.totals.traditional_skills_rescaled()
+        
+        for name in ['financial_resources', 'motivation_level', 'skills']:
+            assert np.array_equal(getattr(sim.population, name), getattr(reference.population, name)), f"{name} differs"
+        expected_totals = reference.totals.state()
+        assert all(np.array_equal(value, expected_totals[name]) for name, value in sim.totals.state().items()), \
+            "Running totals differ"
+        traditional = sim.population.skills[:, :len(TRADITIONAL_SKILLS)]
+        assert sim.totals.traditional_skill_sum == traditional.sum(dtype=np.float64), \
+            "Traditional skill total drifted from the skill matrix"
+        
+        print(f"✓ Fused agent state update validated")
+        print(f"  - {len(sim.population):,} agents match the per-agent update exactly over 3 months")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Agent state update test failed: {e}")
+        return False
+
+def test_hiring_draw_blocks():
+    """Test that block-drawn hiring checks consume the same random stream as per-pair draws"""
+    print("\nTesting batched hiring draws...")
+    
+    import io
+    import contextlib
+    from matching import HiringCheck
+    from kernels import COMPETITION_LOW, COMPETITION_HIGH, hiring_probability
+    
+    try:
+        # Direct calls against scalar draws from an identical generator
+        rng = np.random.default_rng(4)
+        shortage = rng.random(50)
+        pairs = [(int(rng.integers(50)), float(rng.random())) for _ in range(500)]
+        for block_size in [2, 3, 64, 4096]:
+            check = HiringCheck(job_shortage=shortage, rng=np.random.default_rng(8), block_size=block_size)
+            reference = np.random.default_rng(8)
+            for n, (j, score) in enumerate(pairs):
+                competition_factor = reference.uniform(COMPETITION_LOW, COMPETITION_HIGH)
+                expected = reference.random() < hiring_probability(score, shortage[j], competition_factor)
+                assert check(0, j, score) == expected, f"Decision {n} differs with block size {block_size}"
+                if n % 97 == 0:
+                    check.settle()
+            check.settle()
+            assert check.rng.random() == reference.random(), f"Stream position differs with block size {block_size}"
+        
+        # Whole runs do not depend on the block size in any matching mode
+        for mode in ['exact', 'top_k']:
+            monthly = []
+            for block_size in [2, 5, 4096]:
+                sim = SimulationEngine({'simulation_months': 4, 'num_youth_agents': 1500, 'num_employer_agents': 150,
+                                        'monthly_training_capacity': 50, 'matching_mode': mode,
+                                        'hiring_draw_block': block_size, 'seed': 31})
+                with contextlib.redirect_stdout(io.StringIO()):
+                    monthly.append(sim.run_simulation()['monthly_metrics'])
+            assert all(m == monthly[0] for m in monthly), f"{mode} results depend on the draw block size"
+        
+        print(f"✓ Batched hiring draws validated")
+        print(f"  - Decisions and stream position independent of the block size")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Batched hiring draws test failed: {e}")
+        return False
+
+def test_sharded_matching():
+    """Test region-sharded matching with its global reconciliation pass"""
+    print("\nTesting sharded matching...")
+    
+    from matching import match_score_matrix, region_shards
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 600,
+        'num_employer_agents': 60,
+        'monthly_training_capacity': 10,
+        'matching_mode': 'sharded',
+        'seed': 12
+    }
+    
+    try:
+        sim = SimulationEngine(test_config)
+        job_list = sim.generate_monthly_jobs()
+        youth_list = [y for y in sim.youth_agents if y.employment_status in ['unemployed_seeking', 'underemployed']]
+        
+        # Without the hiring check nothing assignable is left over after reconciliation
+        matches = sim._assign_jobs(youth_list, job_list, lambda y, j, s: True, 'sharded')
+        assert len({y for y, _ in matches}) == len({j for _, j in matches}) == len(matches), "Sharded matching is not one-to-one"
+        scores = sim.calculate_match_scores(youth_list, job_list)
+        open_youth = np.setdiff1d(np.arange(len(youth_list)), [y for y, _ in matches])
+        open_jobs = np.setdiff1d(np.arange(len(job_list)), [j for _, j in matches])
+        assert not (scores[np.ix_(open_youth, open_jobs)] > 0.3).any(), "Assignable pair left after reconciliation"
+        
+        # Remote jobs are only offered in the reconciliation pass
+        job_arrays = sim._job_match_arrays(job_list)
+        shards = region_shards(sim._youth_match_arrays(youth_list), job_arrays)
+        sharded_jobs = np.concatenate([job_rows for _, job_rows in shards])
+        assert not job_arrays.remote_work[sharded_jobs].any(), "Remote job assigned to a region shard"
+        
+        # Hiring checks draw from per-shard streams: same result for any number of workers
+        state = sim.rng.bit_generator.state
+        runs = []
+        for workers in [1, 2, 4]:
+            sim.rng.bit_generator.state = state
+            sim.config['matching_workers'] = workers
+            runs.append((sim.perform_job_matching(youth_list, job_list), sim.rng.random()))
+        assert all(run == runs[0] for run in runs), "Sharded matching depends on the number of workers"
+        
+        # The difference to single-pass greedy is reported
+        sim.config['report_matching_gap'] = True
+        sim.perform_job_matching(youth_list, job_list)
+        gap = sim.matching_reports[-1]
+        assert gap['pruned_matches'] == len(matches), "Gap report does not describe the sharded assignment"
+        
+        print(f"✓ Sharded matching validated")
+        print(f"  - {len(shards)} region shards, {len(matches)} matches")
+        print(f"  - Total score gap vs single-pass greedy: {gap['score_gap_pct']:.2f}% "
+              f"({gap['shared_pairs_pct']:.1f}% identical pairs)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Sharded matching test failed: {e}")
+        return False
+
+def test_optimal_matching():
+    """Test optimal-assignment matching against a dense assignment solver"""
+    print("\nTesting optimal matching...")
+    
+    from scipy.optimize import linear_sum_assignment
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 600,
+        'num_employer_agents': 60,
+        'monthly_training_capacity': 10,
+        'matching_mode': 'optimal',
+        'seed': 12
+    }
+    
+    try:
+        sim = SimulationEngine(test_config)
+        job_list = sim.generate_monthly_jobs()
+        youth_list = [y for y in sim.youth_agents if y.employment_status in ['unemployed_seeking', 'underemployed']]
+        scores = sim.calculate_match_scores(youth_list, job_list)
+        
+        # With every candidate kept, the total score is the optimum over pairs above the threshold
+        sim.config['matching_top_k'] = len(job_list)
+        matches = sim._assign_jobs(youth_list, job_list, lambda y, j, s: True, 'optimal')
+        assert len({y for y, _ in matches}) == len({j for _, j in matches}) == len(matches), "Optimal matching is not one-to-one"
+        weights = np.where(scores > 0.3, scores, 0.0)
+        rows, columns = linear_sum_assignment(weights, maximize=True)
+        best = weights[rows, columns].sum()
+        total = sum(scores[pair] for pair in matches)
+        assert abs(total - best) < 1e-9, f"Total score {total:.4f} below the optimum {best:.4f}"
+        
+        # Welfare against greedy on the pruned candidate graph
+        sim.config['matching_top_k'] = 5
+        gap = sim.compare_matching_modes(youth_list, job_list)
+        greedy = sim._assign_jobs(youth_list, job_list, lambda y, j, s: True, 'top_k')
+        assert gap['pruned_total_score'] >= sum(scores[pair] for pair in greedy) - 1e-9, \
+            "Optimal matching scores below greedy on the same candidates"
+        
+        # Rejected pairs are never offered twice
+        offered = []
+        def accept(y, j, score):
+            offered.append((y, j))
+            return len(offered) % 3 == 0
+        sim._assign_jobs(youth_list, job_list, accept, 'optimal')
+        assert len(offered) == len(set(offered)), "Pair offered twice"
+        
+        print(f"✓ Optimal matching validated")
+        print(f"  - Optimum {best:.2f} over {len(matches)} matches")
+        print(f"  - Total score vs exact greedy: {-gap['score_gap_pct']:+.2f}%")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Optimal matching test failed: {e}")
+        return False
+
+def test_deferred_acceptance_matching():
+    """Test deferred-acceptance matching for stability and youth optimality"""
+    print("\nTesting deferred-acceptance matching...")
+    
+    from matching import collect_candidates, deferred_acceptance
+    
+    test_config = {
+        'simulation_months': 1,
+        'num_youth_agents': 600,
+        'num_employer_agents': 60,
+        'monthly_training_capacity': 10,
+        'matching_mode': 'deferred_acceptance',
+        'seed': 12
+    }
+    
+    try:
+        # Youth 0 and 1 each top-rank the job that prefers the other: youth-proposing keeps their choices
+        held = deferred_acceptance(np.array([0, 0, 1, 1]), np.array([0, 1, 0, 1]),
+                                   youth_value=np.array([2.0, 1.0, 1.0, 2.0]), job_value=np.array([1.0, 2.0, 2.0, 1.0]))
+        assert sorted(held.tolist()) == [0, 3], "Deferred acceptance is not youth-optimal"
+        
+        sim = SimulationEngine(test_config)
+        job_list = sim.generate_monthly_jobs()
+        youth_list = sim.population.select(np.flatnonzero(sim.population.status_mask('unemployed_seeking', 'underemployed')))
+        
+        # With every candidate kept, no youth and job above the threshold both prefer each other to their match
+        sim.config['matching_top_k'] = len(job_list)
+        matches = sim._assign_jobs(youth_list, job_list, lambda y, j, s: True, 'deferred_acceptance')
+        assert len({y for y, _ in matches}) == len({j for _, j in matches}) == len(matches), "Matching is not one-to-one"
+        youth_index, job_index, scores = collect_candidates(sim._youth_match_arrays(youth_list), sim._job_match_arrays(job_list))
+        salaries = sim._pair_salaries(youth_list, job_list)(youth_index, job_index)
+        pair_salary = dict(zip(zip(youth_index.tolist(), job_index.tolist()), salaries.tolist()))
+        pair_score = dict(zip(zip(youth_index.tolist(), job_index.tolist()), scores.tolist()))
+        job_of = dict(matches)
+        youth_of = {j: y for y, j in matches}
+        for y, j in pair_score:
+            if job_of.get(y) == j:
+                continue
+            youth_prefers = y not in job_of or (-pair_salary[y, j], j) < (-pair_salary[y, job_of[y]], job_of[y])
+            job_prefers = j not in youth_of or (-pair_score[y, j], y) < (-pair_score[youth_of[j], j], youth_of[j])
+            assert not (youth_prefers and job_prefers), f"Blocking pair {(y, j)}"
+        
+        # Matched salaries match the salaries paid on hiring
+        paid = sim.calculate_job_salaries([(youth_list[y], job_list[j]) for y, j in matches])
+        assert np.array_equal(paid, [pair_salary[pair] for pair in matches]), "Preference salaries differ from pay"
+        
+        # With the hiring check, rejected pairs are never offered twice
+        sim.config['matching_top_k'] = 5
+        offered = []
+        def accept(y, j, score):
+            offered.append((y, j))
+            return len(offered) % 3 == 0
+        sim._assign_jobs(youth_list, job_list, accept, 'deferred_acceptance')
+        assert len(offered) == len(set(offered)), "Pair offered twice"
+        
+        print(f"✓ Deferred-acceptance matching validated")
+        print(f"  - Stable matching of {len(matches)} pairs over {len(scores)} candidates")
+        print(f"  - Mean salary {np.mean(paid):,.0f} BDT")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Deferred-acceptance matching test failed: {e}")
+        return False
+
 def run_performance_test():
     """Test simulation performance with larger datasets"""
     print("\nRunning performance test...")
@@ -356,6 +1637,31 @@ def main():
         ("Data Consistency", test_data_consistency),
         ("Training System", test_training_system),
         ("Job Matching", test_job_matching),
+        ("Columnar Population", test_columnar_population),
+        ("Batch Generation", test_batch_population_generation),
+        ("Job Table", test_job_table_generation),
+        ("Vectorized Matching", test_vectorized_match_scores),
+        ("Requirement Registry", test_requirement_registry),
+        ("Compiled Kernels", test_compiled_kernels),
+        ("Top-k Matching", test_top_k_matching),
+        ("Indexed Matching", test_indexed_matching),
+        ("Parallel Batch Runner", test_parallel_batch_runner),
+        ("Engine RNG", test_engine_rng),
+        ("Monte Carlo Replications", test_monte_carlo_replications),
+        ("Incremental Metrics", test_incremental_metrics),
+        ("Vectorized Training", test_vectorized_training),
+        ("Event Log Histories", test_event_log_histories),
+        ("Derived History Columns", test_derived_history_columns),
+        ("Lazy Imports", test_lazy_imports),
+        ("Visualization Export", test_visualization_export),
+        ("Results Storage", test_results_storage),
+        ("Checkpoint Resume", test_checkpoint_resume),
+        ("Scenario Branching", test_scenario_branching),
+        ("Agent State Update", test_agent_state_update),
+        ("Hiring Draw Blocks", test_hiring_draw_blocks),
+        ("Sharded Matching", test_sharded_matching),
+        ("Optimal Matching", test_optimal_matching),
+        ("Deferred Acceptance", test_deferred_acceptance_matching),
         ("Performance", run_performance_test)
     ]
     
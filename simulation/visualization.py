@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Results Visualization for the Bangladesh Youth Employment Simulation
+
+Draws the six-panel results figure on standalone Agg canvases, never
+through pyplot, so rendering behaves the same on headless batch workers,
+never blocks and leaves no global figure state behind. Figures go to a
+caller-given path or binary buffer and are released once saved. Rendering
+can run on a background thread (render_results_async) or over a process
+pool for many result sets at once (render_many). matplotlib itself is only
+imported when the first figure is drawn.
+
+Author: AI-Enhanced Employment Framework Team
+Version: 1.0
+Date: 2025
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+# Figure layout and output settings
+PLOT_STYLE = 'seaborn-v0_8'
+FIGURE_SIZE = (18, 12)
+DEFAULT_DPI = 300
+
+# Per-month fields the figure reads from the monthly metrics
+PLOTTED_MONTHLY_METRICS = (
+    'month', 'employment_rate', 'average_income', 'in_training', 'completed_training',
+    'avg_ai_skills', 'avg_traditional_skills'
+)
+
+_background: Optional[ThreadPoolExecutor] = None
+_background_lock = threading.Lock()
+
+
+def plot_data(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce simulation results to the values the figure needs
+
+    Much smaller than the full results, so it is cheap to send to a
+    rendering worker process.
+    """
+
+    return {
+        'monthly_metrics': [{key: m[key] for key in PLOTTED_MONTHLY_METRICS} for m in results['monthly_metrics']],
+        'regional_results': {region: {'employment_rate': regional['employment_rate']}
+                             for region, regional in results['regional_results'].items()},
+        'male_employment_rate': results['male_employment_rate'],
+        'female_employment_rate': results['female_employment_rate']
+    }
+
+
+def plot_results(fig, axes, results: Dict[str, Any]):
+    """Draw the six results panels onto a 2x3 grid of axes"""
+
+    fig.suptitle('Bangladesh Youth Employment Simulation Results', fontsize=16, fontweight='bold')
+
+    # 1. Employment Rate Over Time
+    months = [m['month'] for m in results['monthly_metrics']]
+    employment_rates = [m['employment_rate'] for m in results['monthly_metrics']]
+
+    axes[0, 0].plot(months, employment_rates, linewidth=2, color='#2E8B57')
+    axes[0, 0].set_title('Employment Rate Over Time')
+    axes[0, 0].set_xlabel('Month')
+    axes[0, 0].set_ylabel('Employment Rate (%)')
+    axes[0, 0].grid(True, alpha=0.3)
+
+    # 2. Average Income Progression
+    avg_incomes = [m['average_income'] for m in results['monthly_metrics']]
+
+    axes[0, 1].plot(months, avg_incomes, linewidth=2, color='#4169E1')
+    axes[0, 1].set_title('Average Monthly Income Progression')
+    axes[0, 1].set_xlabel('Month')
+    axes[0, 1].set_ylabel('Average Income (BDT)')
+    axes[0, 1].grid(True, alpha=0.3)
+
+    # 3. Training Participation and Completion
+    in_training = [m['in_training'] for m in results['monthly_metrics']]
+    completed_training = [m['completed_training'] for m in results['monthly_metrics']]
+
+    axes[0, 2].plot(months, in_training, label='In Training', linewidth=2, color='#FF6347')
+    axes[0, 2].plot(months, completed_training, label='Completed Training', linewidth=2, color='#32CD32')
+    axes[0, 2].set_title('Training Participation')
+    axes[0, 2].set_xlabel('Month')
+    axes[0, 2].set_ylabel('Number of Youth')
+    axes[0, 2].legend()
+    axes[0, 2].grid(True, alpha=0.3)
+
+    # 4. Skills Development
+    ai_skills = [m['avg_ai_skills'] for m in results['monthly_metrics']]
+    traditional_skills = [m['avg_traditional_skills'] for m in results['monthly_metrics']]
+
+    axes[1, 0].plot(months, ai_skills, label='AI-Enhanced Skills', linewidth=2, color='#9370DB')
+    axes[1, 0].plot(months, traditional_skills, label='Traditional Skills', linewidth=2, color='#CD853F')
+    axes[1, 0].set_title('Skills Development Over Time')
+    axes[1, 0].set_xlabel('Month')
+    axes[1, 0].set_ylabel('Average Skill Level (0-1)')
+    axes[1, 0].legend()
+    axes[1, 0].grid(True, alpha=0.3)
+
+    # 5. Regional Employment Comparison
+    regions = list(results['regional_results'].keys())
+    regional_rates = [results['regional_results'][r]['employment_rate'] for r in regions]
+
+    bars = axes[1, 1].bar(regions, regional_rates, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'])
+    axes[1, 1].set_title('Final Employment Rate by Region')
+    axes[1, 1].set_ylabel('Employment Rate (%)')
+    axes[1, 1].tick_params(axis='x', rotation=45)
+
+    # Add value labels on bars
+    for bar, rate in zip(bars, regional_rates):
+        axes[1, 1].text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
+                       f'{rate:.1f}%', ha='center', va='bottom')
+
+    # 6. Gender Employment Comparison
+    gender_data = ['Male', 'Female']
+    gender_rates = [results['male_employment_rate'], results['female_employment_rate']]
+
+    bars = axes[1, 2].bar(gender_data, gender_rates, color=['#87CEEB', '#FFB6C1'])
+    axes[1, 2].set_title('Employment Rate by Gender')
+    axes[1, 2].set_ylabel('Employment Rate (%)')
+
+    # Add value labels on bars
+    for bar, rate in zip(bars, gender_rates):
+        axes[1, 2].text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
+                       f'{rate:.1f}%', ha='center', va='bottom')
+
+
+def render_results(results: Dict[str, Any], output: Any, dpi: int = DEFAULT_DPI, format: Optional[str] = None) -> Any:
+    """Render the results figure to a file path or a writable binary buffer
+
+    The format follows the path's extension unless given (PNG for
+    buffers). Returns ``output``.
+    """
+
+    import matplotlib.style
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    with matplotlib.style.context(PLOT_STYLE):
+        fig = Figure(figsize=FIGURE_SIZE)
+        FigureCanvasAgg(fig)
+        try:
+            plot_results(fig, fig.subplots(2, 3), results)
+            fig.tight_layout()
+            fig.savefig(output, dpi=dpi, bbox_inches='tight', format=format)
+        finally:
+            fig.clear()
+
+    return output
+
+
+def render_results_async(results: Dict[str, Any], output: Any, dpi: int = DEFAULT_DPI,
+                         format: Optional[str] = None) -> Future:
+    """Render the results figure on a background thread, returning a Future for ``output``
+
+    Renders run one at a time on a single shared thread, in submission
+    order, so the caller can keep simulating while figures are written.
+    """
+
+    global _background
+    with _background_lock:
+        if _background is None:
+            _background = ThreadPoolExecutor(max_workers=1, thread_name_prefix='render')
+    return _background.submit(render_results, results, output, dpi, format)
+
+
+def _render_to_path(name: str, results: Dict[str, Any], path: str, dpi: int) -> Tuple[str, str]:
+    """Render one named result set to a file (executed in a worker process)"""
+    return name, render_results(results, path, dpi)
+
+
+def render_many(result_sets: Union[Dict[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]],
+                path_template: str = '{name}_results.png', max_workers: Optional[int] = None,
+                dpi: int = DEFAULT_DPI) -> Iterator[Tuple[str, str]]:
+    """Render many named result sets in parallel, yielding (name, path) as each file is written
+
+    Result sets are rendered over a ProcessPoolExecutor with max_workers
+    processes (default: all cores; 0 renders in-process one after another)
+    to ``path_template.format(name=name)``. They are taken from the input
+    lazily and at most max_workers are in flight, so a generator of results
+    is never held in memory all at once, and only plot_data of each set is
+    sent to the workers. A failed render raises its exception here.
+    """
+
+    items = iter(result_sets.items() if isinstance(result_sets, dict) else result_sets)
+
+    if max_workers == 0:
+        for name, results in items:
+            yield _render_to_path(name, plot_data(results), path_template.format(name=name), dpi)
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        in_flight = set()
+        exhausted = False
+        while not exhausted or in_flight:
+            while not exhausted and len(in_flight) < max_workers:
+                item = next(items, None)
+                if item is None:
+                    exhausted = True
+                    break
+                name, results = item
+                in_flight.add(pool.submit(_render_to_path, name, plot_data(results),
+                                          path_template.format(name=name), dpi))
+
+            if not in_flight:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()